@@ -0,0 +1,64 @@
+"""
+Benchmark of peak memory and copy volume of the result evaluation in default and compact mode.
+
+Run as ``python benchmarks/evaluation_memory.py --players 2500 --series 40``.
+"""
+
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import click
+
+from pyskat.backend import Backend
+from pyskat.plugins import evaluate_results
+from pyskat.plugins.profiling import HookProfiler
+
+from synthetic import generate
+
+
+def measure(backend: Backend, compact: bool) -> dict:
+    with backend.get_session() as session:
+        tracemalloc.start()
+        start = time.perf_counter()
+
+        with HookProfiler() as profiler:
+            df = evaluate_results(backend, session, None, use_cache=False, compact=compact)
+
+        wall_time = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return dict(
+        compact=compact,
+        rows=len(df),
+        wall_time=wall_time,
+        peak_memory=peak,
+        frame_memory=int(df.memory_usage(deep=True).sum()),
+        copy_volume=int(profiler.to_frame()["memory"].sum()),
+    )
+
+
+@click.command()
+@click.option("-p", "--players", type=click.INT, default=2500)
+@click.option("-s", "--series", type=click.INT, default=40)
+@click.option("-o", "--output-file", type=click.Path(dir_okay=False, path_type=Path), default=None)
+def main(players: int, series: int, output_file: Path | None):
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = Backend(f"sqlite:///{Path(tmp) / 'benchmark.db'}")
+        generate(backend, players, series)
+
+        measurements = [measure(backend, compact=False), measure(backend, compact=True)]
+        backend.engine.dispose()
+
+    text = json.dumps(measurements, indent=4)
+    click.echo(text)
+
+    if output_file:
+        output_file.write_text(text)
+
+
+if __name__ == "__main__":
+    main()
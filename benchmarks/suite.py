@@ -0,0 +1,177 @@
+"""
+Benchmark suite timing the hot paths of evaluation, table shuffling, report generation and the WUI pages
+on synthetic databases of configurable scale.
+Results are written as JSON, a previous result file may be given to compare against.
+
+Run as ``python benchmarks/suite.py --scale 1000 100 --scale 50000 2000 --players-per-series 48 -o bench.json``.
+"""
+
+import json
+import platform
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+import click
+
+from pyskat.__about__ import VERSION
+from pyskat.backend import Backend
+from pyskat.plugins import evaluate_results, evaluate_results_total, report_standalone
+from pyskat.wui.app import create_app
+
+from synthetic import generate
+
+
+def measure(function: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None) -> dict:
+    """Time a function ``repeat`` times, calling ``setup`` untimed before each run."""
+    times = []
+
+    for _ in range(repeat):
+        if setup:
+            setup()
+
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    return dict(min=min(times), median=statistics.median(times), max=max(times), repeat=repeat)
+
+
+def drop_caches(backend: Backend):
+    with backend.get_session() as session:
+        backend.evaluations(session).clear()
+    backend.result_cache.clear()
+
+
+def run_scale(backend: Backend, repeat: int) -> dict[str, dict]:
+    timings = {}
+
+    with backend.get_session() as session:
+        timings["evaluate_results"] = measure(lambda: evaluate_results(backend, session, None, use_cache=False), repeat)
+
+        results = evaluate_results(backend, session, None, use_cache=False)
+        timings["evaluate_results_total"] = measure(lambda: evaluate_results_total(backend, session, results), repeat)
+
+        timings["report_standalone"] = measure(lambda: report_standalone(backend, session, use_cache=False), repeat)
+
+    app = create_app(backend, Path(tempfile.gettempdir()) / "pyskat-benchmark")
+    app.config["TESTING"] = True
+    client = app.test_client()
+
+    pages = ["/", "/players/", "/series/", "/tables/1", "/tables/check/1", "/results/1"]
+    for page in pages:
+        timings[f"wui {page}"] = measure(lambda: _get(client, page), repeat)
+
+    timings["wui /evaluation/ (cold)"] = measure(
+        lambda: _get(client, "/evaluation/"), repeat, lambda: drop_caches(backend)
+    )
+    timings["wui /evaluation/ (warm)"] = measure(lambda: _get(client, "/evaluation/"), repeat)
+
+    # shuffle last on a series without results, as it replaces tables
+    with backend.get_session() as session:
+        series_id = backend.series(session).add("Shuffle", datetime.now()).id
+        timings["shuffle_players_for_series"] = measure(
+            lambda: backend.tables(session).shuffle_players_for_series(series_id), repeat
+        )
+
+    return timings
+
+
+def _get(client, page: str):
+    response = client.get(page)
+    if response.status_code >= 400:
+        raise RuntimeError(f"Request of {page} failed with status {response.status_code}.")
+
+
+def compare(measurements: dict, baseline: dict):
+    """Print the ratio of median times to a baseline per scale and benchmark."""
+    baseline_scales = {(s["players"], s["series"], s["players_per_series"]): s for s in baseline["scales"]}
+
+    for scale in measurements["scales"]:
+        key = (scale["players"], scale["series"], scale["players_per_series"])
+        if key not in baseline_scales:
+            continue
+
+        click.echo(f"Scale {key} vs. version {baseline['version']}:")
+        for name, timing in scale["timings"].items():
+            base = baseline_scales[key]["timings"].get(name)
+            if base:
+                click.echo(f"    {name:40} {timing['median'] / base['median']:6.2f}x")
+
+
+@click.command()
+@click.option(
+    "--scale",
+    "scales",
+    type=(click.IntRange(min=3), click.IntRange(min=1)),
+    multiple=True,
+    default=[(1000, 100)],
+    help="Count of players and series to benchmark, may be given multiple times.",
+)
+@click.option(
+    "--players-per-series",
+    type=click.IntRange(min=3),
+    default=None,
+    help="Count of players participating in each series, all by default.",
+)
+@click.option("-r", "--repeat", type=click.IntRange(min=1), default=3, help="Count of timed runs per benchmark.")
+@click.option("--seed", type=click.INT, default=0)
+@click.option("-o", "--output-file", type=click.Path(dir_okay=False, path_type=Path), default=None)
+@click.option(
+    "-c",
+    "--compare-to",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Result file of a previous run to compare median times to.",
+)
+def main(
+    scales: list[tuple[int, int]],
+    players_per_series: int | None,
+    repeat: int,
+    seed: int,
+    output_file: Path | None,
+    compare_to: Path | None,
+):
+    measurements = dict(
+        version=VERSION,
+        python=platform.python_version(),
+        platform=platform.platform(),
+        date=datetime.now().isoformat(),
+        scales=[],
+    )
+
+    for players, series in scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = Backend(f"sqlite:///{Path(tmp) / 'benchmark.db'}")
+
+            start = time.perf_counter()
+            result_count = generate(backend, players, series, players_per_series, seed)
+            generation_time = time.perf_counter() - start
+
+            measurements["scales"].append(
+                dict(
+                    players=players,
+                    series=series,
+                    players_per_series=players_per_series,
+                    results=result_count,
+                    generation_time=generation_time,
+                    timings=run_scale(backend, repeat),
+                )
+            )
+            backend.engine.dispose()
+
+    text = json.dumps(measurements, indent=4)
+    click.echo(text)
+
+    if output_file:
+        output_file.write_text(text)
+
+    if compare_to:
+        compare(measurements, json.loads(compare_to.read_text()))
+
+
+if __name__ == "__main__":
+    main()
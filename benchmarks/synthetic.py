@@ -0,0 +1,20 @@
+"""Generation of synthetic tournament databases of configurable scale for benchmarks."""
+
+from pyskat.backend import Backend
+from pyskat.backend.fake_data import generate_fake_data
+
+
+def generate(
+    backend: Backend, player_count: int, series_count: int, players_per_series: int | None = None, seed: int = 0
+) -> int:
+    """
+    Fill a database with random players, series, tables and results using bulk inserts.
+
+    :param players_per_series: count of randomly drawn players participating in each series, all if ``None``
+    :return: the count of generated results
+    """
+    with backend.get_session() as session:
+        result_count = generate_fake_data(session, player_count, series_count, players_per_series, seed)
+        session.commit()
+
+    return result_count
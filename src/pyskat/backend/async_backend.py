@@ -0,0 +1,273 @@
+"""
+Asynchronous variant of the backend for non-blocking servers, built on SQLAlchemy's asyncio extension.
+The async tables run the methods of the synchronous tables on the async session,
+so both share their behavior, while the database I/O is awaited instead of blocking a thread.
+"""
+
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any, Concatenate, Generic, ParamSpec, TypeVar
+
+from sqlalchemy import URL, event, make_url
+from sqlmodel import SQLModel, Session
+
+from .backend import Backend, bump_data_version, create_data_version, create_missing_indexes, read_data_version
+from .lru_cache import LRUCache
+from .player_table import PlayersTable
+from .pool_settings import PoolSettings
+from .results_table import ResultsTable
+from .seat_index import SeatIndexCache
+from .series_table import SeriesTable
+from .sqlite_profile import SQLiteProfile, SQLITE_PROFILES
+from .tables_table import TablesTable
+
+try:
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+except ImportError as e:
+    raise ImportError(
+        "Need the asyncio extension of SQLAlchemy to use the async backend. It may be installed with the [async] extra."
+    ) from e
+
+ASYNC_DRIVERS = dict(sqlite="aiosqlite", postgresql="asyncpg", mysql="aiomysql", mariadb="aiomysql")
+"""Async drivers used for database URLs without explicit driver."""
+
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+
+def async_url(url: str | URL) -> URL:
+    """Get the URL with the async driver of its dialect, URLs with explicit driver are kept as they are."""
+    url = make_url(url)
+
+    if "+" in url.drivername:
+        return url
+
+    dialect = url.get_backend_name()
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver known for {dialect} databases, give one explicitly in the URL.")
+
+    return url.set(drivername=f"{dialect}+{ASYNC_DRIVERS[dialect]}")
+
+
+class AsyncBackend:
+    def __init__(
+        self,
+        connection_string: str,
+        result_cache_size: int = 32,
+        sqlite_profile: SQLiteProfile | str | None = None,
+        pool: PoolSettings | None = None,
+    ):
+        """
+        The database schema is not created on construction, :meth:`initialize` must be awaited before first use.
+
+        :param connection_string: SQLAlchemy database URL, the async driver of the dialect is used if none is given
+        :param result_cache_size: maximum count of evaluation results held in :attr:`result_cache`
+        :param sqlite_profile: pragmas to apply to each SQLite connection, given directly or by name of
+            :data:`SQLITE_PROFILES`, or ``None`` to keep SQLite's defaults
+        :param pool: settings of the connection pool, the dialect's defaults are used if ``None``
+        """
+        if isinstance(sqlite_profile, str):
+            sqlite_profile = SQLITE_PROFILES[sqlite_profile]
+        pool = pool or PoolSettings()
+
+        url = async_url(connection_string)
+
+        try:
+            self.engine = create_async_engine(url, **pool.engine_options(url))
+        except ImportError as e:
+            raise ImportError(
+                f"Need the {url.get_driver_name()} package to use the async backend. "
+                f"For SQLite, it may be installed with the [async] extra."
+            ) from e
+
+        if sqlite_profile is not None:
+            sqlite_profile.apply(self.engine.sync_engine)
+
+        self.sync_backend = Backend.from_engine(self.engine.sync_engine, result_cache_size, sqlite_profile, pool)
+        """
+        Synchronous backend on the engine underlying the async one, sharing the data version and result cache.
+        Only usable within :meth:`run_sync`.
+        """
+
+    async def initialize(self) -> None:
+        """Create the database schema and missing indexes."""
+        async with self.engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+            await connection.run_sync(create_missing_indexes)
+            await connection.run_sync(create_data_version)
+
+    async def dispose(self) -> None:
+        """Close all connections of the engine."""
+        await self.engine.dispose()
+
+    @property
+    def sqlite_profile(self) -> SQLiteProfile | None:
+        return self.sync_backend.sqlite_profile
+
+    @property
+    def pool(self) -> PoolSettings:
+        return self.sync_backend.pool
+
+    async def get_data_version(self) -> int:
+        """Read the counter of committed modifications from the database, see :attr:`Backend.data_version`."""
+        async with self.engine.connect() as connection:
+            return await connection.run_sync(read_data_version)
+
+    @property
+    def result_cache(self) -> LRUCache:
+        """In-process cache of evaluation results, keyed including the data version."""
+        return self.sync_backend.result_cache
+
+    @property
+    def seat_indexes(self) -> SeatIndexCache:
+        """In-process cache of the seat indexes per series, see :attr:`Backend.seat_indexes`."""
+        return self.sync_backend.seat_indexes
+
+    async def bump_data_version(self) -> None:
+        """Increment the data version, invalidating all entries of the :attr:`result_cache`."""
+        async with self.engine.begin() as connection:
+            await connection.run_sync(bump_data_version)
+        self.result_cache.clear()
+
+    def get_session(self) -> AsyncSession:
+        """
+        Get a new async session.
+        Loaded objects are not expired on commit, as attributes can not be lazily refreshed outside of awaits.
+        """
+        session = AsyncSession(self.engine, expire_on_commit=False)
+        event.listen(session.sync_session, "before_commit", self.sync_backend._before_commit)
+        event.listen(session.sync_session, "after_commit", self.sync_backend._after_commit)
+        event.listen(session.sync_session, "after_rollback", self.sync_backend._after_rollback)
+        return session
+
+    async def run_sync(
+        self, session: AsyncSession, function: Callable[Concatenate[Backend, Session, P], R], *args, **kwargs
+    ) -> R:
+        """
+        Run a function taking a synchronous backend and session, like the evaluation functions, on an async session.
+
+        :param session: the async session whose connection to use
+        :param function: called with :attr:`sync_backend`, the synchronous session and the further arguments
+        :return: the return value of the function
+        """
+        return await session.run_sync(lambda s: function(self.sync_backend, s, *args, **kwargs))
+
+    def players(self, session: AsyncSession) -> "AsyncPlayersTable":
+        """Table of players."""
+        return AsyncPlayersTable(self, session)
+
+    def results(self, session: AsyncSession) -> "AsyncResultsTable":
+        """Table of game results."""
+        return AsyncResultsTable(self, session)
+
+    def series(self, session: AsyncSession) -> "AsyncSeriesTable":
+        """Table of game series."""
+        return AsyncSeriesTable(self, session)
+
+    def tables(self, session: AsyncSession) -> "AsyncTablesTable":
+        """Table of series-player-table mappings."""
+        return AsyncTablesTable(self, session)
+
+
+class AsyncTable(Generic[T]):
+    """
+    Base of the async tables, running the methods of a synchronous table on an async session.
+    Relationships of returned objects can only be accessed if they were loaded eagerly.
+    """
+
+    sync_table_type: type[T]
+
+    def __init__(self, backend: AsyncBackend, session: AsyncSession):
+        self._session = session
+        self._backend = backend
+
+    async def run_sync(self, method: Callable[Concatenate[T, P], R], *args, **kwargs) -> R:
+        """Run a method of the synchronous table with the given arguments."""
+        return await self._session.run_sync(
+            lambda s: method(self.sync_table_type(self._backend.sync_backend, s), *args, **kwargs)
+        )
+
+
+def delegate(method: Callable[Concatenate[Any, P], R]) -> Callable[Concatenate[AsyncTable, P], Awaitable[R]]:
+    """Create an async method of an :class:`AsyncTable` awaiting the given method of its synchronous table."""
+
+    @wraps(method)
+    async def wrapper(self: AsyncTable, *args: P.args, **kwargs: P.kwargs) -> R:
+        return await self.run_sync(method, *args, **kwargs)
+
+    return wrapper
+
+
+class AsyncPlayersTable(AsyncTable[PlayersTable]):
+    sync_table_type = PlayersTable
+
+    add = delegate(PlayersTable.add)
+    add_many = delegate(PlayersTable.add_many)
+    update_many = delegate(PlayersTable.update_many)
+    upsert_many = delegate(PlayersTable.upsert_many)
+    update = delegate(PlayersTable.update)
+    remove = delegate(PlayersTable.remove)
+    get = delegate(PlayersTable.get)
+    all = delegate(PlayersTable.all)
+    to_pandas = delegate(PlayersTable.to_pandas)
+
+
+class AsyncSeriesTable(AsyncTable[SeriesTable]):
+    sync_table_type = SeriesTable
+
+    add = delegate(SeriesTable.add)
+    add_many = delegate(SeriesTable.add_many)
+    update_many = delegate(SeriesTable.update_many)
+    upsert_many = delegate(SeriesTable.upsert_many)
+    update = delegate(SeriesTable.update)
+    remove = delegate(SeriesTable.remove)
+    get = delegate(SeriesTable.get)
+    all = delegate(SeriesTable.all)
+    count = delegate(SeriesTable.count)
+    to_pandas = delegate(SeriesTable.to_pandas)
+
+
+class AsyncResultsTable(AsyncTable[ResultsTable]):
+    sync_table_type = ResultsTable
+
+    add = delegate(ResultsTable.add)
+    add_many = delegate(ResultsTable.add_many)
+    update_many = delegate(ResultsTable.update_many)
+    upsert_many = delegate(ResultsTable.upsert_many)
+    update = delegate(ResultsTable.update)
+    remove = delegate(ResultsTable.remove)
+    get = delegate(ResultsTable.get)
+    all = delegate(ResultsTable.all)
+    all_for_series = delegate(ResultsTable.all_for_series)
+    all_with_table_ids = delegate(ResultsTable.all_with_table_ids)
+    to_pandas = delegate(ResultsTable.to_pandas)
+    series_ids = delegate(ResultsTable.series_ids)
+    clear_for_series = delegate(ResultsTable.clear_for_series)
+    get_opponents_lost = delegate(ResultsTable.get_opponents_lost)
+    unseated_player_ids = delegate(ResultsTable.unseated_player_ids)
+
+
+class AsyncTablesTable(AsyncTable[TablesTable]):
+    sync_table_type = TablesTable
+
+    add = delegate(TablesTable.add)
+    add_many = delegate(TablesTable.add_many)
+    update_many = delegate(TablesTable.update_many)
+    upsert_many = delegate(TablesTable.upsert_many)
+    update = delegate(TablesTable.update)
+    remove = delegate(TablesTable.remove)
+    get = delegate(TablesTable.get)
+    all = delegate(TablesTable.all)
+    all_for_series = delegate(TablesTable.all_for_series)
+    to_pandas = delegate(TablesTable.to_pandas)
+    seating = delegate(TablesTable.seating)
+    clear_for_series = delegate(TablesTable.clear_for_series)
+    replace_for_series = delegate(TablesTable.replace_for_series)
+    shuffle_players_for_series = delegate(TablesTable.shuffle_players_for_series)
+    schedule_rounds = delegate(TablesTable.schedule_rounds)
+    seat_index = delegate(TablesTable.seat_index)
+    seat_indexes = delegate(TablesTable.seat_indexes)
+    table_id_of = delegate(TablesTable.table_id_of)
+    get_table_with_player = delegate(TablesTable.get_table_with_player)
@@ -1,39 +1,182 @@
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import Connection, Engine, URL, event, make_url
+from sqlmodel import Session, SQLModel, col, create_engine
 
-from .data_model import Player, Result, Series
+from .data_model import Player, Result, Series, bump_data_version, create_data_version, read_data_version
+from .fake_data import generate_fake_data
+from .evaluations_table import EvaluationsTable, MODIFIED_INFO_KEY
+from .lru_cache import LRUCache
 from .player_table import PlayersTable
 from .results_table import ResultsTable
+from .seat_index import DATA_VERSION_INFO_KEY, SEATING_MODIFIED_INFO_KEY, SeatIndexCache
 from .series_table import SeriesTable
+from .pool_settings import PoolSettings, is_memory_database
+from .sqlite_profile import SQLiteProfile, SQLITE_PROFILES
 from .tables_table import TablesTable
 
 
 class Backend:
-    def __init__(self, connection_string: str):
-        self.engine = create_engine(connection_string)
+    def __init__(
+        self,
+        connection_string: str,
+        result_cache_size: int = 32,
+        sqlite_profile: SQLiteProfile | str | None = None,
+        pool: PoolSettings | None = None,
+    ):
+        """
+        :param connection_string: SQLAlchemy database URL
+        :param result_cache_size: maximum count of evaluation results held in :attr:`result_cache`
+        :param sqlite_profile: pragmas to apply to each SQLite connection, given directly or by name of
+            :data:`SQLITE_PROFILES`, or ``None`` to keep SQLite's defaults
+        :param pool: settings of the connection pool, the dialect's defaults are used if ``None``
+        """
+        self._setup(result_cache_size, sqlite_profile, pool)
+        self.engine = self._create_engine(make_url(connection_string))
+
         SQLModel.metadata.create_all(self.engine)
 
-    @staticmethod
-    def players(session: Session) -> PlayersTable:
+        with self.engine.begin() as connection:
+            create_missing_indexes(connection)
+            create_data_version(connection)
+
+    @classmethod
+    def from_engine(
+        cls,
+        engine: Engine,
+        result_cache_size: int = 32,
+        sqlite_profile: SQLiteProfile | str | None = None,
+        pool: PoolSettings | None = None,
+    ) -> "Backend":
+        """
+        Create a backend on an existing engine, whose schema is expected to be created already.
+        Used by :class:`AsyncBackend` to run synchronous code on the engine underlying its async engine.
+        The ``sqlite_profile`` and ``pool`` settings are only recorded, they are not applied to the engine.
+        """
+        backend = cls.__new__(cls)
+        backend._setup(result_cache_size, sqlite_profile, pool)
+        backend.engine = engine
+        return backend
+
+    def _setup(self, result_cache_size: int, sqlite_profile: SQLiteProfile | str | None, pool: PoolSettings | None):
+        if isinstance(sqlite_profile, str):
+            sqlite_profile = SQLITE_PROFILES[sqlite_profile]
+        self.sqlite_profile = sqlite_profile
+        self.pool = pool or PoolSettings()
+
+        self.result_cache = LRUCache(result_cache_size)
+        """In-process cache of evaluation results, keyed including the :attr:`data_version`."""
+
+        self.seat_indexes = SeatIndexCache()
+        """In-process cache of the seat indexes per series, see :meth:`TablesTable.seat_indexes`."""
+
+    def _create_engine(self, url: URL) -> Engine:
+        engine = create_engine(url, **self.pool.engine_options(url))
+
+        if self.sqlite_profile is not None:
+            self.sqlite_profile.apply(engine)
+
+        return engine
+
+    def configure_pool(self, pool: PoolSettings) -> None:
+        """
+        Replace the engine by one with other pool settings, closing all idle connections of the current one.
+
+        :raises ValueError: if the database is an in-memory SQLite database, which would be lost with the engine
+        """
+        if pool == self.pool:
+            return
+
+        url = self.engine.url
+        if is_memory_database(url):
+            raise ValueError("Pool settings of in-memory SQLite databases can only be given on construction.")
+
+        self.engine.dispose()
+        self.pool = pool
+        self.engine = self._create_engine(url)
+
+    @property
+    def data_version(self) -> int:
+        """
+        Counter of committed modifications of players, series, tables and results, read from the database.
+        It is bumped by the committing transaction, so modifications by other processes are tracked as well.
+        """
+        with self.engine.connect() as connection:
+            return read_data_version(connection)
+
+    def bump_data_version(self) -> None:
+        """Increment the :attr:`data_version`, invalidating all entries of the :attr:`result_cache`."""
+        with self.engine.begin() as connection:
+            bump_data_version(connection)
+        self.result_cache.clear()
+
+    def players(self, session: Session) -> PlayersTable:
         """Table of players."""
-        return PlayersTable(session)
+        return PlayersTable(self, session)
 
     def results(self, session: Session) -> ResultsTable:
         """Table of game results."""
         return ResultsTable(self, session)
 
-    @staticmethod
-    def series(session: Session) -> SeriesTable:
+    def series(self, session: Session) -> SeriesTable:
         """Table of game series."""
-        return SeriesTable(session)
+        return SeriesTable(self, session)
 
     def tables(self, session: Session) -> TablesTable:
         """Table of series-player-table mappings."""
         return TablesTable(self, session)
 
+    @staticmethod
+    def evaluations(session: Session) -> EvaluationsTable:
+        """Table of stored series evaluations."""
+        return EvaluationsTable(session)
+
     def get_session(self) -> Session:
-        return Session(self.engine)
+        session = Session(self.engine)
+        event.listen(session, "before_commit", self._before_commit)
+        event.listen(session, "after_commit", self._after_commit)
+        event.listen(session, "after_rollback", self._after_rollback)
+        return session
+
+    @staticmethod
+    def _before_commit(session: Session):
+        if session.info.get(MODIFIED_INFO_KEY, False):
+            bump_data_version(session.connection())
+
+            # lets the seat indexes of other series survive the bump, see SeatIndexCache.invalidate
+            if SEATING_MODIFIED_INFO_KEY in session.info:
+                session.info[DATA_VERSION_INFO_KEY] = read_data_version(session.connection())
+
+    def _after_commit(self, session: Session):
+        if SEATING_MODIFIED_INFO_KEY in session.info:
+            self.seat_indexes.invalidate(
+                session.info.pop(SEATING_MODIFIED_INFO_KEY), session.info.pop(DATA_VERSION_INFO_KEY, None)
+            )
+
+        # entries are keyed by the data version, clearing just frees their memory early
+        if session.info.pop(MODIFIED_INFO_KEY, False):
+            self.result_cache.clear()
+
+    @staticmethod
+    def _after_rollback(session: Session):
+        session.info.pop(MODIFIED_INFO_KEY, None)
+        session.info.pop(SEATING_MODIFIED_INFO_KEY, None)
+        session.info.pop(DATA_VERSION_INFO_KEY, None)
+
+    def fake_data(self, player_count: int = 13, series_count: int = 4, fast: bool = False, seed: int | None = None):
+        """
+        Fill the database with fake players, series, tables and results.
+
+        :param player_count: count of players to generate
+        :param series_count: count of series to generate
+        :param fast: use the vectorized generator with bulk inserts, see :func:`generate_fake_data`,
+            instead of Faker, suitable for large databases
+        :param seed: seed of the random generator, only used if ``fast``
+        """
+        if fast:
+            with self.get_session() as session:
+                generate_fake_data(session, player_count, series_count, seed=seed)
+                session.commit()
+            return
 
-    def fake_data(self, player_count: int = 13, series_count: int = 4):
         try:
             from faker import Faker
 
@@ -64,4 +207,12 @@ class Backend:
                     for p in players
                 ]
                 session.add_all(results)
+                self.evaluations(session).mark_dirty(series.id)
                 session.commit()
+
+
+def create_missing_indexes(bind: Engine | Connection):
+    """Create indexes declared in the data model which are missing in databases created by earlier versions."""
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
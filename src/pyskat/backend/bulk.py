@@ -0,0 +1,155 @@
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import bindparam, insert, tuple_, update
+from sqlmodel import SQLModel, Session, select
+
+Rows = pd.DataFrame | Iterable[Mapping[str, Any]]
+"""Rows to write given as data-frame, named index levels are included as columns, or as iterable of mappings."""
+
+
+def to_records(rows: Rows) -> list[dict[str, Any]]:
+    """Convert rows to a list of dicts, dropping missing values, so that defaults apply to them."""
+    if isinstance(rows, pd.DataFrame):
+        if any(name is not None for name in rows.index.names):
+            rows = rows.reset_index()
+        records = rows.to_dict("records")
+    else:
+        records = [dict(r) for r in rows]
+
+    return [{k: v for k, v in r.items() if not (pd.api.types.is_scalar(v) and pd.isna(v))} for r in records]
+
+
+def primary_key(model_type: type[SQLModel]) -> list[str]:
+    """Names of the primary key columns of a table model."""
+    return [c.name for c in model_type.__table__.primary_key.columns]
+
+
+def key_of(record: Mapping[str, Any], key_columns: list[str]) -> tuple | None:
+    """Primary key of a record as tuple, or ``None`` if not all key columns are given."""
+    if not all(k in record for k in key_columns):
+        return None
+    return tuple(record[k] for k in key_columns)
+
+
+def fetch_existing(session: Session, model_type: type[SQLModel], keys: Iterable[tuple]) -> dict[tuple, SQLModel]:
+    """Get the existing rows with the given primary keys in one query, mapped by key."""
+    key_columns = primary_key(model_type)
+    keys = list(set(keys))
+
+    if not keys:
+        return {}
+
+    if len(key_columns) == 1:
+        column = getattr(model_type, key_columns[0])
+        condition = column.in_([k[0] for k in keys])
+    else:
+        condition = tuple_(*(getattr(model_type, k) for k in key_columns)).in_(keys)
+
+    return {key_of(m.model_dump(), key_columns): m for m in session.exec(select(model_type).where(condition))}
+
+
+def insert_records(session: Session, model_type: type[SQLModel], records: list[dict[str, Any]]) -> list[tuple]:
+    """
+    Validate all records before inserting them with one executemany statement in the session's transaction.
+    Records without primary key get generated ones, which are returned by the insert statement itself
+    in the order of the records, so no rows have to be queried afterward.
+    Changes are not committed, this is left to the caller.
+
+    :return: the primary keys of the inserted rows in order
+    """
+    key_columns = primary_key(model_type)
+    validated = []
+
+    for r in records:
+        dumped = model_type.model_validate(r).model_dump()
+        validated.append({k: v for k, v in dumped.items() if not (k in key_columns and v is None)})
+
+    keys = [key_of(r, key_columns) for r in validated]
+    connection = session.connection()
+
+    given = [r for r, k in zip(validated, keys) if k is not None]
+    if given:
+        connection.execute(insert(model_type), given)
+
+    generated = [i for i, k in enumerate(keys) if k is None]
+    if generated:
+        statement = insert(model_type).returning(
+            *(getattr(model_type, k) for k in key_columns), sort_by_parameter_order=True
+        )
+        generated_keys = [tuple(row) for row in connection.execute(statement, [validated[i] for i in generated])]
+
+        for i, k in zip(generated, generated_keys):
+            keys[i] = k
+
+    return keys
+
+
+def update_records(
+    session: Session,
+    model_type: type[SQLModel],
+    records: list[dict[str, Any]],
+    raise_not_found: Callable[..., Any],
+) -> list[tuple]:
+    """
+    Validate all records merged into the existing rows before updating them with one executemany statement
+    per set of updated columns in the session's transaction.
+    Only the columns given in a record are updated.
+    Changes are not committed, this is left to the caller.
+
+    :param raise_not_found: called with the primary key of the first record that does not exist
+    :return: the primary keys of the updated rows in order
+    """
+    key_columns = primary_key(model_type)
+    keys = [key_of(r, key_columns) for r in records]
+
+    for r, k in zip(records, keys):
+        if k is None:
+            raise KeyError(f"Records to update must contain the primary key columns {key_columns}, but got {r}.")
+
+    existing = fetch_existing(session, model_type, keys)
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+
+    for r, k in zip(records, keys):
+        if k not in existing:
+            raise_not_found(*k)
+
+        validated = model_type.model_validate(existing[k].model_dump() | r).model_dump()
+        columns = tuple(sorted(c for c in r if c not in key_columns))
+        params = {f"key_{c}": v for c, v in zip(key_columns, k)} | {c: validated[c] for c in columns}
+        groups.setdefault(columns, []).append(params)
+
+    for columns, params in groups.items():
+        if not columns:
+            continue
+
+        statement = update(model_type).where(*(getattr(model_type, k) == bindparam(f"key_{k}") for k in key_columns))
+        session.connection().execute(statement, params)
+
+    return keys
+
+
+def upsert_records(
+    session: Session, model_type: type[SQLModel], records: list[dict[str, Any]]
+) -> tuple[list[tuple], list[tuple]]:
+    """
+    Update the records whose primary key exists and insert all others in the session's transaction.
+    Changes are not committed, this is left to the caller.
+
+    :return: the primary keys of all records in order and the ones of the inserted records
+    """
+    key_columns = primary_key(model_type)
+    keys = [key_of(r, key_columns) for r in records]
+    existing = fetch_existing(session, model_type, (k for k in keys if k is not None))
+
+    to_update = [r for r, k in zip(records, keys) if k in existing]
+    to_insert = [i for i, k in enumerate(keys) if k not in existing]
+
+    update_records(session, model_type, to_update, lambda *k: None)
+    inserted = insert_records(session, model_type, [records[i] for i in to_insert])
+
+    for i, k in zip(to_insert, inserted):
+        keys[i] = k
+
+    return keys, inserted
@@ -1,11 +1,16 @@
 from datetime import datetime
-from typing import Iterable
+from typing import Iterable, Literal
 
 import pandas as pd
-from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Boolean, Connection, DateTime, Engine, Float, Index, Integer, insert, select, update
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import SQLModel, Field, Relationship, Session, col
 
 
 class TablePlayerLink(SQLModel, table=True):
+    # the primary key covers lookups by table, this index the lookups by player
+    __table_args__ = (Index("ix_tableplayerlink_player_id_table_id", "player_id", "table_id"),)
+
     table_id: int = Field(gt=0, foreign_key="table.id", primary_key=True)
     player_id: int = Field(gt=0, foreign_key="player.id", primary_key=True)
 
@@ -26,7 +31,7 @@ class Player(SQLModel, table=True):
 
 class Table(SQLModel, table=True):
     id: int | None = Field(gt=0, default=None, primary_key=True)
-    series_id: int = Field(gt=0, foreign_key="series.id")
+    series_id: int = Field(gt=0, foreign_key="series.id", index=True)
     remarks: str = Field(default="")
 
     players: list[Player] = Relationship(link_model=TablePlayerLink, back_populates="tables")
@@ -56,6 +61,9 @@ class Series(SQLModel, table=True):
 
 
 class Result(SQLModel, table=True):
+    # the primary key covers lookups by series, this index the lookups by player
+    __table_args__ = (Index("ix_result_player_id_series_id", "player_id", "series_id"),)
+
     series_id: int = Field(default=0, gt=0, foreign_key="series.id", primary_key=True)
     player_id: int = Field(default=0, gt=0, foreign_key="player.id", primary_key=True)
     points: int
@@ -67,24 +75,158 @@ class Result(SQLModel, table=True):
     player: Player = Relationship(back_populates="results")
 
 
+class SeriesEvaluation(SQLModel, table=True):
+    series_id: int = Field(gt=0, foreign_key="series.id", primary_key=True)
+    key: str
+    data: str
+    dtypes: str
+
+
+class StandingsTotal(SQLModel, table=True):
+    """Persisted running totals of the standings, see :class:`pyskat.plugins.Standings`."""
+
+    key: str = Field(primary_key=True)
+    data: str
+    dtypes: str
+
+
+class StandingsSeries(SQLModel, table=True):
+    """Total results of one series folded into the persisted standings, flagged dirty once the series is modified."""
+
+    key: str = Field(primary_key=True)
+    series_id: int = Field(gt=0, primary_key=True)
+    dirty: bool = False
+    data: str
+    dtypes: str
+
+
+class DataVersion(SQLModel, table=True):
+    """Single row counting the committed modifications of evaluated data, shared by all processes."""
+
+    id: int = Field(default=1, primary_key=True)
+    version: int = 0
+
+
+def create_data_version(bind: Engine | Connection):
+    """Insert the row of the :class:`DataVersion` if missing, in databases created by earlier versions as well."""
+    if bind.execute(select(DataVersion.id)).first() is None:
+        bind.execute(insert(DataVersion).values(id=1, version=0))
+
+
+def read_data_version(bind: Engine | Connection) -> int:
+    """Read the current count of committed modifications from the :class:`DataVersion` row."""
+    return bind.execute(select(DataVersion.version)).scalar() or 0
+
+
+def bump_data_version(bind: Engine | Connection):
+    """Increment the :class:`DataVersion` within the transaction of the given connection."""
+    bind.execute(update(DataVersion).values(version=col(DataVersion.version) + 1))
+
+
+def model_dtypes(model_type: type[SQLModel]) -> dict[str, str]:
+    """Get the pandas dtypes of the columns of a table model, using nullable dtypes for nullable columns."""
+    dtypes = {}
+
+    for column in model_type.__table__.columns:
+        nullable = column.nullable and not column.primary_key
+
+        if isinstance(column.type, Boolean):
+            dtypes[column.name] = "boolean" if nullable else "bool"
+        elif isinstance(column.type, Integer):
+            dtypes[column.name] = "Int64" if nullable else "int64"
+        elif isinstance(column.type, Float):
+            dtypes[column.name] = "float64"
+        elif isinstance(column.type, DateTime):
+            dtypes[column.name] = "datetime64[ns]"
+        else:
+            dtypes[column.name] = "object"
+
+    return dtypes
+
+
+def read_pandas(
+    session: Session,
+    selector,
+    index_cols: str | list[str],
+    dtypes: dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """
+    Run a select statement on the session's connection and build a data-frame directly from the result rows.
+    ORM hydration, the identity map and model validation are bypassed, so use this for read-only analytics only.
+
+    :param session: the database session to use
+    :param selector: a select statement of columns, not of models
+    :param index_cols: the column or columns to use as index
+    :param dtypes: dtypes of the columns, see :func:`model_dtypes`, the inferred ones are used if ``None``
+    """
+    df = pd.read_sql(selector, session.connection(), dtype=dtypes)
+    df.set_index(index_cols, inplace=True)
+    return df
+
+
 def to_pandas(
     data: SQLModel | Iterable[SQLModel],
     model_type: type[SQLModel],
     index_cols: str | list[str],
 ) -> pd.DataFrame:
-    if isinstance(data, SQLModel):
-        df = pd.DataFrame(data.model_dump())
-    else:
-        if not data:
-            cols = list(model_type.model_fields.keys())
-            index = (
-                pd.Index([], name=index_cols)
-                if isinstance(index_cols, str)
-                else pd.MultiIndex.from_arrays([[] for c in index_cols], names=index_cols)
-            )
-            df = pd.DataFrame(pd.DataFrame(columns=cols, index=index))
-        else:
-            df = pd.DataFrame([item.model_dump() for item in data])
-
+    """
+    Build a data-frame from already loaded model instances by reading their column attributes.
+    Prefer the ``to_pandas`` methods of the table classes to load data-frames from the database directly.
+    """
+    items = [data] if isinstance(data, SQLModel) else list(data)
+    dtypes = model_dtypes(model_type)
+    df = pd.DataFrame({c: [getattr(item, c) for item in items] for c in dtypes}).astype(dtypes)
     df.set_index(index_cols, inplace=True)
     return df
+
+
+SeriesFilter = int | Iterable[int] | None
+"""One series ID, multiple series IDs or ``None`` for all series."""
+
+
+def filter_series(selector, column, series_id: SeriesFilter):
+    """Restrict a select statement on the given series ID column according to a series filter."""
+    if series_id is None:
+        return selector
+    if isinstance(series_id, Iterable):
+        return selector.where(col(column).in_([int(i) for i in series_id]))
+    return selector.where(column == int(series_id))
+
+
+LoadingStrategy = Literal["selectin", "joined"] | None
+"""
+Strategy to load relationships with: ``"selectin"`` issues one additional query per relationship,
+``"joined"`` joins them into the main query, ``None`` loads them lazily on first access with one query per object.
+"""
+
+
+def load_eagerly(selector, loading: LoadingStrategy, *paths: tuple):
+    """
+    Add loader options to a select statement to load the given relationship paths with the given strategy.
+
+    :param selector: the select statement to modify
+    :param loading: the loading strategy, the statement is returned unchanged if ``None``
+    :param paths: chains of relationship attributes, like ``(Series.tables, Table.players)``
+    """
+    if loading is None:
+        return selector
+
+    loader = {"selectin": selectinload, "joined": joinedload}[loading]
+    options = []
+
+    for path in paths:
+        option = loader(path[0])
+        for attribute in path[1:]:
+            option = getattr(option, loader.__name__)(attribute)
+        options.append(option)
+
+    return selector.options(*options)
+
+
+def series_filter_key(series_id: SeriesFilter) -> int | tuple[int, ...] | None:
+    """Normalize a series filter to a hashable value, for use in cache keys."""
+    if series_id is None:
+        return None
+    if isinstance(series_id, Iterable):
+        return tuple(sorted({int(i) for i in series_id}))
+    return int(series_id)
@@ -0,0 +1,164 @@
+import json
+from io import StringIO
+from typing import Iterable
+
+import pandas as pd
+from sqlmodel import select, delete, update, col, Session
+
+from .data_model import Result, SeriesEvaluation, StandingsSeries, StandingsTotal
+
+MODIFIED_INFO_KEY = "pyskat_modified"
+"""Key in :attr:`Session.info` flagging that the session's transaction modifies evaluated data."""
+
+
+class EvaluationsTable:
+    """
+    Persistent store of evaluated results per series and of the standings folded from them.
+    Absence of a stored evaluation marks a series as dirty, so it has to be evaluated anew.
+    The totals of series included in the standings are kept and flagged dirty instead,
+    so the standings can be refolded without them.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def get_many(self, series_ids: Iterable[int], key: str) -> dict[int, pd.DataFrame]:
+        """
+        Get the stored evaluations of the given series.
+        Evaluations stored with another key than the given one are considered outdated and are omitted.
+
+        :param series_ids: IDs of the series to get evaluations for
+        :param key: the key identifying the evaluation pipeline that produced the evaluations
+        :return: a dict mapping series IDs to their evaluated results, only containing non-dirty series
+        """
+        evaluations = self._session.exec(
+            select(SeriesEvaluation).where(
+                col(SeriesEvaluation.series_id).in_([int(i) for i in series_ids]), SeriesEvaluation.key == key
+            )
+        ).all()
+        return {e.series_id: _from_json(e) for e in evaluations}
+
+    def store_many(self, results: pd.DataFrame, key: str) -> None:
+        """
+        Store evaluated results, split up per series.
+
+        :param results: evaluated results indexed first on ``series_id`` and then on ``player_id``
+        :param key: the key identifying the evaluation pipeline that produced the evaluations
+        """
+        dtypes = json.dumps(results.dtypes.astype(str).to_dict())
+        evaluations = [
+            SeriesEvaluation(series_id=series_id, key=key, data=df.to_json(orient="table"), dtypes=dtypes)
+            for series_id, df in results.groupby("series_id")
+        ]
+
+        self._delete(*(e.series_id for e in evaluations))
+        self._session.add_all(evaluations)
+        self._session.commit()
+
+    def mark_dirty(self, *series_ids: int) -> None:
+        """
+        Mark the given series as dirty by dropping their stored evaluations.
+        The session is flagged to bump the backend's data version once committed.
+        Changes are not committed, this is left to the caller's transaction.
+        """
+        self._session.info[MODIFIED_INFO_KEY] = True
+        self._delete(*series_ids)
+        self._session.exec(
+            update(StandingsSeries).where(col(StandingsSeries.series_id).in_(series_ids)).values(dirty=True)
+        )
+
+    def mark_modified(self) -> None:
+        """
+        Flag the session to bump the backend's data version once committed, without dropping stored evaluations.
+        To be used for modifications that do not affect evaluated results, but other derived data like reports.
+        """
+        self._session.info[MODIFIED_INFO_KEY] = True
+
+    def mark_dirty_for_player(self, *player_ids: int) -> None:
+        """
+        Mark all series the given players have results in as dirty.
+        Changes are not committed, this is left to the caller's transaction.
+        """
+        self._session.info[MODIFIED_INFO_KEY] = True
+        series_ids = select(Result.series_id).where(col(Result.player_id).in_(player_ids))
+        self._session.exec(delete(SeriesEvaluation).where(col(SeriesEvaluation.series_id).in_(series_ids)))
+        self._session.exec(
+            update(StandingsSeries).where(col(StandingsSeries.series_id).in_(series_ids)).values(dirty=True)
+        )
+
+    def _delete(self, *series_ids: int) -> None:
+        self._session.exec(delete(SeriesEvaluation).where(col(SeriesEvaluation.series_id).in_(series_ids)))
+
+    def get_standings(self, key: str) -> tuple[pd.DataFrame | None, dict[int, bool]]:
+        """
+        Get the stored standings.
+        Standings stored with another key than the given one are considered outdated and are omitted.
+
+        :param key: the key identifying the evaluation pipeline that produced the standings
+        :return: the running totals indexed on ``player_id`` or ``None`` if none are stored,
+            and a dict mapping the IDs of the included series to whether they are dirty
+        """
+        totals = self._session.get(StandingsTotal, key)
+        included = self._session.exec(
+            select(StandingsSeries.series_id, StandingsSeries.dirty).where(StandingsSeries.key == key)
+        ).all()
+        return None if totals is None else _from_json(totals), {i: d for i, d in included}
+
+    def get_standings_series(self, series_ids: Iterable[int], key: str) -> dict[int, pd.DataFrame]:
+        """
+        Get the stored totals of series included in the standings.
+
+        :param series_ids: IDs of the series to get totals for
+        :param key: the key identifying the evaluation pipeline that produced the standings
+        :return: a dict mapping series IDs to their totals indexed on ``player_id``
+        """
+        series_totals = self._session.exec(
+            select(StandingsSeries).where(
+                col(StandingsSeries.series_id).in_([int(i) for i in series_ids]), StandingsSeries.key == key
+            )
+        ).all()
+        return {s.series_id: _from_json(s) for s in series_totals}
+
+    def store_standings(
+        self,
+        totals: pd.DataFrame,
+        series_totals: dict[int, pd.DataFrame],
+        key: str,
+        removed: Iterable[int] = (),
+    ) -> None:
+        """
+        Store the standings, replacing the stored ones and the ones of other evaluation pipelines.
+
+        :param totals: the running totals indexed on ``player_id``
+        :param series_totals: totals of the newly included or refolded series, marked as not dirty
+        :param key: the key identifying the evaluation pipeline that produced the standings
+        :param removed: IDs of series to drop from the included ones
+        """
+        self._session.exec(delete(StandingsTotal))
+        self._session.exec(
+            delete(StandingsSeries).where(
+                (StandingsSeries.key != key)
+                | col(StandingsSeries.series_id).in_([*series_totals, *(int(i) for i in removed)])
+            )
+        )
+        self._session.add(StandingsTotal(key=key, **_to_json(totals)))
+        self._session.add_all(
+            StandingsSeries(key=key, series_id=int(i), **_to_json(df)) for i, df in series_totals.items()
+        )
+        self._session.commit()
+
+    def clear(self) -> None:
+        """Drop all stored evaluations and standings."""
+        self._session.exec(delete(SeriesEvaluation))
+        self._session.exec(delete(StandingsSeries))
+        self._session.exec(delete(StandingsTotal))
+        self._session.commit()
+
+
+def _to_json(df: pd.DataFrame) -> dict[str, str]:
+    return dict(data=df.to_json(orient="table"), dtypes=json.dumps(df.dtypes.astype(str).to_dict()))
+
+
+def _from_json(evaluation: SeriesEvaluation | StandingsSeries | StandingsTotal) -> pd.DataFrame:
+    df = pd.read_json(StringIO(evaluation.data), orient="table")
+    return df.astype(json.loads(evaluation.dtypes))
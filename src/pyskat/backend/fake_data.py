@@ -0,0 +1,142 @@
+"""
+Vectorized generation of fake tournament data for load tests and benchmarks.
+All values are drawn in bulk from a seeded NumPy generator and written with bulk Core statements,
+so that databases with millions of results are created in seconds.
+"""
+
+from collections.abc import Mapping
+from itertools import repeat
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import Connection, bindparam, insert
+from sqlmodel import SQLModel, Session
+
+from .data_model import Player, Result, Series, Table, TablePlayerLink
+from .evaluations_table import EvaluationsTable
+from .seat_index import mark_seating_modified
+from .seating import table_sizes
+
+CHUNK_SIZE = 50_000
+"""Count of rows written per insert statement to bound the memory of the parameter lists."""
+
+FIRST_NAMES = np.array(
+    ["Anna", "Ben", "Clara", "David", "Emma", "Felix", "Greta", "Hans", "Ida", "Jonas", "Karl", "Lena"]
+    + ["Marie", "Noah", "Olga", "Paul", "Rosa", "Simon", "Theo", "Ulla", "Vera", "Walter", "Xaver", "Zoe"]
+)
+LAST_NAMES = np.array(
+    ["Bauer", "Becker", "Fischer", "Hoffmann", "Koch", "Krüger", "Lange", "Meyer", "Müller", "Neumann", "Richter"]
+    + ["Schäfer", "Schmidt", "Schneider", "Schulz", "Schwarz", "Wagner", "Weber", "Wolf", "Zimmermann"]
+)
+CITIES = np.array(
+    ["Berlin", "Bremen", "Dresden", "Erfurt", "Hamburg", "Hannover", "Kiel", "Leipzig", "Magdeburg", "Mainz"]
+    + ["München", "Potsdam", "Rostock", "Saarbrücken", "Schwerin", "Stuttgart", "Weimar", "Wiesbaden"]
+)
+
+
+def generate_fake_data(
+    session: Session,
+    player_count: int,
+    series_count: int,
+    players_per_series: int | None = None,
+    seed: int | None = None,
+) -> int:
+    """
+    Add random players, series, tables and results in the session's transaction.
+    Existing data is kept, only the generated players are seated in the generated series.
+    Changes are not committed, this is left to the caller.
+
+    :param session: the database session to use
+    :param player_count: count of players to generate
+    :param series_count: count of series to generate
+    :param players_per_series: count of randomly drawn players participating in each series, all if ``None``
+    :param seed: seed of the random generator, for reproducible data
+    :return: the count of generated results
+    :raises ValueError: if no valid tables can be formed from the players per series
+    """
+    rng = np.random.default_rng(seed)
+    seated_count = player_count if players_per_series is None else min(players_per_series, player_count)
+    sizes = table_sizes(seated_count)
+    connection = session.connection()
+
+    player_ids = _insert(
+        connection,
+        Player,
+        dict(
+            name=np.char.add(
+                np.char.add(rng.choice(FIRST_NAMES, player_count), " "), rng.choice(LAST_NAMES, player_count)
+            )
+        ),
+    )
+
+    now = datetime.now()
+    start = datetime(now.year, 1, 1)
+    offsets = np.sort(rng.integers(0, int((now - start).total_seconds()) + 1, series_count)).astype("timedelta64[s]")
+    series_ids = _insert(
+        connection,
+        Series,
+        dict(name=rng.choice(CITIES, series_count), date=np.datetime64(start, "s") + offsets),
+    )
+
+    table_series_ids = np.repeat(series_ids, len(sizes))
+    table_ids = _insert(connection, Table, dict(series_id=table_series_ids))
+
+    # draw the participants of each series, seat them in order at the series' tables
+    seat_player_ids = np.concatenate([rng.choice(player_ids, seated_count, replace=False) for _ in range(series_count)])
+    seat_table_ids = np.repeat(table_ids, np.tile(sizes, series_count))
+    _insert(connection, TablePlayerLink, dict(table_id=seat_table_ids, player_id=seat_player_ids), returning=False)
+
+    result_count = len(seat_player_ids)
+    _insert(
+        connection,
+        Result,
+        dict(
+            series_id=np.repeat(series_ids, seated_count),
+            player_id=seat_player_ids,
+            points=rng.integers(0, 1000, result_count, endpoint=True),
+            won=rng.integers(0, 10, result_count, endpoint=True),
+            lost=rng.integers(0, 5, result_count, endpoint=True),
+        ),
+        returning=False,
+    )
+
+    EvaluationsTable(session).mark_modified()
+    mark_seating_modified(session)
+    return result_count
+
+
+def _insert(
+    connection: Connection, model_type: type[SQLModel], columns: Mapping[str, np.ndarray], returning: bool = True
+) -> np.ndarray | None:
+    """
+    Insert rows given as column arrays in chunks.
+    Generated ids are returned by the insert statement itself and assigned in ascending order.
+    Without ``returning``, the compiled statement is passed directly to the driver's executemany,
+    as building SQLAlchemy's parameters would take longer than the database's insert itself.
+    """
+    row_count = len(next(iter(columns.values())))
+    defaults = {
+        c.name: c.default.arg
+        for c in model_type.__table__.columns
+        if c.default is not None and c.default.is_scalar and c.name not in columns
+    }
+    names = list(columns) + list(defaults)
+    ids = []
+
+    statement = insert(model_type).values({n: bindparam(n) for n in names})
+    compiled = statement.compile(dialect=connection.dialect)
+    order = [names.index(n) for n in compiled.positiontup] if compiled.positional else None
+
+    for i in range(0, row_count, CHUNK_SIZE):
+        values = [c[i : i + CHUNK_SIZE].tolist() for c in columns.values()]
+        values += [repeat(v) for v in defaults.values()]
+
+        if returning:
+            chunk = [dict(zip(names, r)) for r in zip(*values)]
+            ids.extend(connection.execute(insert(model_type).returning(model_type.id), chunk).scalars())
+        elif order is not None:
+            connection.exec_driver_sql(compiled.string, list(zip(*(values[j] for j in order))))
+        else:
+            connection.exec_driver_sql(compiled.string, [dict(zip(names, r)) for r in zip(*values)])
+
+    return np.sort(np.array(ids, dtype=np.int64)) if returning else None
@@ -0,0 +1,75 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class LRUCache:
+    """
+    Thread-safe in-process mapping of bounded size, evicting the least recently used entries first.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum count of entries, a value of zero disables caching."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int):
+        if value < 0:
+            raise ValueError(f"Cache size must not be negative, but was {value}.")
+
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get the value stored under the key or compute and store it if absent.
+        The lock is not held during computation, so concurrent misses of the same key may compute twice.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+
+        if value is sentinel:
+            value = compute()
+            self.put(key, value)
+
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self):
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -1,10 +1,19 @@
-from .data_model import Player
+from .bulk import Rows, to_records, insert_records, update_records, upsert_records
+import pandas as pd
+
+from .data_model import Player, Table, LoadingStrategy, load_eagerly, model_dtypes, read_pandas
+from .seat_index import mark_seating_modified
 from sqlmodel import select, Session
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .backend import Backend
 
 
 class PlayersTable:
-    def __init__(self, session: Session):
+    def __init__(self, backend: "Backend", session: Session):
         self._session = session
+        self._backend = backend
 
     def add(
         self,
@@ -23,6 +32,43 @@ class PlayersTable:
         self._session.refresh(player)
         return player
 
+    def add_many(self, players: Rows) -> list[int]:
+        """
+        Add many players to the database in one transaction.
+        All rows are validated before any is inserted.
+
+        :param players: rows holding the fields of :class:`Player`, missing fields get their defaults
+        :return: the IDs of the added players in order
+        """
+        ids = insert_records(self._session, Player, to_records(players))
+        self._session.commit()
+        return [i for i, in ids]
+
+    def update_many(self, players: Rows) -> list[int]:
+        """
+        Update many existing players in the database in one transaction.
+        Only the fields given in a row are updated, all rows are validated before any is updated.
+
+        :param players: rows holding the ``id`` and the fields to update
+        :return: the IDs of the updated players in order
+        """
+        ids = [i for i, in update_records(self._session, Player, to_records(players), raise_player_not_found)]
+        self._backend.evaluations(self._session).mark_dirty_for_player(*ids)
+        self._session.commit()
+        return ids
+
+    def upsert_many(self, players: Rows) -> list[int]:
+        """
+        Update the players whose ``id`` exists and add all others in one transaction.
+
+        :param players: rows holding the fields of :class:`Player`
+        :return: the IDs of all players in order
+        """
+        keys, inserted = upsert_records(self._session, Player, to_records(players))
+        self._backend.evaluations(self._session).mark_dirty_for_player(*(i for i, in set(keys) - set(inserted)))
+        self._session.commit()
+        return [i for i, in keys]
+
     def update(
         self,
         id: int,
@@ -43,6 +89,7 @@ class PlayersTable:
             player.remarks = remarks
 
         self._session.add(player)
+        self._backend.evaluations(self._session).mark_dirty_for_player(id)
         self._session.commit()
         self._session.refresh(player)
         return player
@@ -50,6 +97,8 @@ class PlayersTable:
     def remove(self, id: int) -> None:
         """Remove a player from the database."""
         player = self._session.get(Player, id) or raise_player_not_found(id)
+        self._backend.evaluations(self._session).mark_dirty_for_player(id)
+        mark_seating_modified(self._session)
         self._session.delete(player)
         self._session.commit()
 
@@ -58,11 +107,20 @@ class PlayersTable:
         player = self._session.get(Player, id)
         return player or raise_player_not_found(id)
 
-    def all(self) -> list[Player]:
-        """Get a list of all players in the database."""
-        players = self._session.exec(select(Player)).all()
+    def all(self, loading: LoadingStrategy = "selectin") -> list[Player]:
+        """
+        Get a list of all players in the database.
+
+        :param loading: strategy to load the tables of the players and their series with, lazily if ``None``
+        """
+        selector = load_eagerly(select(Player), loading, (Player.tables, Table.series))
+        players = self._session.exec(selector).unique().all()
         return list(players)
 
+    def to_pandas(self) -> pd.DataFrame:
+        """Get all players in the database as data-frame indexed on ``id``, loaded without ORM overhead."""
+        return read_pandas(self._session, select(*Player.__table__.columns), "id", model_dtypes(Player))
+
 
 def raise_player_not_found(id: int):
     raise KeyError(f"A player with the given ID {id} was not found.")
@@ -0,0 +1,73 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
+from typing import Any
+
+from sqlalchemy import URL
+
+DIALECT_DEFAULTS: dict[str, dict[str, Any]] = {
+    "postgresql": dict(size=5, max_overflow=10, recycle=1800, pre_ping=True, timeout=30),
+    "mysql": dict(size=5, max_overflow=10, recycle=3600, pre_ping=True, timeout=30),
+    "mariadb": dict(size=5, max_overflow=10, recycle=3600, pre_ping=True, timeout=30),
+}
+"""
+Default pool settings of server databases.
+Connections are recycled before common server-side idle timeouts and checked before use,
+so that restarted servers or dropped connections do not surface as errors.
+SQLite has no defaults, as its file connections are cheap and in-memory databases use a single connection.
+"""
+
+ENGINE_ARGUMENTS = dict(
+    size="pool_size",
+    max_overflow="max_overflow",
+    recycle="pool_recycle",
+    pre_ping="pool_pre_ping",
+    timeout="pool_timeout",
+)
+"""Names of the keyword arguments to :func:`sqlalchemy.create_engine` per pool setting."""
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """
+    Settings of the connection pool of a backend's engine.
+    Settings left at ``None`` use the defaults of the dialect, see :data:`DIALECT_DEFAULTS`,
+    or SQLAlchemy's defaults if there are none.
+    """
+
+    size: int | None = None
+    """Count of connections kept open in the pool."""
+
+    max_overflow: int | None = None
+    """Count of connections opened beyond ``size`` under load, closed again when returned."""
+
+    recycle: int | None = None
+    """Seconds after which connections are replaced, ``-1`` to never replace them."""
+
+    pre_ping: bool | None = None
+    """Whether to test connections for liveness on checkout."""
+
+    timeout: float | None = None
+    """Seconds to wait for a free connection before failing."""
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any], prefix: str = "POOL_") -> "PoolSettings":
+        """Read settings from a config mapping with upper case keys like ``POOL_SIZE``, missing keys stay unset."""
+        return cls(**{f.name: config.get(prefix + f.name.upper()) for f in fields(cls)})
+
+    def merge(self, other: "PoolSettings") -> "PoolSettings":
+        """Get these settings overridden by the settings set in ``other``."""
+        return replace(self, **{f.name: v for f in fields(other) if (v := getattr(other, f.name)) is not None})
+
+    def engine_options(self, url: URL) -> dict[str, Any]:
+        """Get the keyword arguments to :func:`sqlalchemy.create_engine` for a database URL."""
+        settings = DIALECT_DEFAULTS.get(url.get_backend_name(), {}) | {
+            f.name: v for f in fields(self) if (v := getattr(self, f.name)) is not None
+        }
+        return {ENGINE_ARGUMENTS[k]: v for k, v in settings.items()}
+
+
+def is_memory_database(url: URL) -> bool:
+    """Whether a database URL refers to an in-memory SQLite database, which lives only as long as its engine."""
+    return url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    )
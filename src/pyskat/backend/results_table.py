@@ -1,4 +1,15 @@
-from .data_model import Result, Series
+import numpy as np
+import pandas as pd
+
+from .bulk import Rows, to_records, insert_records, update_records, upsert_records
+from .data_model import (
+    Result,
+    Series,
+    SeriesFilter,
+    filter_series,
+    model_dtypes,
+    read_pandas,
+)
 from sqlmodel import select, Session
 from typing import TYPE_CHECKING
 
@@ -30,6 +41,7 @@ class ResultsTable:
             remarks=remarks or "",
         )
         self._session.add(result)
+        self._backend.evaluations(self._session).mark_dirty(series_id)
         self._session.commit()
         self._session.refresh(result)
         return result
@@ -59,10 +71,49 @@ class ResultsTable:
             result.remarks = remarks
 
         self._session.add(result)
+        self._backend.evaluations(self._session).mark_dirty(series_id)
         self._session.commit()
         self._session.refresh(result)
         return result
 
+    def add_many(self, results: Rows) -> list[tuple[int, int]]:
+        """
+        Add many results to the database in one transaction.
+        All rows are validated before any is inserted.
+
+        :param results: rows holding the fields of :class:`Result`, missing fields get their defaults
+        :return: the ``series_id`` and ``player_id`` of the added results in order
+        """
+        keys = insert_records(self._session, Result, to_records(results))
+        self._backend.evaluations(self._session).mark_dirty(*{s for s, _ in keys})
+        self._session.commit()
+        return keys
+
+    def update_many(self, results: Rows) -> list[tuple[int, int]]:
+        """
+        Update many existing results in the database in one transaction.
+        Only the fields given in a row are updated, all rows are validated before any is updated.
+
+        :param results: rows holding the ``series_id``, the ``player_id`` and the fields to update
+        :return: the ``series_id`` and ``player_id`` of the updated results in order
+        """
+        keys = update_records(self._session, Result, to_records(results), raise_result_not_found)
+        self._backend.evaluations(self._session).mark_dirty(*{s for s, _ in keys})
+        self._session.commit()
+        return keys
+
+    def upsert_many(self, results: Rows) -> list[tuple[int, int]]:
+        """
+        Update the results whose ``series_id`` and ``player_id`` exist and add all others in one transaction.
+
+        :param results: rows holding the fields of :class:`Result`
+        :return: the ``series_id`` and ``player_id`` of all results in order
+        """
+        keys, _ = upsert_records(self._session, Result, to_records(results))
+        self._backend.evaluations(self._session).mark_dirty(*{s for s, _ in keys})
+        self._session.commit()
+        return keys
+
     def remove(
         self,
         series_id: int,
@@ -71,6 +122,7 @@ class ResultsTable:
         """Remove a result from the database."""
         result = self._session.get(Result, (series_id, player_id)) or raise_result_not_found(series_id, player_id)
         self._session.delete(result)
+        self._backend.evaluations(self._session).mark_dirty(series_id)
         self._session.commit()
 
     def get(
@@ -91,21 +143,66 @@ class ResultsTable:
         results = self._session.exec(select(Result).where(Result.series_id == series_id)).all()
         return list(results)
 
+    def all_with_table_ids(self, series_id: SeriesFilter = None) -> pd.DataFrame:
+        """
+        Get the results with the ID of the table the respective player was seated at,
+        looked up in the seat indexes of the series, see :meth:`TablesTable.seat_indexes`.
+        Results of players not seated at any table of the series get a missing table ID.
+
+        :param series_id: restrict to the results of this series or these series, or get all results if ``None``
+        :return: a data-frame indexed on ``series_id`` and ``player_id``
+        """
+        results = self.to_pandas(series_id)
+        series_ids = results.index.get_level_values("series_id").to_numpy()
+        player_ids = results.index.get_level_values("player_id").to_numpy()
+        table_ids = np.empty(len(results), dtype=np.int64)
+
+        order = np.argsort(series_ids, kind="stable")
+        keys, starts = np.unique(series_ids[order], return_index=True)
+        indexes = self._backend.tables(self._session).seat_indexes(keys.tolist())
+
+        for key, rows in zip(keys.tolist(), np.split(order, starts[1:])):
+            table_ids[rows] = indexes[key].table_of(player_ids[rows])
+
+        results["table_id"] = pd.arrays.IntegerArray(table_ids, table_ids < 0)
+        return results
+
+    def to_pandas(self, series_id: SeriesFilter = None) -> pd.DataFrame:
+        """
+        Get the results as data-frame indexed on ``series_id`` and ``player_id``, loaded without ORM overhead.
+
+        :param series_id: restrict to the results of this series or these series, or get all results if ``None``
+        """
+        selector = filter_series(select(*Result.__table__.columns), Result.series_id, series_id)
+        return read_pandas(self._session, selector, ["series_id", "player_id"], model_dtypes(Result))
+
+    def series_ids(self) -> list[int]:
+        """Get the IDs of all series with results in ascending order."""
+        series_ids = self._session.exec(select(Result.series_id).distinct().order_by(Result.series_id)).all()
+        return list(series_ids)
+
     def clear_for_series(self, series_id: int) -> None:
         """Remove all the results for a defined series in the database."""
         results = self._session.exec(select(Result).where(Result.series_id == series_id))
         for r in results:
             self._session.delete(r)
+        self._backend.evaluations(self._session).mark_dirty(series_id)
         self._session.commit()
 
     def get_opponents_lost(self, series_id: int, player_id: int) -> int:
-        table = self._backend.tables(self._session).get_table_with_player(series_id, player_id)
-        other_players = table.player_ids
-        other_players.remove(player_id)
+        tables = self._backend.tables(self._session)
+        table_id = tables.table_id_of(series_id, player_id)
+        other_players = [p for p in tables.seat_index(series_id).players_at(table_id) if p != player_id]
         others_lost = [self.get(series_id, p).lost for p in other_players]
 
         return sum(others_lost)
 
+    def unseated_player_ids(self, series_id: int) -> list[int]:
+        """Get the IDs of the players with results in a series who are not seated at any of its tables."""
+        player_ids = self._session.exec(select(Result.player_id).where(Result.series_id == series_id)).all()
+        table_ids = self._backend.tables(self._session).seat_index(series_id).table_of(player_ids)
+        return sorted(p for p, t in zip(player_ids, table_ids.tolist()) if t < 0)
+
 
 def raise_result_not_found(series_id: int, player_id: int):
     raise KeyError(f"A result with the given ID {series_id}/{player_id} was not found.")
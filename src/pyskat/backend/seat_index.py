@@ -0,0 +1,251 @@
+"""
+In-memory indexes of the seating of players at tables per series, for vectorized lookups without queries.
+The indexes are built from the table-player links once per series and cached on the backend,
+until a commit modifies the tables of their series, see :func:`mark_seating_modified`,
+or the shared data version changes due to modifications by another process.
+"""
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from sqlmodel import Session
+
+from .evaluations_table import MODIFIED_INFO_KEY
+from .lru_cache import LRUCache
+
+SEATING_MODIFIED_INFO_KEY = "pyskat_seating_modified"
+"""
+Key in :attr:`Session.info` holding the IDs of the series whose tables the session's transaction modifies,
+or ``None`` if the tables of any series may be modified.
+"""
+
+DATA_VERSION_INFO_KEY = "pyskat_data_version"
+"""Key in :attr:`Session.info` holding the data version the session's transaction bumped to when committed."""
+
+SEAT_INDEX_CACHE_SIZE = 1024
+"""Default maximum count of series whose seat index is cached on a backend."""
+
+
+def mark_seating_modified(session: Session, *series_ids: int) -> None:
+    """
+    Flag the session to invalidate the seat indexes of the given series once committed,
+    or of all series if none are given.
+    The session is flagged to bump the backend's data version as well, invalidating the indexes of other processes.
+    """
+    session.info[MODIFIED_INFO_KEY] = True
+
+    if not series_ids:
+        session.info[SEATING_MODIFIED_INFO_KEY] = None
+    elif (modified := session.info.setdefault(SEATING_MODIFIED_INFO_KEY, set())) is not None:
+        modified.update(int(i) for i in series_ids)
+
+
+@dataclass(frozen=True, eq=False)
+class SeatIndex:
+    """
+    Compact mapping of the players of one series to the tables they are seated at.
+    Lookups are vectorized binary searches in sorted arrays, so their memory is proportional to the seated players.
+    """
+
+    series_id: int
+
+    player_ids: np.ndarray
+    """IDs of the seated players in ascending order, players seated at multiple tables are repeated."""
+
+    table_ids: np.ndarray
+    """ID of the table of each player in :attr:`player_ids`."""
+
+    tables: np.ndarray
+    """IDs of all tables of the series in ascending order, including tables without players."""
+
+    sizes: np.ndarray
+    """Count of players seated at each table in :attr:`tables`."""
+
+    @classmethod
+    def from_links(
+        cls, series_id: int, tables: npt.ArrayLike, table_ids: npt.ArrayLike, player_ids: npt.ArrayLike
+    ) -> "SeatIndex":
+        """
+        Build the index of a series.
+
+        :param series_id: the ID of the series
+        :param tables: the IDs of all tables of the series
+        :param table_ids: the table of each seated player
+        :param player_ids: the seated players
+        """
+        tables = np.unique(np.asarray(tables, dtype=np.int64))
+        table_ids = np.asarray(table_ids, dtype=np.int64)
+        player_ids = np.asarray(player_ids, dtype=np.int64)
+        order = np.lexsort((table_ids, player_ids))
+
+        return cls(
+            series_id=series_id,
+            player_ids=player_ids[order],
+            table_ids=table_ids[order],
+            tables=tables,
+            sizes=np.bincount(np.searchsorted(tables, table_ids), minlength=len(tables)),
+        )
+
+    def table_of(self, player_ids: npt.ArrayLike) -> np.ndarray:
+        """Look up the tables of players, ``-1`` for players not seated in the series."""
+        return _lookup(self.player_ids, self.table_ids, player_ids, -1)
+
+    def size_of(self, table_ids: npt.ArrayLike) -> np.ndarray:
+        """Look up the count of players seated at tables, ``0`` for tables not in the series."""
+        return _lookup(self.tables, self.sizes, table_ids, 0)
+
+    def players_at(self, table_id: int) -> list[int]:
+        """Get the IDs of the players seated at a table in ascending order."""
+        return self.player_ids[self.table_ids == table_id].tolist()
+
+    def table_players(self) -> dict[int, list[int]]:
+        """Get the IDs of the players seated at each table of the series in ascending order."""
+        players = {t: [] for t in self.tables.tolist()}
+        for t, p in zip(self.table_ids.tolist(), self.player_ids.tolist()):
+            players[t].append(p)
+        return players
+
+    def duplicates(self) -> np.ndarray:
+        """Get the IDs of players seated at multiple tables of the series."""
+        return np.unique(self.player_ids[1:][self.player_ids[1:] == self.player_ids[:-1]])
+
+
+def _lookup(keys: np.ndarray, values: np.ndarray, query: npt.ArrayLike, missing: int) -> np.ndarray:
+    query = np.asarray(query, dtype=np.int64)
+    if not len(keys):
+        return np.full(query.shape, missing, dtype=values.dtype)
+
+    positions = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+    return np.where(keys[positions] == query, values[positions], missing)
+
+
+def build_seat_indexes(series_ids: Iterable[int], links: pd.DataFrame) -> dict[int, SeatIndex]:
+    """
+    Build the seat indexes of many series at once.
+
+    :param series_ids: the series to build indexes for, series without tables get empty indexes
+    :param links: a data-frame with ``series_id``, ``table_id`` and ``player_id`` columns,
+        holding a missing ``player_id`` for tables without players
+    :return: the indexes by series ID
+    """
+    links = links.sort_values("series_id", kind="stable")
+    series = links["series_id"].to_numpy(dtype=np.int64)
+    keys, starts = np.unique(series, return_index=True)
+    bounds = dict(zip(keys.tolist(), zip(starts.tolist(), [*starts[1:].tolist(), len(series)])))
+
+    table_ids = links["table_id"].to_numpy(dtype=np.int64)
+    player_ids = links["player_id"].to_numpy(dtype=float, na_value=np.nan)
+    indexes = {}
+
+    for series_id in series_ids:
+        start, end = bounds.get(int(series_id), (0, 0))
+        seated = ~np.isnan(player_ids[start:end])
+        indexes[int(series_id)] = SeatIndex.from_links(
+            int(series_id), table_ids[start:end], table_ids[start:end][seated], player_ids[start:end][seated]
+        )
+
+    return indexes
+
+
+def seating_frame(indexes: Iterable[SeatIndex]) -> pd.DataFrame:
+    """
+    Get the seating of many series like :meth:`TablesTable.seating`.
+
+    :return: a data-frame indexed on ``series_id`` and ``player_id`` holding the ``table_id``
+    """
+    indexes = list(indexes)
+    empty = [np.empty(0, dtype=np.int64)]
+    series_ids = np.concatenate(empty + [np.full(len(i.player_ids), i.series_id, dtype=np.int64) for i in indexes])
+    player_ids = np.concatenate(empty + [i.player_ids for i in indexes])
+    table_ids = np.concatenate(empty + [i.table_ids for i in indexes])
+
+    index = pd.MultiIndex.from_arrays([series_ids, player_ids], names=["series_id", "player_id"])
+    return pd.DataFrame(dict(table_id=table_ids), index=index)
+
+
+def table_sizes_series(indexes: Iterable[SeatIndex]) -> pd.Series:
+    """Get the count of players seated at each table of many series indexed on table ID."""
+    indexes = list(indexes)
+    empty = [np.empty(0, dtype=np.int64)]
+    tables = np.concatenate(empty + [i.tables for i in indexes])
+    sizes = np.concatenate(empty + [i.sizes for i in indexes])
+    return pd.Series(sizes, index=pd.Index(tables, name="id"), name="size")
+
+
+class SeatIndexCache(LRUCache):
+    """
+    Seat indexes of a backend by series ID, evicting the least recently used ones first.
+    The backend invalidates the indexes of series once a commit modifies their tables,
+    all indexes are dropped once the shared data version differs from the one they were built at,
+    so modifications by other processes are tracked as well.
+    """
+
+    def __init__(self, maxsize: int = SEAT_INDEX_CACHE_SIZE):
+        super().__init__(maxsize)
+        self._generation = 0
+        self._data_version: int | None = None
+
+    def get_many(
+        self,
+        series_ids: Iterable[int],
+        build: Callable[[list[int]], dict[int, SeatIndex]],
+        data_version: int,
+        store: bool = True,
+    ) -> dict[int, SeatIndex]:
+        """
+        Get the indexes of many series, building all missing ones at once.
+        Indexes built while another thread invalidated any are returned, but not cached.
+
+        :param series_ids: the series to get the indexes of
+        :param build: building the indexes of the given missing series
+        :param data_version: the data version of the backend as seen by the caller's transaction
+        :param store: whether to cache the built indexes, disable for transactions with uncommitted seating changes
+        :return: the indexes by series ID
+        """
+        series_ids = [int(i) for i in series_ids]
+
+        with self._lock:
+            if data_version != self._data_version:
+                self._generation += 1
+                self._entries.clear()
+                self._data_version = data_version
+            generation = self._generation
+
+        indexes = {i: index for i in series_ids if (index := self.get(i)) is not None}
+        missing = [i for i in series_ids if i not in indexes]
+
+        if missing:
+            built = build(missing)
+            with self._lock:
+                if store and generation == self._generation:
+                    for i, index in built.items():
+                        self._entries[i] = index
+                        self._entries.move_to_end(i)
+                    self._evict()
+            indexes.update(built)
+
+        return {i: indexes[i] for i in series_ids}
+
+    def invalidate(self, series_ids: Iterable[int] | None = None, data_version: int | None = None) -> None:
+        """
+        Drop the indexes of the given series, or of all series if ``None``.
+
+        :param series_ids: the series whose tables were modified
+        :param data_version: the data version the modifying commit bumped to, the other indexes are kept
+            if they were built at the version right before it, so no other process committed in between
+        """
+        with self._lock:
+            self._generation += 1
+            if data_version is not None and self._data_version != data_version - 1:
+                self._entries.clear()
+            elif series_ids is None:
+                self._entries.clear()
+            else:
+                for i in series_ids:
+                    self._entries.pop(i, None)
+
+            if data_version is not None:
+                self._data_version = data_version
@@ -0,0 +1,388 @@
+"""
+Assignment of players to tables, optionally minimizing the pairings of players who already sat together.
+Players are handled by their position in an array of player IDs, a seating is an order of these positions,
+which is split into consecutive tables of the sizes given by :func:`table_sizes`.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+SeatingStrategy = Literal["random", "min-repeats", "candidates", "swiss"]
+"""
+Strategy to seat players with: ``"random"`` shuffles them uniformly,
+``"min-repeats"`` searches for a seating with few repeated pairings, see :func:`min_repeats_seating`,
+``"candidates"`` keeps the best of many random seatings by all objectives, see :func:`best_candidate_seating`,
+``"swiss"`` groups players of similar strength while avoiding rematches, see :func:`swiss_seating`.
+"""
+
+
+@dataclass(frozen=True)
+class SeatingObjectives:
+    """Weights of the objectives a seating is scored by, lower scores are better."""
+
+    repeats: float = 1.0
+    """Weight of each pairing of players seated together who already sat together before."""
+
+    balance: float = 0.0
+    """Weight of the standard deviation of the mean strength of the players per table."""
+
+    apart: float = 100.0
+    """Weight of each pairing of players seated together who were requested to be kept apart."""
+
+
+@dataclass(frozen=True)
+class SeatingScore:
+    """Score of a seating, with the unweighted values of the objectives."""
+
+    total: float
+    repeats: int
+    balance: float
+    apart: int
+
+
+def table_sizes(player_count: int) -> np.ndarray:
+    """
+    Sizes of the tables to seat the given count of players at, four-player tables first.
+
+    :raises ValueError: if no valid tables can be formed from the count of players
+    """
+    if player_count < 3:
+        raise ValueError("At least 3 players must be selected to create a table.")
+
+    if player_count == 5:
+        raise ValueError("It is impossible to create tables out of 5 players.")
+
+    div, mod = divmod(player_count, 4)
+    if mod == 0:
+        three_player_table_count = 0
+        four_player_table_count = div
+    else:
+        three_player_table_count = 4 - mod
+        four_player_table_count = div + 1 - three_player_table_count
+
+    return np.repeat([4, 3], [four_player_table_count, three_player_table_count])
+
+
+def co_seating_counts(seating: pd.DataFrame, player_ids: np.ndarray) -> np.ndarray:
+    """
+    Count how often each pair of the given players sat at the same table.
+
+    :param seating: the ``table_id`` of seated players with a ``player_id`` column or index level,
+        see :meth:`TablesTable.seating`
+    :param player_ids: the IDs of the players to count pairings of
+    :return: a symmetric matrix of the pairing counts by position in ``player_ids``, with zero diagonal
+    """
+    n = len(player_ids)
+    links = seating.reset_index()[["table_id", "player_id"]]
+    links = links.assign(position=pd.Index(player_ids).get_indexer(links["player_id"]))
+    links = links[links["position"] >= 0]
+
+    pairs = links.merge(links, on="table_id")
+    flat = pairs["position_x"].to_numpy() * n + pairs["position_y"].to_numpy()
+    counts = np.bincount(flat, minlength=n * n).reshape(n, n)
+
+    np.fill_diagonal(counts, 0)
+    return counts
+
+
+def repeat_pairings(order: np.ndarray, sizes: np.ndarray, counts: np.ndarray) -> int:
+    """Get the count of previous pairings of all players seated together in a seating."""
+    table_of = np.empty(len(order), dtype=np.intp)
+    table_of[order] = np.repeat(np.arange(len(sizes)), sizes)
+    same_table = table_of[:, None] == table_of[None, :]
+    return int(counts[same_table].sum() // 2)
+
+
+def min_repeats_seating(
+    counts: np.ndarray, sizes: np.ndarray, rng: np.random.Generator, max_swaps: int | None = None
+) -> np.ndarray:
+    """
+    Search a seating with few repeated pairings by local search from a random seating.
+    In each step, the swap of two players at different tables reducing the repeats most is applied,
+    with the gains of all swaps computed at once from the pairing counts per player and table,
+    until no swap reduces them anymore.
+
+    :param counts: the pairing counts of the players, see :func:`co_seating_counts`
+    :param sizes: the sizes of the tables, see :func:`table_sizes`
+    :param rng: the random generator to draw the initial seating from
+    :param max_swaps: maximum count of swaps to apply, twice the count of players if ``None``
+    :return: the seating as order of player positions
+    """
+    return _swap_seating(counts, sizes, rng.permutation(len(counts)), max_swaps)
+
+
+def swiss_seating(
+    strengths: np.ndarray, counts: np.ndarray, sizes: np.ndarray, rng: np.random.Generator, max_swaps: int | None = None
+) -> np.ndarray:
+    """
+    Seat players of similar strength together like in a Swiss-system tournament, the strongest at the first tables.
+    Repeated pairings are then reduced like in :func:`min_repeats_seating`,
+    moving players to the tables next to the one of their rank first,
+    and further away only once no swap between closer tables reduces the repeats anymore.
+
+    :param strengths: the strength of each player, ties are broken randomly
+    :param counts: the pairing counts of the players, see :func:`co_seating_counts`
+    :param sizes: the sizes of the tables, see :func:`table_sizes`
+    :param rng: the random generator to break ties with
+    :param max_swaps: maximum count of swaps to apply, twice the count of players if ``None``
+    :return: the seating as order of player positions
+    """
+    order = np.lexsort((rng.random(len(strengths)), -strengths))
+    return _swap_seating(counts, sizes, order, max_swaps, max_shift=1)
+
+
+def _swap_seating(
+    counts: np.ndarray, sizes: np.ndarray, order: np.ndarray, max_swaps: int | None, max_shift: int | None = None
+) -> np.ndarray:
+    n = len(counts)
+    counts = counts.astype(np.float32)
+    twice_counts = 2 * counts
+    table_of = np.empty(n, dtype=np.intp)
+    table_of[order] = np.repeat(np.arange(len(sizes)), sizes)
+    initial_table_of = table_of.copy()
+
+    # pairings of each player with the players of each table
+    at_table = counts @ np.eye(len(sizes), dtype=np.float32)[table_of]
+
+    for _ in range(2 * n if max_swaps is None else max_swaps):
+        own = at_table[np.arange(n), table_of]
+        cross = at_table[:, table_of]
+        gain = twice_counts - cross
+        gain -= cross.T
+        gain += own[:, None]
+        gain += own[None, :]
+        gain[table_of[:, None] == table_of[None, :]] = 0
+
+        if max_shift is not None:
+            # swapping p and q moves p to the table of q and vice versa
+            distance = np.abs(initial_table_of[:, None] - table_of[None, :])
+            shift = np.maximum(distance, distance.T)
+            improving = gain > 0
+            if not improving.any():
+                break
+
+            # widen the shift only as far as needed to reduce the repeats any further
+            max_shift = max(max_shift, int(shift[improving].min()))
+            gain[shift > max_shift] = 0
+
+        p, q = np.unravel_index(np.argmax(gain), gain.shape)
+        if gain[p, q] <= 0:
+            break
+
+        a, b = table_of[p], table_of[q]
+        at_table[:, a] += counts[:, q] - counts[:, p]
+        at_table[:, b] += counts[:, p] - counts[:, q]
+        table_of[p], table_of[q] = b, a
+
+    return np.argsort(table_of, kind="stable")
+
+
+def table_pair_sums(orders: np.ndarray, sizes: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """
+    Sum a player x player matrix over all pairs of players seated together, for many seatings at once.
+
+    :param orders: the seatings as array of candidates x player positions
+    :param sizes: the sizes of the tables, four-player tables first, see :func:`table_sizes`
+    :param matrix: a symmetric matrix by player positions
+    :return: the sum per candidate
+    """
+    sums = np.zeros(len(orders), dtype=matrix.dtype)
+
+    for size, tables in _table_blocks(orders, sizes):
+        for i in range(size):
+            for j in range(i + 1, size):
+                sums += matrix[tables[..., i], tables[..., j]].sum(axis=1)
+
+    return sums
+
+
+def table_strength_deviation(orders: np.ndarray, sizes: np.ndarray, strengths: np.ndarray) -> np.ndarray:
+    """Standard deviation of the mean strength of the players per table, for many seatings at once."""
+    means = [strengths[tables].mean(axis=2) for _, tables in _table_blocks(orders, sizes)]
+    return np.concatenate(means, axis=1).std(axis=1)
+
+
+def _table_blocks(orders: np.ndarray, sizes: np.ndarray) -> Iterator[tuple[int, np.ndarray]]:
+    """Split seatings into blocks of tables of the same size, as arrays of candidates x tables x seats."""
+    start = 0
+
+    for size in dict.fromkeys(sizes.tolist()):
+        count = int((sizes == size).sum())
+        yield size, orders[:, start : start + size * count].reshape(len(orders), count, size)
+        start += size * count
+
+
+def score_seatings(
+    orders: np.ndarray,
+    sizes: np.ndarray,
+    objectives: SeatingObjectives,
+    counts: np.ndarray,
+    strengths: np.ndarray | None = None,
+    apart: np.ndarray | None = None,
+) -> pd.DataFrame:
+    """
+    Score many seatings at once by the weighted sum of the objectives.
+
+    :param orders: the seatings as array of candidates x player positions
+    :param sizes: the sizes of the tables, four-player tables first, see :func:`table_sizes`
+    :param objectives: the weights of the objectives
+    :param counts: the previous pairing counts of the players, see :func:`co_seating_counts`
+    :param strengths: the strength of each player, required if the ``balance`` objective is weighted
+    :param apart: matrix of the pairs of players to keep apart, see :func:`apart_matrix`
+    :return: a data-frame of the ``total`` score and the unweighted objectives per candidate
+    """
+    scores = pd.DataFrame(
+        dict(
+            repeats=table_pair_sums(orders, sizes, counts),
+            balance=0.0 if strengths is None else table_strength_deviation(orders, sizes, strengths),
+            apart=0 if apart is None else table_pair_sums(orders, sizes, apart),
+        )
+    )
+    scores.insert(
+        0,
+        "total",
+        objectives.repeats * scores["repeats"]
+        + objectives.balance * scores["balance"]
+        + objectives.apart * scores["apart"],
+    )
+    return scores
+
+
+def apart_matrix(player_ids: np.ndarray, pairs: Iterable[tuple[int, int]]) -> np.ndarray:
+    """Matrix by player positions marking the pairs of player IDs to keep apart, pairs of absent players are ignored."""
+    n = len(player_ids)
+    matrix = np.zeros((n, n), dtype=np.int32)
+    positions = pd.Index(player_ids).get_indexer(np.asarray(list(pairs), dtype=np.int64).reshape(-1))
+    positions = positions.reshape(-1, 2)
+    positions = positions[(positions >= 0).all(axis=1) & (positions[:, 0] != positions[:, 1])]
+
+    matrix[positions[:, 0], positions[:, 1]] = 1
+    matrix[positions[:, 1], positions[:, 0]] = 1
+    return matrix
+
+
+def best_candidate_seating(
+    player_count: int,
+    candidates: int,
+    rng: np.random.Generator,
+    score: Callable[[np.ndarray], pd.DataFrame],
+) -> np.ndarray:
+    """
+    Draw many random seatings as one array of candidates x player positions and keep the best scored one.
+
+    :param player_count: the count of players to seat
+    :param candidates: the count of random seatings to draw
+    :param rng: the random generator to draw the seatings from
+    :param score: scoring all candidates at once, see :func:`score_seatings`
+    :return: the best seating as order of player positions
+    """
+    orders = np.argsort(rng.random((candidates, player_count)), axis=1)
+    return orders[np.argmin(score(orders)["total"].to_numpy())]
+
+
+def seat_players(
+    player_ids: np.ndarray,
+    strategy: SeatingStrategy = "random",
+    seating: pd.DataFrame | None = None,
+    rng: np.random.Generator | None = None,
+    objectives: SeatingObjectives = SeatingObjectives(),
+    strengths: pd.Series | None = None,
+    apart: Iterable[tuple[int, int]] = (),
+    candidates: int = 1000,
+    counts: np.ndarray | None = None,
+) -> tuple[list[np.ndarray], SeatingScore]:
+    """
+    Assign players to tables.
+
+    :param player_ids: the IDs of the players to seat
+    :param strategy: the strategy to seat players with
+    :param seating: the previous seating of players to avoid repeating, see :meth:`TablesTable.seating`
+    :param rng: the random generator to use, a freshly seeded one if ``None``
+    :param objectives: the weights of the objectives to score seatings by
+    :param strengths: the strength of players indexed on player ID, players missing get the mean strength
+    :param apart: pairs of player IDs to keep apart
+    :param candidates: the count of seatings to draw for the ``"candidates"`` strategy
+    :param counts: the previous pairing counts of the players, see :func:`co_seating_counts`,
+        computed from ``seating`` if ``None``
+    :return: the player IDs per table and the score of the seating
+    """
+    rng = rng or np.random.default_rng()
+    sizes = table_sizes(len(player_ids))
+
+    if counts is None:
+        counts = (
+            co_seating_counts(seating, player_ids) if seating is not None else np.zeros((len(player_ids),) * 2, int)
+        )
+    apart_pairs = apart_matrix(player_ids, apart)
+    player_strengths = None
+    if strengths is not None and not strengths.empty:
+        player_strengths = strengths.reindex(player_ids).fillna(strengths.mean()).to_numpy(dtype=float)
+
+    def score(orders: np.ndarray) -> pd.DataFrame:
+        return score_seatings(orders, sizes, objectives, counts, player_strengths, apart_pairs)
+
+    if strategy == "random":
+        order = rng.permutation(len(player_ids))
+    elif strategy == "min-repeats":
+        order = min_repeats_seating(counts + objectives.apart * apart_pairs, sizes, rng)
+    elif strategy == "candidates":
+        order = best_candidate_seating(len(player_ids), candidates, rng, score)
+    elif strategy == "swiss":
+        swiss_strengths = np.zeros(len(player_ids)) if player_strengths is None else player_strengths
+        order = swiss_seating(swiss_strengths, counts + objectives.apart * apart_pairs, sizes, rng)
+    else:
+        raise ValueError(f"Unknown seating strategy {strategy}.")
+
+    chosen = score(order[None, :]).iloc[0]
+    chosen_score = SeatingScore(
+        total=float(chosen["total"]),
+        repeats=int(chosen["repeats"]),
+        balance=float(chosen["balance"]),
+        apart=int(chosen["apart"]),
+    )
+
+    ends = np.cumsum(sizes)
+    return np.split(player_ids[order], ends[:-1]), chosen_score
+
+
+def seat_rounds(
+    player_ids: np.ndarray,
+    rounds: int,
+    strategy: SeatingStrategy = "swiss",
+    seating: pd.DataFrame | None = None,
+    rng: np.random.Generator | None = None,
+    objectives: SeatingObjectives = SeatingObjectives(),
+    strengths: pd.Series | None = None,
+    apart: Iterable[tuple[int, int]] = (),
+    candidates: int = 1000,
+) -> list[tuple[list[np.ndarray], SeatingScore]]:
+    """
+    Assign players to tables for consecutive rounds, see :func:`seat_players`.
+    The pairing counts are computed once from the previous seating
+    and updated with the tables of each round, so later rounds avoid the pairings of earlier ones.
+
+    :param rounds: the count of rounds to seat players for
+    :return: the player IDs per table and the score of the seating of each round
+    """
+    rng = rng or np.random.default_rng()
+    counts = co_seating_counts(seating, player_ids) if seating is not None else np.zeros((len(player_ids),) * 2, int)
+    positions = pd.Index(player_ids)
+    seated = []
+
+    for _ in range(rounds):
+        tables, score = seat_players(
+            player_ids, strategy, None, rng, objectives, strengths, apart, candidates, counts=counts
+        )
+
+        for table in tables:
+            at_table = positions.get_indexer(table)
+            counts[np.ix_(at_table, at_table)] += 1
+        np.fill_diagonal(counts, 0)
+
+        seated.append((tables, score))
+
+    return seated
@@ -1,12 +1,21 @@
 from datetime import datetime
 
-from .data_model import Series
-from sqlmodel import select, Session
+from .bulk import Rows, to_records, insert_records, update_records, upsert_records
+import pandas as pd
+
+from .data_model import Series, Table, LoadingStrategy, load_eagerly, model_dtypes, read_pandas
+from .seat_index import mark_seating_modified
+from sqlmodel import func, select, Session
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .backend import Backend
 
 
 class SeriesTable:
-    def __init__(self, session: Session):
+    def __init__(self, backend: "Backend", session: Session):
         self._session = session
+        self._backend = backend
 
     def add(
         self,
@@ -45,13 +54,53 @@ class SeriesTable:
             series.remarks = remarks
 
         self._session.add(series)
+        self._backend.evaluations(self._session).mark_modified()
         self._session.commit()
         self._session.refresh(series)
         return series
 
+    def add_many(self, series: Rows) -> list[int]:
+        """
+        Add many series to the database in one transaction.
+        All rows are validated before any is inserted.
+
+        :param series: rows holding the fields of :class:`Series`, missing fields get their defaults
+        :return: the IDs of the added series in order
+        """
+        ids = insert_records(self._session, Series, to_records(series))
+        self._session.commit()
+        return [i for i, in ids]
+
+    def update_many(self, series: Rows) -> list[int]:
+        """
+        Update many existing series in the database in one transaction.
+        Only the fields given in a row are updated, all rows are validated before any is updated.
+
+        :param series: rows holding the ``id`` and the fields to update
+        :return: the IDs of the updated series in order
+        """
+        ids = [i for i, in update_records(self._session, Series, to_records(series), raise_series_not_found)]
+        self._backend.evaluations(self._session).mark_modified()
+        self._session.commit()
+        return ids
+
+    def upsert_many(self, series: Rows) -> list[int]:
+        """
+        Update the series whose ``id`` exists and add all others in one transaction.
+
+        :param series: rows holding the fields of :class:`Series`
+        :return: the IDs of all series in order
+        """
+        keys, _ = upsert_records(self._session, Series, to_records(series))
+        self._backend.evaluations(self._session).mark_modified()
+        self._session.commit()
+        return [i for i, in keys]
+
     def remove(self, id: int) -> None:
         """Remove a series from the database."""
         series = self._session.get(Series, id) or raise_series_not_found(id)
+        self._backend.evaluations(self._session).mark_dirty(id)
+        mark_seating_modified(self._session, id)
         self._session.delete(series)
         self._session.commit()
 
@@ -60,11 +109,24 @@ class SeriesTable:
         series = self._session.get(Series, id)
         return series or raise_series_not_found(id)
 
-    def all(self) -> list[Series]:
-        """Get a list of all series in the database."""
-        series = self._session.exec(select(Series)).all()
+    def all(self, loading: LoadingStrategy = "selectin") -> list[Series]:
+        """
+        Get a list of all series in the database.
+
+        :param loading: strategy to load the tables of the series and their players with, lazily if ``None``
+        """
+        selector = load_eagerly(select(Series), loading, (Series.tables, Table.players))
+        series = self._session.exec(selector).unique().all()
         return list(series)
 
+    def count(self) -> int:
+        """Get the count of series in the database."""
+        return self._session.exec(select(func.count()).select_from(Series)).one()
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Get all series in the database as data-frame indexed on ``id``, loaded without ORM overhead."""
+        return read_pandas(self._session, select(*Series.__table__.columns), "id", model_dtypes(Series))
+
 
 def raise_series_not_found(id: int):
     raise KeyError(f"A series with the given ID {id} was not found.")
@@ -0,0 +1,351 @@
+"""
+Columnar snapshots of a tournament database as a directory of Parquet or Feather files, one per table.
+Snapshots can be imported into a database again, or analysed directly through the read-only :class:`SnapshotBackend`,
+which loads the files into memory, so heavy analytics never touch the live database.
+"""
+
+import json
+from contextlib import nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Literal
+
+import pandas as pd
+from sqlalchemy import delete, func, insert, text
+from sqlmodel import SQLModel, Session, select
+
+from ..__about__ import VERSION
+from .backend import Backend
+from .bulk import primary_key
+from .evaluations_table import EvaluationsTable
+from .data_model import (
+    Player,
+    Result,
+    Series,
+    SeriesEvaluation,
+    SeriesFilter,
+    StandingsSeries,
+    StandingsTotal,
+    Table,
+    TablePlayerLink,
+    model_dtypes,
+    read_pandas,
+)
+from .player_table import raise_player_not_found
+from .seat_index import SeatIndex, build_seat_indexes, mark_seating_modified, table_sizes_series
+from .series_table import raise_series_not_found
+
+SnapshotFormat = Literal["parquet", "feather"]
+
+SNAPSHOT_TABLES: dict[str, type[SQLModel]] = dict(
+    players=Player,
+    series=Series,
+    tables=Table,
+    links=TablePlayerLink,
+    results=Result,
+)
+"""Models stored in a snapshot by file name, in the order they are imported."""
+
+MANIFEST_FILE = "snapshot.json"
+
+
+def export_snapshot(session: Session, directory: Path, format: SnapshotFormat = "parquet") -> dict[str, int]:
+    """
+    Write all players, series, tables, table-player links and results to a directory, one file per table.
+    The data is read in one transaction, so the snapshot is consistent.
+
+    :param session: the database session to use
+    :param directory: the directory to write to, created if missing
+    :param format: the file format, Parquet is compressed, Feather can be memory-mapped without decoding
+    :return: the count of rows written per table
+    """
+    pyarrow, feather, parquet = _import_pyarrow()
+    directory.mkdir(parents=True, exist_ok=True)
+    counts = {}
+
+    for name, model_type in SNAPSHOT_TABLES.items():
+        selector = select(*model_type.__table__.columns)
+        df = read_pandas(session, selector, primary_key(model_type), model_dtypes(model_type)).reset_index()
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+
+        if format == "feather":
+            feather.write_feather(table, directory / f"{name}.feather", compression="uncompressed")
+        else:
+            parquet.write_table(table, directory / f"{name}.parquet")
+
+        counts[name] = len(df)
+
+    manifest = dict(version=VERSION, format=format, created=datetime.now().isoformat(), counts=counts)
+    (directory / MANIFEST_FILE).write_text(json.dumps(manifest, indent=4))
+    return counts
+
+
+def import_snapshot(session: Session, directory: Path, replace: bool = False) -> dict[str, int]:
+    """
+    Insert all rows of a snapshot with their original IDs in the session's transaction.
+    Stored evaluations are dropped, as they may not match the imported data.
+    Changes are not committed, this is left to the caller.
+
+    :param session: the database session to use
+    :param directory: the snapshot directory
+    :param replace: delete all existing data first, otherwise the database must be empty
+    :return: the count of rows imported per table
+    :raises ValueError: if the database is not empty and ``replace`` is not set
+    """
+    frames = load_snapshot(directory)
+    connection = session.connection()
+
+    if replace:
+        for model_type in [SeriesEvaluation, StandingsTotal, StandingsSeries, *reversed(SNAPSHOT_TABLES.values())]:
+            connection.execute(delete(model_type))
+    else:
+        for name, model_type in SNAPSHOT_TABLES.items():
+            if connection.execute(select(func.count()).select_from(model_type)).scalar_one():
+                raise ValueError(f"The database already contains {name}, import with replace to overwrite them.")
+
+    for name, model_type in SNAPSHOT_TABLES.items():
+        records = frames[name].reset_index().to_dict("records")
+        if records:
+            connection.execute(insert(model_type), records)
+
+    if connection.dialect.name == "postgresql":
+        # explicit IDs do not advance the sequences generating new ones
+        for model_type in [Player, Series, Table]:
+            table_name = model_type.__tablename__
+            sequence = f"pg_get_serial_sequence('{table_name}', 'id')"
+            connection.execute(text(f"SELECT setval({sequence}, COALESCE(MAX(id), 1)) FROM {table_name}"))
+
+    EvaluationsTable(session).mark_modified()
+    mark_seating_modified(session)
+    return {name: len(df) for name, df in frames.items()}
+
+
+def load_snapshot(directory: Path) -> dict[str, pd.DataFrame]:
+    """
+    Load the frames of a snapshot into memory.
+    Each frame is indexed on the primary key of its table and has the dtypes of :func:`model_dtypes`.
+    The data is copied once into pandas: Feather files are memory-mapped instead of read into Arrow buffers,
+    Arrow buffers are released column by column while converting, and only columns with other dtypes are cast.
+    Evaluations run on these in-memory frames, not on the mapped files, as the hooks need numpy-backed columns
+    of the model dtypes and the record batches of a file are concatenated into one array per column anyway.
+    """
+    _, feather, parquet = _import_pyarrow()
+    frames = {}
+
+    for name, model_type in SNAPSHOT_TABLES.items():
+        if (path := directory / f"{name}.feather").exists():
+            table = feather.read_table(path, memory_map=True)
+        elif (path := directory / f"{name}.parquet").exists():
+            table = parquet.read_table(path)
+        else:
+            raise FileNotFoundError(f"The snapshot in {directory} has no file for {name}.")
+
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+
+        dtypes = model_dtypes(model_type)
+        df = df.astype({c: t for c, t in dtypes.items() if df[c].dtype != t})
+        frames[name] = df.set_index(primary_key(model_type)).sort_index()
+
+    return frames
+
+
+class SnapshotBackend(Backend):
+    """
+    Read-only backend serving the data of a snapshot directory instead of a database.
+    The snapshot is loaded into memory once on construction, see :func:`load_snapshot`.
+    Supports evaluation with the pandas engine in one process, reports and plots.
+    Sessions are ``None``, so plugins querying the session directly are not supported.
+    """
+
+    def __init__(self, directory: Path, result_cache_size: int = 32):
+        """
+        :param directory: the snapshot directory, see :func:`export_snapshot`
+        :param result_cache_size: maximum count of evaluation results held in :attr:`result_cache`
+        """
+        self._setup(result_cache_size, None, None)
+        self.directory = directory
+        self.frames = load_snapshot(directory)
+
+    @property
+    def data_version(self) -> int:
+        """Snapshots are read-only, so their data version never changes."""
+        return 0
+
+    def bump_data_version(self) -> None:
+        self.result_cache.clear()
+
+    def get_session(self):
+        return nullcontext()
+
+    def configure_pool(self, pool) -> None:
+        self.pool = pool
+
+    def fake_data(self, *args, **kwargs):
+        raise TypeError("Snapshots are read-only.")
+
+    def players(self, session=None) -> "SnapshotPlayersTable":
+        """Table of players."""
+        return SnapshotPlayersTable(self.frames)
+
+    def results(self, session=None) -> "SnapshotResultsTable":
+        """Table of game results."""
+        return SnapshotResultsTable(self.frames)
+
+    def series(self, session=None) -> "SnapshotSeriesTable":
+        """Table of game series."""
+        return SnapshotSeriesTable(self.frames)
+
+    def tables(self, session=None) -> "SnapshotTablesTable":
+        """Table of series-player-table mappings."""
+        return SnapshotTablesTable(self.frames)
+
+    @staticmethod
+    def evaluations(session=None) -> "SnapshotEvaluationsTable":
+        """Table of stored series evaluations, which are never stored for snapshots."""
+        return SnapshotEvaluationsTable()
+
+
+class SnapshotPlayersTable:
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        self._frames = frames
+
+    def get(self, id: int) -> Player:
+        """Get a player from the snapshot."""
+        if id not in self._frames["players"].index:
+            raise_player_not_found(id)
+        return Player(id=id, **self._frames["players"].loc[id])
+
+    def all(self, loading=None) -> list[Player]:
+        """Get a list of all players in the snapshot, without relationships."""
+        return [Player(id=i, **r) for i, r in self._frames["players"].iterrows()]
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Get all players in the snapshot as data-frame indexed on ``id``."""
+        return self._frames["players"].copy()
+
+
+class SnapshotSeriesTable:
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        self._frames = frames
+
+    def get(self, id: int) -> Series:
+        """Get a series from the snapshot."""
+        if id not in self._frames["series"].index:
+            raise_series_not_found(id)
+        return Series(id=id, **self._frames["series"].loc[id])
+
+    def all(self, loading=None) -> list[Series]:
+        """Get a list of all series in the snapshot, without relationships."""
+        return [Series(id=i, **r) for i, r in self._frames["series"].iterrows()]
+
+    def count(self) -> int:
+        """Get the count of series in the snapshot."""
+        return len(self._frames["series"])
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Get all series in the snapshot as data-frame indexed on ``id``."""
+        return self._frames["series"].copy()
+
+
+class SnapshotTablesTable:
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        self._frames = frames
+
+    def to_pandas(self, series_id: SeriesFilter = None) -> pd.DataFrame:
+        """
+        Get the tables as data-frame indexed on ``id``.
+
+        :param series_id: restrict to the tables of this series or these series, or get all tables if ``None``
+        """
+        tables = self._frames["tables"]
+        return tables[_series_mask(tables["series_id"], series_id)].copy()
+
+    def seating(self, series_id: SeriesFilter = None) -> pd.DataFrame:
+        """
+        Get the mapping of players to the tables they are seated at.
+
+        :param series_id: restrict to the tables of this series or these series, or get all tables if ``None``
+        :return: a data-frame indexed on ``series_id`` and ``player_id`` holding the ``table_id``
+        """
+        links = self._frames["links"].reset_index()
+        links["series_id"] = self._frames["tables"]["series_id"].reindex(links["table_id"]).to_numpy()
+        seating = links[_series_mask(links["series_id"], series_id)].set_index(["series_id", "player_id"])
+        return seating[["table_id"]].sort_index()
+
+    def seat_index(self, series_id: int) -> SeatIndex:
+        """Get the seat index of a series, see :meth:`seat_indexes`."""
+        return self.seat_indexes([series_id])[series_id]
+
+    def seat_indexes(self, series_ids: Iterable[int]) -> dict[int, SeatIndex]:
+        """Build the seat indexes of many series from the snapshot, see :meth:`TablesTable.seat_indexes`."""
+        series_ids = [int(i) for i in series_ids]
+        tables = self._frames["tables"]
+        tables = tables.loc[tables["series_id"].isin(series_ids), ["series_id"]].rename_axis("table_id").reset_index()
+        links = tables.merge(self._frames["links"].reset_index(), on="table_id", how="left")
+        return build_seat_indexes(series_ids, links)
+
+    def sizes(self, series_ids: Iterable[int]) -> pd.Series:
+        """Get the count of players seated at each table of many series, see :meth:`TablesTable.sizes`."""
+        return table_sizes_series(self.seat_indexes(series_ids).values())
+
+
+class SnapshotResultsTable:
+    def __init__(self, frames: dict[str, pd.DataFrame]):
+        self._frames = frames
+
+    def all_with_table_ids(self, series_id: SeriesFilter = None) -> pd.DataFrame:
+        """
+        Get the results joined with the ID of the table the respective player was seated at.
+        Results of players not seated at any table of the series get a missing table ID.
+
+        :param series_id: restrict to the results of this series or these series, or get all results if ``None``
+        :return: a data-frame indexed on ``series_id`` and ``player_id``
+        """
+        seating = SnapshotTablesTable(self._frames).seating(series_id)
+        results = self.to_pandas(series_id)
+        results["table_id"] = seating["table_id"].reindex(results.index).astype("Int64")
+        return results
+
+    def to_pandas(self, series_id: SeriesFilter = None) -> pd.DataFrame:
+        """
+        Get the results as data-frame indexed on ``series_id`` and ``player_id``.
+
+        :param series_id: restrict to the results of this series or these series, or get all results if ``None``
+        """
+        results = self._frames["results"]
+        return results[_series_mask(results.index.get_level_values("series_id"), series_id)].copy()
+
+    def series_ids(self) -> list[int]:
+        """Get the IDs of all series with results in ascending order."""
+        return self._frames["results"].index.unique("series_id").sort_values().tolist()
+
+
+class SnapshotEvaluationsTable:
+    """Evaluations store of snapshots, which never holds evaluations, as the result cache suffices for them."""
+
+    def get_many(self, series_ids, key: str) -> dict[int, pd.DataFrame]:
+        return {}
+
+    def store_many(self, results: pd.DataFrame, key: str) -> None:
+        pass
+
+
+def _series_mask(series_ids: pd.Series | pd.Index, series_id: SeriesFilter):
+    if series_id is None:
+        return slice(None)
+    if isinstance(series_id, Iterable):
+        return series_ids.isin([int(i) for i in series_id])
+    return series_ids == int(series_id)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        from pyarrow import feather, parquet
+    except ImportError as e:
+        raise ImportError(
+            "Need the pyarrow package to read and write snapshots. It may be installed with the [snapshot] extra."
+        ) from e
+
+    return pyarrow, feather, parquet
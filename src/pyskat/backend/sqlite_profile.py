@@ -0,0 +1,53 @@
+from dataclasses import dataclass, asdict
+
+from sqlalchemy import Engine, event
+
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    """
+    Pragmas applied to every new SQLite connection.
+    The defaults favor concurrent readers and throughput over durability of the very last transactions on power loss.
+    """
+
+    journal_mode: str = "WAL"
+    """Write-ahead logging lets readers proceed while a writer commits."""
+
+    synchronous: str = "NORMAL"
+    """Sync only at checkpoints instead of on every commit, which is safe in WAL mode."""
+
+    mmap_size: int = 256 * 1024 * 1024
+    """Bytes of the database file to access through memory mapping."""
+
+    cache_size: int = -64 * 1024
+    """Page cache size, in pages if positive or in KiB if negative."""
+
+    temp_store: str = "MEMORY"
+    """Keep temporary tables and indices in memory."""
+
+    busy_timeout: int = 5000
+    """Milliseconds to wait for a lock held by another connection before failing."""
+
+    def pragmas(self) -> dict[str, str | int]:
+        return asdict(self)
+
+    def apply(self, engine: Engine) -> None:
+        """Register the pragmas to be executed on each new connection of the engine."""
+        if engine.dialect.name != "sqlite":
+            raise ValueError(f"SQLite profiles can not be applied to {engine.dialect.name} databases.")
+
+        pragmas = self.pragmas()
+
+        @event.listens_for(engine, "connect")
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+            cursor.close()
+
+
+SQLITE_PROFILES: dict[str, SQLiteProfile | None] = {
+    "default": None,
+    "performance": SQLiteProfile(),
+}
+"""Named SQLite profiles, ``default`` leaves SQLite's defaults untouched."""
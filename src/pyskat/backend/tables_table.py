@@ -1,9 +1,33 @@
 import numpy as np
+import pandas as pd
 
+from sqlalchemy import insert, delete
+
+from .bulk import Rows, to_records, insert_records, update_records, upsert_records
 from .player_table import raise_player_not_found
-from .data_model import Table, Player, TablePlayerLink, to_pandas
+from .seat_index import (
+    SEATING_MODIFIED_INFO_KEY,
+    SeatIndex,
+    build_seat_indexes,
+    mark_seating_modified,
+    table_sizes_series,
+)
+from .seating import SeatingObjectives, SeatingScore, SeatingStrategy, seat_players, seat_rounds
+from .data_model import (
+    Table,
+    Player,
+    Series,
+    TablePlayerLink,
+    SeriesFilter,
+    LoadingStrategy,
+    filter_series,
+    load_eagerly,
+    model_dtypes,
+    read_data_version,
+    read_pandas,
+)
 from sqlmodel import select, col, Session
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
 if TYPE_CHECKING:
     from .backend import Backend
@@ -44,10 +68,120 @@ class TablesTable:
             players=list(self._get_table_players(player1_id, player2_id, player3_id, player4_id)),
         )
         self._session.add(table)
+        self._mark_dirty(series_id)
         self._session.commit()
         self._session.refresh(table)
         return table
 
+    def add_many(self, tables: Rows) -> list[int]:
+        """
+        Add many tables with their players to the database in one transaction.
+        All rows are validated before any is inserted.
+
+        :param tables: rows holding the fields of :class:`Table` and the IDs of the seated players,
+            either as ``player1_id`` to ``player4_id`` or as list in ``player_ids``
+        :return: the IDs of the added tables in order
+        """
+        records = to_records(tables)
+        players = self._pop_player_ids(records)
+
+        ids = [i for i, in insert_records(self._session, Table, records)]
+        self._replace_links(ids, players)
+
+        self._mark_dirty(*{r["series_id"] for r in records})
+        self._session.commit()
+        return ids
+
+    def update_many(self, tables: Rows) -> list[int]:
+        """
+        Update many existing tables in the database in one transaction.
+        Only the fields given in a row are updated, all rows are validated before any is updated.
+        If players are given in a row, they replace all players of the table.
+
+        :param tables: rows holding the ``id`` and the fields to update, see :meth:`add_many`
+        :return: the IDs of the updated tables in order
+        """
+        records = to_records(tables)
+        players = self._pop_player_ids(records)
+        previous_series_ids = self._series_ids_of(r["id"] for r in records if "id" in r)
+
+        ids = [i for i, in update_records(self._session, Table, records, raise_table_not_found)]
+        self._replace_links(ids, players)
+
+        self._mark_dirty(
+            *previous_series_ids, *{r["series_id"] for r in records if "series_id" in r}
+        )
+        self._session.commit()
+        return ids
+
+    def upsert_many(self, tables: Rows) -> list[int]:
+        """
+        Update the tables whose ``id`` exists and add all others in one transaction.
+        If players are given in a row, they replace all players of the table.
+
+        :param tables: rows holding the fields of :class:`Table` and the IDs of the seated players,
+            see :meth:`add_many`
+        :return: the IDs of all tables in order
+        """
+        records = to_records(tables)
+        players = self._pop_player_ids(records)
+        previous_series_ids = self._series_ids_of(r["id"] for r in records if "id" in r)
+
+        keys, _ = upsert_records(self._session, Table, records)
+        ids = [i for i, in keys]
+        self._replace_links(ids, players)
+
+        self._mark_dirty(
+            *previous_series_ids, *{r["series_id"] for r in records if "series_id" in r}
+        )
+        self._session.commit()
+        return ids
+
+    def _pop_player_ids(self, records: list[dict]) -> list[list[int] | None]:
+        """Remove the player IDs from the records and check that all players exist with one query."""
+        players = []
+
+        for r in records:
+            positional = [r.pop(c) for c in ["player1_id", "player2_id", "player3_id", "player4_id"] if c in r]
+            player_ids = r.pop("player_ids", None)
+            player_ids = positional or (None if player_ids is None else list(player_ids))
+
+            if player_ids is not None and len(player_ids) not in (3, 4):
+                raise ValueError(f"A table must have 3 or 4 players, but got {player_ids}.")
+
+            players.append(None if player_ids is None else [int(p) for p in player_ids])
+
+        requested = {p for player_ids in players if player_ids for p in player_ids}
+        existing = set(self._session.exec(select(Player.id).where(col(Player.id).in_(requested))))
+        for player_id in sorted(requested - existing):
+            raise_player_not_found(player_id)
+
+        return players
+
+    def _replace_links(self, table_ids: list[int], players: list[list[int] | None]) -> None:
+        """Replace the players of the tables for which player IDs are given, with one statement each for all tables."""
+        seated = {t: p for t, p in zip(table_ids, players) if p is not None}
+        if not seated:
+            return
+
+        self._session.connection().execute(delete(TablePlayerLink).where(col(TablePlayerLink.table_id).in_(seated)))
+        self._insert_links(list(seated), list(seated.values()))
+
+    def _insert_links(self, table_ids: list[int], players: list[list[int]]) -> None:
+        """Seat the players at the tables with one statement for all tables."""
+        self._session.connection().execute(
+            insert(TablePlayerLink), [dict(table_id=t, player_id=p) for t, ps in zip(table_ids, players) for p in ps]
+        )
+
+    def _mark_dirty(self, *series_ids: int) -> None:
+        """Mark the series as dirty and invalidate their seat indexes once committed."""
+        if series_ids:
+            self._backend.evaluations(self._session).mark_dirty(*series_ids)
+            mark_seating_modified(self._session, *series_ids)
+
+    def _series_ids_of(self, table_ids) -> set[int]:
+        return set(self._session.exec(select(Table.series_id).where(col(Table.id).in_(list(table_ids)))))
+
     def update(
         self,
         id: int,
@@ -60,6 +194,7 @@ class TablesTable:
     ) -> Table:
         """Update an existing table in the database."""
         table = self._session.get(Table, id) or raise_table_not_found(id)
+        self._mark_dirty(table.series_id)
 
         if series_id is not None:
             table.series_id = series_id
@@ -84,6 +219,7 @@ class TablesTable:
             table.remarks = remarks
 
         self._session.add(table)
+        self._mark_dirty(table.series_id)
         self._session.commit()
         self._session.refresh(table)
         return table
@@ -93,7 +229,8 @@ class TablesTable:
         id: int,
     ) -> None:
         """Remove a table from the database."""
-        table = self._session.get(Player, id) or raise_table_not_found(id)
+        table = self._session.get(Table, id) or raise_table_not_found(id)
+        self._mark_dirty(table.series_id)
         self._session.delete(table)
         self._session.commit()
 
@@ -110,18 +247,76 @@ class TablesTable:
         tables = self._session.exec(select(Table)).all()
         return list(tables)
 
-    def all_for_series(self, series_id: int) -> list[Table]:
-        """Get all the tables for a defined series in the database."""
-        tables = self._session.exec(select(Table).where(Table.series_id == series_id)).all()
+    def all_for_series(self, series_id: SeriesFilter, loading: LoadingStrategy = "selectin") -> list[Table]:
+        """
+        Get all the tables for a defined series or multiple series in the database.
+
+        :param series_id: the series or multiple series to get the tables of
+        :param loading: strategy to load the players of the tables with, lazily if ``None``
+        """
+        selector = filter_series(select(Table), Table.series_id, series_id)
+        tables = self._session.exec(load_eagerly(selector, loading, (Table.players,))).unique().all()
         return list(tables)
 
+    def to_pandas(self, series_id: SeriesFilter = None) -> pd.DataFrame:
+        """
+        Get the tables as data-frame indexed on ``id``, loaded without ORM overhead.
+
+        :param series_id: restrict to the tables of this series or these series, or get all tables if ``None``
+        """
+        selector = filter_series(select(*Table.__table__.columns), Table.series_id, series_id)
+        return read_pandas(self._session, selector, "id", model_dtypes(Table))
+
+    def seating(self, series_id: SeriesFilter = None) -> pd.DataFrame:
+        """
+        Get the mapping of players to the tables they are seated at.
+
+        :param series_id: restrict to the tables of this series or these series, or get all tables if ``None``
+        :return: a data-frame indexed on ``series_id`` and ``player_id`` holding the ``table_id``
+        """
+        selector = select(Table.series_id, TablePlayerLink.player_id, TablePlayerLink.table_id).join(
+            TablePlayerLink, col(Table.id) == TablePlayerLink.table_id
+        )
+
+        selector = filter_series(selector, Table.series_id, series_id)
+        return read_pandas(self._session, selector, ["series_id", "player_id"], {"table_id": "int64"})
+
     def clear_for_series(self, series_id: int) -> None:
         """Remove all the tables for a defined series in the database."""
-        tables = self._session.exec(select(Table)).all()
-        for table in tables:
-            self._session.delete(table)
+        self._delete_for_series(series_id)
+        self._mark_dirty(series_id)
         self._session.commit()
 
+    def replace_for_series(self, series_id: int, tables: Iterable[Iterable[int]]) -> list[int]:
+        """
+        Replace all tables of a series by new ones in one transaction.
+        The old tables and their links are removed with one statement each,
+        the new tables and their links are inserted with one statement each.
+
+        :param series_id: the series to replace the tables of
+        :param tables: the IDs of the players seated at each new table
+        :return: the IDs of the new tables in order
+        """
+        records = [dict(series_id=series_id, player_ids=player_ids) for player_ids in tables]
+        players = self._pop_player_ids(records)
+
+        self._delete_for_series(series_id)
+        ids = [i for i, in insert_records(self._session, Table, records)]
+        self._insert_links(ids, players)
+
+        self._mark_dirty(series_id)
+        self._session.commit()
+        return ids
+
+    def _delete_for_series(self, series_id: int) -> None:
+        connection = self._session.connection()
+        connection.execute(
+            delete(TablePlayerLink).where(
+                col(TablePlayerLink.table_id).in_(select(Table.id).where(Table.series_id == series_id))
+            )
+        )
+        connection.execute(delete(Table).where(col(Table.series_id) == series_id))
+
     def shuffle_players_for_series(
         self,
         series_id: int,
@@ -129,8 +324,116 @@ class TablesTable:
         include: list[int] | None = None,
         include_only: list[int] | None = None,
         exclude: list[int] | None = None,
-    ):
-        selector = select(Player)
+        strategy: SeatingStrategy = "random",
+        seed: int | None = None,
+        objectives: SeatingObjectives = SeatingObjectives(),
+        strengths: pd.Series | None = None,
+        apart: Iterable[tuple[int, int]] = (),
+        candidates: int = 1000,
+    ) -> SeatingScore:
+        """
+        Replace the tables of a series by a new assignment of the selected players to tables.
+
+        :param series_id: the series to seat the players for
+        :param active_only: select only active players
+        :param include: restrict the selection to these players
+        :param include_only: select exactly these players, ignoring the other options
+        :param exclude: exclude these players from the selection
+        :param strategy: the strategy to seat players with, ``"min-repeats"`` avoids seating players together
+            who already sat together in other series, ``"candidates"`` keeps the best of many random seatings,
+            see :func:`pyskat.backend.seating.seat_players`
+        :param seed: seed of the random generator, for reproducible seatings
+        :param objectives: the weights of the objectives to score seatings by
+        :param strengths: the strength of players indexed on player ID for the ``balance`` objective
+            and the ``"swiss"`` strategy, the mean points of the players in other series if ``None``
+        :param apart: pairs of player IDs to keep apart
+        :param candidates: the count of seatings to draw for the ``"candidates"`` strategy
+        :return: the score of the chosen seating
+        """
+        player_ids = self._select_player_ids(active_only, include, include_only, exclude)
+        previous = self.seating().drop(series_id, level="series_id", errors="ignore")
+
+        if strengths is None and (objectives.balance or strategy == "swiss"):
+            strengths = self._mean_points(exclude_series_id=series_id)
+
+        tables, score = seat_players(
+            player_ids,
+            strategy,
+            previous,
+            np.random.default_rng(seed),
+            objectives,
+            strengths,
+            apart,
+            candidates,
+        )
+
+        self.replace_for_series(series_id, [t.tolist() for t in tables])
+        return score
+
+    def schedule_rounds(
+        self,
+        series: Rows,
+        active_only: bool = True,
+        include: list[int] | None = None,
+        include_only: list[int] | None = None,
+        exclude: list[int] | None = None,
+        strategy: SeatingStrategy = "swiss",
+        seed: int | None = None,
+        objectives: SeatingObjectives = SeatingObjectives(),
+        strengths: pd.Series | None = None,
+        apart: Iterable[tuple[int, int]] = (),
+        candidates: int = 1000,
+    ) -> dict[int, SeatingScore]:
+        """
+        Create new series for consecutive rounds and seat the selected players for each of them in one transaction.
+        The series, their tables and the seated players are inserted with one statement each.
+        Each round avoids the pairings of all existing series and of the rounds before,
+        see :func:`pyskat.backend.seating.seat_rounds`.
+
+        :param series: rows holding the fields of :class:`Series`, one per round
+        :param strengths: the strength of players indexed on player ID, usually their total score in the standings,
+            the mean points of the players in all series if ``None``
+        :return: the score of the seating by ID of each created series
+        :raises ValueError: if no valid tables can be formed from the selected players
+
+        See :meth:`shuffle_players_for_series` for the other parameters.
+        """
+        records = to_records(series)
+        player_ids = self._select_player_ids(active_only, include, include_only, exclude)
+
+        if strengths is None and (objectives.balance or strategy == "swiss"):
+            strengths = self._mean_points()
+
+        rounds = seat_rounds(
+            player_ids,
+            len(records),
+            strategy,
+            self.seating(),
+            np.random.default_rng(seed),
+            objectives,
+            strengths,
+            apart,
+            candidates,
+        )
+
+        series_ids = [i for i, in insert_records(self._session, Series, records)]
+        tables = [(i, t.tolist()) for i, (round_tables, _) in zip(series_ids, rounds) for t in round_tables]
+        table_ids = [i for i, in insert_records(self._session, Table, [dict(series_id=i) for i, _ in tables])]
+        self._insert_links(table_ids, [players for _, players in tables])
+
+        self._mark_dirty(*series_ids)
+        self._session.commit()
+        return {i: score for i, (_, score) in zip(series_ids, rounds)}
+
+    def _select_player_ids(
+        self,
+        active_only: bool,
+        include: list[int] | None,
+        include_only: list[int] | None,
+        exclude: list[int] | None,
+    ) -> np.ndarray:
+        """Get the sorted IDs of the players to seat, see :meth:`shuffle_players_for_series`."""
+        selector = select(Player.id)
 
         if include_only:
             selector = selector.where(col(Player.id).in_(include_only))
@@ -142,50 +445,71 @@ class TablesTable:
             if exclude:
                 selector = selector.where(col(Player.id).not_in(exclude))
 
-        players = self._session.exec(selector).all()
-        players_df = to_pandas(players, Player, "id")
-        shuffled = players_df.sample(frac=1)
-
-        if len(shuffled) < 3:
-            raise ValueError("At least 3 players must be selected to create a table.")
-
-        if len(shuffled) == 5:
-            raise ValueError("It is impossible to create tables out of 5 players.")
-
-        player_count = len(shuffled)
-        div, mod = divmod(player_count, 4)
-        if mod == 0:
-            three_player_table_count = 0
-            four_player_table_count = div
-        else:
-            three_player_table_count = 4 - mod
-            four_player_table_count = div + 1 - three_player_table_count
+        return np.sort(np.array(self._session.exec(selector).all(), dtype=np.int64))
+
+    def _mean_points(self, exclude_series_id: int | None = None) -> pd.Series:
+        """Get the mean points of the players indexed on player ID, optionally ignoring one series."""
+        results = self._backend.results(self._session).to_pandas()
+        if exclude_series_id is not None:
+            results = results.drop(exclude_series_id, level="series_id", errors="ignore")
+        return results.groupby("player_id")["points"].mean()
+
+    def seat_index(self, series_id: int) -> SeatIndex:
+        """Get the seat index of a series, see :meth:`seat_indexes`."""
+        return self.seat_indexes([series_id])[series_id]
+
+    def seat_indexes(self, series_ids: Iterable[int]) -> dict[int, SeatIndex]:
+        """
+        Get the seat indexes of many series for lookups of the tables of players and the sizes of tables.
+        The indexes are cached on the backend until the tables of their series are modified,
+        by this or another process, missing ones are built with one query for all series.
+
+        :param series_ids: the series to get the indexes of
+        :return: the indexes by series ID
+        """
+        return self._backend.seat_indexes.get_many(
+            series_ids,
+            self._build_seat_indexes,
+            read_data_version(self._session.connection()),
+            store=SEATING_MODIFIED_INFO_KEY not in self._session.info,
+        )
 
-        player_border = four_player_table_count * 4
-        tables = [shuffled[i : i + 4] for i in np.arange(0, player_border, 4)] + [
-            shuffled[i : i + 3] for i in player_border + np.arange(0, three_player_table_count * 3, 3)
-        ]
+    def sizes(self, series_ids: Iterable[int]) -> pd.Series:
+        """
+        Get the count of players seated at each table of many series, looked up in their seat indexes.
 
-        for t in self._session.exec(select(Table).where(Table.series_id == series_id)):
-            self._session.delete(t)
+        :param series_ids: the series to get the table sizes of
+        :return: a series of sizes indexed on table ``id``, including tables without players
+        """
+        return table_sizes_series(self.seat_indexes(series_ids).values())
 
-        players_dict = {p.id: p for p in players}
+    def _build_seat_indexes(self, series_ids: list[int]) -> dict[int, SeatIndex]:
+        selector = (
+            select(Table.series_id, col(Table.id).label("table_id"), TablePlayerLink.player_id)
+            .outerjoin(TablePlayerLink, col(Table.id) == TablePlayerLink.table_id)
+            .where(col(Table.series_id).in_(series_ids))
+        )
+        links = pd.read_sql(selector, self._session.connection(), dtype={"player_id": "Int64"})
+        return build_seat_indexes(series_ids, links)
 
-        for i, ps in enumerate(tables, 1):
-            self._session.add(
-                Table(
-                    series_id=series_id,
-                    players=[players_dict[i] for i in ps.index],
-                )
-            )
+    def table_id_of(self, series_id: int, player_id: int) -> int:
+        """
+        Look up the ID of the table a player is seated at in a series in its seat index.
 
-        self._session.commit()
+        :raises KeyError: if the player is not seated at any table of the series
+        """
+        table_id = int(self.seat_index(series_id).table_of([player_id])[0])
+        if table_id < 0:
+            raise KeyError(f"The player with the ID {player_id} is not seated at any table of series {series_id}.")
+        return table_id
 
     def get_table_with_player(self, series_id: int, player_id: int) -> Table:
-        table, _ = self._session.exec(
-            select(Table, TablePlayerLink).where(Table.series_id == series_id, Table.id == TablePlayerLink.table_id, TablePlayerLink.player_id == player_id)
-        ).one()
-        return table
+        """
+        Get the table a player is seated at in a series.
+
+        :raises KeyError: if the player is not seated at any table of the series
+        """
+        return self.get(self.table_id_of(series_id, player_id))
 
 
 def raise_table_not_found(table_id: int):
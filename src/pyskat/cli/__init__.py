@@ -6,6 +6,7 @@ from . import (
     result_commands,
     series_commands,
     shell,
+    snapshot_commands,
     wui_commands,
 )
 from .main import main
@@ -16,5 +17,7 @@ main.add_command(result_commands.result)
 main.add_command(evaluate_commands.evaluate)
 main.add_command(evaluate_commands.report)
 main.add_command(series_commands.series)
+main.add_command(snapshot_commands.export)
+main.add_command(snapshot_commands.import_)
 
 main.add_command(wui_commands.wui)
@@ -1,14 +1,57 @@
+import json
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
 import click
 import numpy as np
 import pandas as pd
 
 from .series_commands import series_id_argument, CurrentSeries, pass_current_series
 from ..backend import Backend
+from ..backend.snapshot import SnapshotBackend
 from .. import plugins
+from ..plugins.profiling import HookProfiler
 from ..rich import console, print_pandas_dataframe
 from .main import pass_backend
 
+use_cache_option = click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    help="Reuse stored evaluations of series that were not modified since their last evaluation.",
+)
+
+
+def reject_for_snapshot(supported: Callable[[Any], bool], message: str):
+    """Create an option callback raising a usage error for values not supported when reading from a snapshot."""
+
+    def callback(ctx: click.Context, param: click.Parameter, value):
+        if not supported(value) and isinstance(ctx.find_object(Backend), SnapshotBackend):
+            raise click.UsageError(message, ctx)
+        return value
+
+    return callback
+
+
+jobs_option = click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    callback=reject_for_snapshot(lambda jobs: jobs == 1, "Snapshots can not be evaluated with multiple jobs."),
+    help="Count of worker processes to evaluate series in parallel.",
+)
+
+engine_option = click.option(
+    "-e",
+    "--engine",
+    type=click.Choice(["pandas", "sql"]),
+    default="pandas",
+    callback=reject_for_snapshot(lambda engine: engine == "pandas", "Snapshots can only be evaluated by pandas."),
+    help="Evaluate with the hooks of all plugins in pandas, or with the built-in scoring as SQL query in the database.",
+)
+
 
 @click.group()
 def evaluate():
@@ -31,13 +74,21 @@ def evaluate():
     is_flag=True,
     help="Sort in reverse order.",
 )
+@use_cache_option
+@jobs_option
+@engine_option
 @pass_backend
-def show(backend: Backend, sort_by: str | None, reverse: bool):
+def show(backend: Backend, sort_by: str | None, reverse: bool, use_cache: bool, jobs: int, engine: str):
     """Evaluate and display game results per series and in total."""
     try:
         with backend.get_session() as session:
-            evaluation = plugins.evaluate_results(backend, session, None)
-            evaluation_total = plugins.evaluate_results_total(backend, session, evaluation)
+            context = plugins.EvaluationContext.load(backend, session)
+            evaluation = plugins.evaluate_results(backend, session, None, context, use_cache, jobs, engine=engine)
+
+            if engine == "sql":
+                evaluation_total = plugins.evaluate_results_total_sql(backend, session)
+            else:
+                evaluation_total = plugins.evaluate_results_total(backend, session, evaluation, context)
 
             for ind in evaluation.index.levels[0]:
                 title = f"Series {ind}"
@@ -54,6 +105,50 @@ def show(backend: Backend, sort_by: str | None, reverse: bool):
         console.print_exception()
 
 
+@evaluate.command()
+@click.option(
+    "-s",
+    "--sort-by",
+    type=click.STRING,
+    default="score",
+    help="Column key to sort results by.",
+)
+@click.option(
+    "-r",
+    "--reverse",
+    type=click.BOOL,
+    default=False,
+    is_flag=True,
+    help="Sort in reverse order.",
+)
+@click.option(
+    "-n",
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=10,
+    help="Count of series to evaluate at once, lower values use less memory.",
+)
+@use_cache_option
+@engine_option
+@pass_backend
+def total(backend: Backend, sort_by: str, reverse: bool, chunk_size: int, use_cache: bool, engine: str):
+    """Evaluate and display the total game results over all series, evaluating series in chunks."""
+    try:
+        with backend.get_session() as session:
+            if engine == "sql":
+                evaluation_total = plugins.evaluate_results_total_sql(backend, session)
+            else:
+                evaluation_total = plugins.evaluate_results_total_streaming(backend, session, chunk_size, use_cache)
+
+        evaluation_total.sort_values(sort_by, ascending=reverse, inplace=True)
+        evaluation_total["position"] = np.arange(1, len(evaluation_total) + 1)
+        evaluation_total.reset_index(inplace=True)
+        evaluation_total.set_index("position", inplace=True)
+        print_pandas_dataframe(evaluation_total, "Total")
+    except KeyError:
+        console.print_exception()
+
+
 @evaluate.command()
 @pass_backend
 @click.option(
@@ -63,8 +158,39 @@ def show(backend: Backend, sort_by: str | None, reverse: bool):
     default="report.html",
     type=click.Path(dir_okay=False, writable=True, path_type=Path),
 )
-def report(backend: Backend, output_file: Path):
+@use_cache_option
+@jobs_option
+@engine_option
+def report(backend: Backend, output_file: Path, use_cache: bool, jobs: int, engine: str):
     """Create a HTML report page which displays the evaluated game results."""
     with backend.get_session() as session:
-        code = plugins.report_standalone(backend, session)
+        code = plugins.report_standalone(backend, session, use_cache, jobs, engine)
         output_file.write_text(code)
+
+
+@evaluate.command()
+@click.option(
+    "-s",
+    "--sort-by",
+    type=click.Choice(["wall_time", "calls", "rows", "memory"]),
+    default="wall_time",
+    help="Column key to sort the breakdown by.",
+)
+@click.option(
+    "-o",
+    "--output-file",
+    help="JSON file to dump the recorded statistics to.",
+    default=None,
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+)
+@pass_backend
+def profile(backend: Backend, sort_by: str, output_file: Path | None):
+    """Generate the report content without stored evaluations and show the time spent per hook implementation."""
+    with backend.get_session() as session:
+        with HookProfiler() as profiler:
+            plugins.report_content(backend, session, use_cache=False)
+
+    print_pandas_dataframe(profiler.to_frame(sort_by), "Hook Implementations")
+
+    if output_file:
+        output_file.write_text(json.dumps(profiler.to_dict(), indent=4))
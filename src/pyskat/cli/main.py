@@ -3,9 +3,15 @@ from pathlib import Path
 import click
 
 from ..backend import Backend
+from ..backend.pool_settings import PoolSettings
+from ..backend.snapshot import SnapshotBackend
+from ..backend.sqlite_profile import SQLITE_PROFILES
 
 pass_backend = click.make_pass_decorator(Backend)
 
+SNAPSHOT_COMMANDS = {"evaluate", "report"}
+"""Subcommands supported when reading from a snapshot, all others need a database."""
+
 
 @click.group()
 @click.pass_context
@@ -23,16 +29,93 @@ pass_backend = click.make_pass_decorator(Backend)
     default=None,
     help="An explicit connection string to a SQL database. Takes precedence over --database-file.",
 )
-def main(ctx, database_file: Path, connection_string: str):
+@click.option(
+    "--snapshot",
+    "snapshot_directory",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=None,
+    help="Read from a snapshot directory instead of a database, see 'export snapshot'. Supports evaluation and reports only.",
+)
+@click.option(
+    "--sqlite-profile",
+    type=click.Choice(list(SQLITE_PROFILES)),
+    default="default",
+    help="Pragmas to apply to SQLite connections, 'performance' enables WAL, memory mapping and a larger cache.",
+)
+@click.option(
+    "--pool-size",
+    type=click.IntRange(min=0),
+    default=None,
+    envvar="PYSKAT_POOL_SIZE",
+    help="Count of database connections kept open. Defaults depend on the database dialect.",
+)
+@click.option(
+    "--pool-max-overflow",
+    type=click.INT,
+    default=None,
+    envvar="PYSKAT_POOL_MAX_OVERFLOW",
+    help="Count of database connections opened beyond the pool size under load.",
+)
+@click.option(
+    "--pool-recycle",
+    type=click.INT,
+    default=None,
+    envvar="PYSKAT_POOL_RECYCLE",
+    help="Seconds after which database connections are replaced, -1 to never replace them.",
+)
+@click.option(
+    "--pool-pre-ping/--no-pool-pre-ping",
+    default=None,
+    envvar="PYSKAT_POOL_PRE_PING",
+    help="Whether to test database connections for liveness before use.",
+)
+@click.option(
+    "--pool-timeout",
+    type=click.FLOAT,
+    default=None,
+    envvar="PYSKAT_POOL_TIMEOUT",
+    help="Seconds to wait for a free database connection before failing.",
+)
+def main(
+    ctx,
+    database_file: Path,
+    connection_string: str,
+    snapshot_directory: Path | None,
+    sqlite_profile: str,
+    pool_size: int | None,
+    pool_max_overflow: int | None,
+    pool_recycle: int | None,
+    pool_pre_ping: bool | None,
+    pool_timeout: float | None,
+):
+    if snapshot_directory:
+        if ctx.invoked_subcommand is not None and ctx.invoked_subcommand not in SNAPSHOT_COMMANDS:
+            raise click.UsageError(
+                f"The '{ctx.invoked_subcommand}' command needs a database, snapshots support evaluation and reports only.",
+                ctx,
+            )
+
+        ctx.obj = SnapshotBackend(snapshot_directory)
+        return
+
     if not connection_string:
         connection_string = f"sqlite:///{database_file.resolve()}"
-    ctx.obj = Backend(connection_string)
+
+    pool = PoolSettings(pool_size, pool_max_overflow, pool_recycle, pool_pre_ping, pool_timeout)
+    ctx.obj = Backend(connection_string, sqlite_profile=sqlite_profile, pool=pool)
 
 
 @main.command()
 @click.option("-p", "--player-count", type=click.INT, default=13)
 @click.option("-s", "--series-count", type=click.INT, default=5)
+@click.option(
+    "--fast/--no-fast",
+    default=False,
+    show_default=True,
+    help="Use the vectorized generator with bulk inserts, suitable for large load test databases.",
+)
+@click.option("--seed", type=click.INT, default=None, help="Seed of the random generator of --fast.")
 @pass_backend
-def fake_data(backend, player_count: int, series_count: int):
+def fake_data(backend, player_count: int, series_count: int, fast: bool, seed: int | None):
     """Adds some fake data to the current database for testing."""
-    backend.fake_data(player_count, series_count)
+    backend.fake_data(player_count, series_count, fast, seed)
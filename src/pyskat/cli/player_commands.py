@@ -3,7 +3,6 @@ import pandas as pd
 from click.shell_completion import CompletionItem
 
 from ..backend import Backend
-from ..backend.data_model import to_pandas, Player
 from ..rich import console, print_pandas_dataframe
 from .main import pass_backend
 
@@ -14,7 +13,7 @@ PLAYER_REMARKS_HELP = "Additional remarks if needed."
 def complete_player_id(ctx: click.Context, param, incomplete):
     backend: Backend = ctx.find_object(Backend)
     with backend.get_session() as session:
-        players = backend.players(session).all()
+        players = backend.players(session).all(loading=None)
 
         c = [CompletionItem(p.id, help=p.name) for p in players if str(p.id).startswith(str(incomplete))]
         return c
@@ -122,6 +121,5 @@ def get(backend: Backend, player_id: int):
 def _list(backend: Backend):
     """List all players in database."""
     with backend.get_session() as session:
-        players = backend.players(session).all()
-        df = to_pandas(players, Player, "id")
+        df = backend.players(session).to_pandas()
         print_pandas_dataframe(df)
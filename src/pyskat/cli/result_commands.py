@@ -1,7 +1,6 @@
 import click
 
 from ..backend import Backend
-from ..backend.data_model import to_pandas, Result
 from ..rich import console, print_pandas_dataframe
 from .main import pass_backend
 from .player_commands import player_id_argument
@@ -167,6 +166,5 @@ def get(backend: Backend, series_id: int, player_id: int):
 def _list(backend: Backend):
     """List all game results ins database."""
     with backend.get_session() as session:
-        results = backend.results(session).all()
-        df = to_pandas(results, Result, ["series_id", "player_id"])
+        df = backend.results(session).to_pandas()
         print_pandas_dataframe(df)
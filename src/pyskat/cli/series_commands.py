@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import get_args
 from pathlib import Path
 
 import click
@@ -7,8 +8,8 @@ from click import pass_context
 from click.shell_completion import CompletionItem
 
 from ..backend import Backend
-from ..plugins import evaluate_results
-from ..backend.data_model import to_pandas, Series, Table, Player
+from ..plugins import Standings, evaluate_results
+from ..backend.seating import SeatingObjectives, SeatingStrategy
 from ..rich import console, print_pandas_dataframe
 from .config import APP_DIR
 from .main import pass_backend
@@ -22,7 +23,7 @@ SERIES_REMARKS_HELP = "Additional remarks."
 def complete_series_id(ctx: click.Context, param, incomplete):
     backend: Backend = ctx.find_object(Backend)
     with backend.get_session() as session:
-        all_series = backend.series(session).all()
+        all_series = backend.series(session).all(loading=None)
 
         c = [
             CompletionItem(s.id, help=f"{s.name} on {s.date}")
@@ -199,8 +200,7 @@ def set(backend: Backend, current_series: CurrentSeries, series_id: int):
 def _list(backend: Backend):
     """List all series in database."""
     with backend.get_session() as session:
-        all_series = backend.series(session).all()
-        df = to_pandas(all_series, Series, "id")
+        df = backend.series(session).to_pandas()
         print_pandas_dataframe(df)
 
 
@@ -223,7 +223,7 @@ def _list(backend: Backend):
     help="Include an player and ignore automatically included ones. Can be given multiple times. If this is given, all other options have no effect",
 )
 @click.option(
-    "-i",
+    "-x",
     "--exclude",
     type=click.INT,
     default=[],
@@ -236,6 +236,41 @@ def _list(backend: Backend):
     default=True,
     help="Include only active or also inactive players.",
 )
+@click.option(
+    "-S",
+    "--strategy",
+    type=click.Choice(get_args(SeatingStrategy)),
+    default="random",
+    help="Shuffle uniformly, search for a distribution that avoids seating players together repeatedly, "
+    "or keep the best scored of many random distributions.",
+)
+@click.option("--seed", type=click.INT, default=None, help="Seed of the random generator, for reproducible results.")
+@click.option(
+    "-n",
+    "--candidates",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="Count of random distributions to score with the candidates strategy.",
+)
+@click.option(
+    "--repeats-weight",
+    type=click.FLOAT,
+    default=SeatingObjectives.repeats,
+    help="Weight of each pairing of players who already sat together in other series.",
+)
+@click.option(
+    "--balance-weight",
+    type=click.FLOAT,
+    default=SeatingObjectives.balance,
+    help="Weight of the deviation of the mean past points of the players per table.",
+)
+@click.option(
+    "-a",
+    "--keep-apart",
+    type=(click.INT, click.INT),
+    multiple=True,
+    help="Pair of player IDs not to seat at the same table. Can be given multiple times.",
+)
 @pass_current_series
 @pass_backend
 @pass_context
@@ -248,27 +283,154 @@ def shuffle_tables(
     exclude: tuple[int],
     include_only: tuple[int],
     active_only: bool,
+    strategy: SeatingStrategy,
+    seed: int | None,
+    candidates: int,
+    repeats_weight: float,
+    balance_weight: float,
+    keep_apart: tuple[tuple[int, int]],
 ):
     """Generate a random player distribution of players to tables."""
     with backend.get_session() as session:
         if not series_id:
             series_id = click.prompt("Id", default=current_series.get(), type=click.INT)
 
-        old = backend.tables(session).all_for_series(series_id)
+        old = backend.tables(session).all_for_series(series_id, loading=None)
         if old:
             if not click.confirm(
                 "There is already a player-to-table distribution for this series. Proceeding will overwrite that."
             ):
                 return
 
-        backend.tables(session).shuffle_players_for_series(
+        score = backend.tables(session).shuffle_players_for_series(
             series_id,
             active_only=active_only,
             include=include or None,
             exclude=exclude or None,
             include_only=include_only or None,
+            strategy=strategy,
+            seed=seed,
+            objectives=SeatingObjectives(repeats=repeats_weight, balance=balance_weight),
+            apart=keep_apart,
+            candidates=candidates,
+        )
+        print_series_table(backend, session, series_id)
+        console.print(
+            f"Score {score.total:.2f}: {score.repeats} repeated pairings, "
+            f"{score.balance:.2f} deviation of table strength, {score.apart} pairings to keep apart."
         )
-        print_series_table(backend, series_id)
+
+
+@series.command()
+@click.option("-r", "--rounds", type=click.IntRange(min=1), default=1, help="Count of rounds to schedule.")
+@click.option(
+    "-n",
+    "--name",
+    type=click.STRING,
+    default="Round {round}",
+    help="Name of the series of each round, {round} is replaced by the number of the round, "
+    "counting on from the existing series.",
+)
+@click.option("-d", "--date", type=click.DateTime(), default=datetime.today(), help=SERIES_DATE_HELP)
+@click.option(
+    "-i",
+    "--include",
+    type=click.INT,
+    default=[],
+    multiple=True,
+    help="Include an additional player explicitly. Can be given multiple times.",
+)
+@click.option(
+    "-o",
+    "--include-only",
+    type=click.INT,
+    default=None,
+    multiple=True,
+    help="Include an player and ignore automatically included ones. Can be given multiple times. If this is given, all other options have no effect",
+)
+@click.option(
+    "-x",
+    "--exclude",
+    type=click.INT,
+    default=[],
+    multiple=True,
+    help="Exclude an additional player explicitly. Can be given multiple times.",
+)
+@click.option(
+    "--active-only/--inactive-also",
+    type=click.BOOL,
+    default=True,
+    help="Include only active or also inactive players.",
+)
+@click.option(
+    "-S",
+    "--strategy",
+    type=click.Choice(get_args(SeatingStrategy)),
+    default="swiss",
+    help="Strategy to seat the players of each round with, the swiss strategy groups players of similar standing.",
+)
+@click.option(
+    "-c",
+    "--standings-column",
+    type=click.STRING,
+    default="score",
+    help="Column of the total results to rank players by.",
+)
+@click.option("--seed", type=click.INT, default=None, help="Seed of the random generator, for reproducible results.")
+@click.option(
+    "-a",
+    "--keep-apart",
+    type=(click.INT, click.INT),
+    multiple=True,
+    help="Pair of player IDs not to seat at the same table. Can be given multiple times.",
+)
+@pass_current_series
+@pass_backend
+def schedule(
+    backend: Backend,
+    current_series: CurrentSeries,
+    rounds: int,
+    name: str,
+    date: datetime,
+    include: tuple[int],
+    exclude: tuple[int],
+    include_only: tuple[int],
+    active_only: bool,
+    strategy: SeatingStrategy,
+    standings_column: str,
+    seed: int | None,
+    keep_apart: tuple[tuple[int, int]],
+):
+    """Create series for the next rounds and seat players by their current standings."""
+    with backend.get_session() as session:
+        try:
+            totals = Standings(backend).update(session)
+        except ValueError as e:
+            raise click.ClickException(f"Can not rank the players by their standings: {e}")
+
+        if standings_column not in totals and not totals.empty:
+            raise click.BadParameter(f"The total results have no column {standings_column}.", param_hint="-c")
+
+        first_round = backend.series(session).count() + 1
+        scores = backend.tables(session).schedule_rounds(
+            [dict(name=name.format(round=first_round + i), date=date) for i in range(rounds)],
+            active_only=active_only,
+            include=include or None,
+            exclude=exclude or None,
+            include_only=include_only or None,
+            strategy=strategy,
+            seed=seed,
+            strengths=totals.get(standings_column),
+            apart=keep_apart,
+        )
+
+        for series_id, score in scores.items():
+            print_series_table(backend, session, series_id)
+            console.print(
+                f"Series {series_id}: {score.repeats} repeated pairings, {score.apart} pairings to keep apart."
+            )
+
+        current_series.set(next(iter(scores)))
 
 
 @series.command()
@@ -284,24 +446,13 @@ def list_tables(backend: Backend, current_series: CurrentSeries, series_id: int
 
 
 def print_series_table(backend: Backend, session: Session, id: int):
-    df = to_pandas(backend.tables(session).all_for_series(id), Table, ["table_id"])
-    df.drop("series_id", axis=1, inplace=True)
-
-    all_players = to_pandas(backend.players(session).all(), Player, "id")
-
-    def get_player_name(pid):
-        if pid == 0:
-            return ""
-        try:
-            return f"{all_players.loc[i]['name']} ({i})"
-        except KeyError:
-            return "<unknown player>"
+    df = backend.tables(session).to_pandas(id).drop("series_id", axis=1)
+    seating = backend.tables(session).seating(id).reset_index()
+    player_names = backend.players(session).to_pandas()["name"]
 
-    for i in range(1, 5):
-        df[f"player{i}"] = df[f"player{i}_id"].map(get_player_name)
-        df.drop(f"player{i}_id", inplace=True, axis=1)
+    seating["player"] = [f"{player_names.get(i, '<unknown player>')} ({i})" for i in seating["player_id"]]
+    df["players"] = seating.groupby("table_id")["player"].agg(", ".join).reindex(df.index, fill_value="")
 
-    df.sort_index(axis=1, inplace=True)
     print_pandas_dataframe(df)
 
 
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import click
+
+from ..backend import Backend
+from ..backend.snapshot import import_snapshot, export_snapshot
+from ..rich import console
+from .main import pass_backend
+
+snapshot_directory_argument = click.argument(
+    "directory", type=click.Path(file_okay=False, path_type=Path), default=Path("pyskat-snapshot")
+)
+
+
+@click.group()
+def export():
+    """Export data from the database."""
+
+
+@export.command(name="snapshot")
+@snapshot_directory_argument
+@click.option(
+    "-f",
+    "--format",
+    type=click.Choice(["parquet", "feather"]),
+    default="parquet",
+    help="File format, Parquet is compressed, Feather can be memory-mapped without decoding.",
+)
+@pass_backend
+def export_snapshot_command(backend: Backend, directory: Path, format: str):
+    """Write players, series, tables and results to a directory of columnar files, one per table."""
+    with backend.get_session() as session:
+        counts = export_snapshot(session, directory, format)
+
+    console.print(f"Exported {', '.join(f'{c} {n}' for n, c in counts.items())} to {directory}.")
+
+
+@click.group(name="import")
+def import_():
+    """Import data into the database."""
+
+
+@import_.command(name="snapshot")
+@snapshot_directory_argument
+@click.option(
+    "--replace/--no-replace",
+    default=False,
+    help="Delete all existing data before importing, otherwise the database must be empty.",
+)
+@pass_backend
+def import_snapshot_command(backend: Backend, directory: Path, replace: bool):
+    """Read players, series, tables and results from a snapshot directory."""
+    if replace:
+        click.confirm("All existing data will be deleted. Proceed?", abort=True)
+
+    try:
+        with backend.get_session() as session:
+            counts = import_snapshot(session, directory, replace)
+            session.commit()
+
+        console.print(f"Imported {', '.join(f'{c} {n}' for n, c in counts.items())} from {directory}.")
+    except (ValueError, FileNotFoundError):
+        console.print_exception()
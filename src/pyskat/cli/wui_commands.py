@@ -41,6 +41,27 @@ def run(
     app.run()
 
 
+@wui.command()
+@click.option("-h", "--host", default="127.0.0.1", type=click.STRING, help="The host to bind to.")
+@click.option("-p", "--port", default=8000, type=click.INT, help="The port to bind to.")
+@pass_backend
+def scoreboard(backend: Backend, host: str, port: int):
+    """Serve the read-only scoreboard on the async backend for many concurrent viewers."""
+    try:
+        import uvicorn
+    except ImportError as e:
+        raise ImportError(
+            "Need the uvicorn package to serve the scoreboard. It may be installed with the [async] extra."
+        ) from e
+
+    from pyskat.backend.async_backend import AsyncBackend
+    from pyskat.wui.scoreboard import create_scoreboard_app
+
+    url = backend.engine.url.render_as_string(hide_password=False)
+    async_backend = AsyncBackend(url, sqlite_profile=backend.sqlite_profile, pool=backend.pool)
+    uvicorn.run(create_scoreboard_app(async_backend), host=host, port=port, lifespan="on")
+
+
 @wui.command()
 @instance_path_option
 def create_config(instance_path: Path):
@@ -2,7 +2,9 @@ from .manager import plugin_manager
 from . import specs
 from . import evaluation
 from . import plots
-from .evaluation import evaluate_results, evaluate_results_total
+from .context import EvaluationContext
+from .evaluation import evaluate_results, evaluate_results_total, evaluate_results_total_streaming, Standings
+from .sql_engine import evaluate_results_sql, evaluate_results_total_sql
 from .report import report_content, report_standalone
 
 plugin_manager.add_hookspecs(specs)
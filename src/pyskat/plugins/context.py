@@ -0,0 +1,70 @@
+from dataclasses import dataclass, replace
+
+import pandas as pd
+from sqlmodel import Session
+
+from ..backend import Backend
+from ..backend.data_model import SeriesFilter
+from ..backend.seat_index import seating_frame
+
+
+@dataclass(frozen=True)
+class EvaluationContext:
+    """
+    Preloaded data passed to all evaluation, plot and report hooks.
+    Hook implementations shall use these frames for lookups instead of querying the backend per row.
+    The frames are shared between all hook implementations and must not be modified.
+    """
+
+    players: pd.DataFrame
+    """All players indexed on ``id``."""
+
+    series: pd.DataFrame
+    """All series indexed on ``id``."""
+
+    tables: pd.DataFrame
+    """The tables of the evaluated series indexed on ``id``, including their ``size``."""
+
+    seating: pd.DataFrame
+    """The ``table_id`` of each seated player, indexed on ``series_id`` and ``player_id``."""
+
+    @classmethod
+    def load(cls, backend: Backend, session: Session, series_id: SeriesFilter = None) -> "EvaluationContext":
+        """
+        Load the context with a fixed number of queries.
+
+        :param backend: the backend to load data from
+        :param session: the database session to use
+        :param series_id: restrict tables and seating to this series or these series, or load all if ``None``
+        """
+        players = backend.players(session).to_pandas()
+        series = backend.series(session).to_pandas()
+        tables, seating = _load_seating(backend, session, series_id)
+
+        return cls(players=players, series=series, tables=tables, seating=seating)
+
+    def for_series(self, backend: Backend, session: Session, series_id: SeriesFilter) -> "EvaluationContext":
+        """
+        Load the tables and seating of other series into a new context sharing the players and series of this one.
+
+        :param backend: the backend to load data from
+        :param session: the database session to use
+        :param series_id: restrict tables and seating to this series or these series, or load all if ``None``
+        """
+        tables, seating = _load_seating(backend, session, series_id)
+        return replace(self, tables=tables, seating=seating)
+
+    def player_names(self, player_ids: pd.Index | pd.Series) -> pd.Series:
+        """Look up the names of the given player IDs."""
+        return self.players["name"].reindex(player_ids)
+
+
+def _load_seating(backend: Backend, session: Session, series_id: SeriesFilter) -> tuple[pd.DataFrame, pd.DataFrame]:
+    tables = backend.tables(session).to_pandas(series_id)
+
+    # shared with the lookup of table IDs of results, so evaluations do not query the seating again
+    series_ids = tables["series_id"].unique().tolist()
+    seating = seating_frame(backend.tables(session).seat_indexes(series_ids).values())
+    tables["size"] = backend.tables(session).sizes(series_ids).reindex(tables.index, fill_value=0)
+
+    return tables, seating
@@ -0,0 +1,75 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from pluggy import HookImpl
+
+COLUMNS_ATTRIBUTE = "pyskat_columns"
+"""Attribute name under which column declarations are stored on hook implementation functions."""
+
+
+@dataclass(frozen=True)
+class ColumnDeclaration:
+    """The columns a hook implementation requires in its input and provides in its output."""
+
+    requires: frozenset[str]
+    provides: frozenset[str]
+
+
+def declare_columns(requires: Iterable[str] = (), provides: Iterable[str] = ()):
+    """
+    Decorator to declare the columns an evaluation hook implementation requires and provides.
+    Declared implementations are skipped if none of their provided columns are needed,
+    implementations without declaration are always executed.
+
+    Example::
+
+        @hookimpl(specname="evaluate_results_revise")
+        @declare_columns(requires=["points", "won_points"], provides=["score"])
+        def sum_score(results): ...
+    """
+
+    def decorator(function):
+        setattr(function, COLUMNS_ATTRIBUTE, ColumnDeclaration(frozenset(requires), frozenset(provides)))
+        return function
+
+    return decorator
+
+
+def get_declaration(impl: HookImpl) -> ColumnDeclaration | None:
+    """Get the column declaration of a hook implementation or ``None`` if undeclared."""
+    return getattr(impl.function, COLUMNS_ATTRIBUTE, None)
+
+
+def select_hookimpls(stages: list[list[HookImpl]], columns: Iterable[str]) -> list[list[HookImpl]]:
+    """
+    Select the hook implementations of consecutive stages needed to compute the given columns.
+    Stages are walked backwards, adding the required columns of each selected implementation to the needed ones.
+    If an undeclared implementation is met, all implementations of the previous stages are selected,
+    as its requirements are unknown.
+
+    :param stages: hook implementations per stage in order of execution
+    :param columns: the columns to compute
+    :return: the selected hook implementations per stage
+    """
+    needed = set(columns)
+    run_all = False
+    selected = []
+
+    for impls in reversed(stages):
+        stage_selected = []
+        undeclared = False
+
+        for impl in impls:
+            declaration = get_declaration(impl)
+
+            if declaration is None:
+                undeclared = True
+                stage_selected.append(impl)
+            elif run_all or declaration.provides & needed:
+                needed |= declaration.requires
+                stage_selected.append(impl)
+
+        run_all = run_all or undeclared
+        selected.insert(0, stage_selected)
+
+    return selected
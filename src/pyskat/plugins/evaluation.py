@@ -1,89 +1,528 @@
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Literal
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+
+from pluggy import HookCaller
+
 import pandas as pd
 
-from .manager import hookimpl
+from ..__about__ import VERSION
+from .context import EvaluationContext
+from .dependencies import declare_columns, select_hookimpls
+from .manager import call_hookimpls, hookimpl
 from ..backend import Backend
+from ..backend.data_model import SeriesFilter, series_filter_key
+from ..backend.pool_settings import PoolSettings, is_memory_database
+from ..backend.sqlite_profile import SQLiteProfile
 from .manager import plugin_manager
 from sqlmodel import Session
 
+EvaluationEngine = Literal["pandas", "sql"]
+"""
+Engine to evaluate results with: ``"pandas"`` runs the hook implementations of all plugins on data-frames,
+``"sql"`` runs the built-in scoring as SQL query in the database, see :mod:`pyskat.plugins.sql_engine`.
+"""
+
+
+def evaluate_results(
+    backend: Backend,
+    session: Session,
+    series_id: SeriesFilter,
+    context: EvaluationContext | None = None,
+    use_cache: bool = True,
+    jobs: int = 1,
+    compact: bool = False,
+    columns: Iterable[str] | None = None,
+    threads: int = 1,
+    engine: EvaluationEngine = "pandas",
+) -> pd.DataFrame:
+    """
+    Evaluate the results of one or all series by running the prepare, main and revise hooks.
+
+    :param backend: the backend to load data from
+    :param session: the database session to use
+    :param series_id: the series or multiple series to evaluate, or all series if ``None``
+    :param context: a preloaded evaluation context, loaded on demand if ``None``
+    :param use_cache: whether to reuse stored evaluations of series that were not modified since
+        and results held in the backend's in-process result cache, see :func:`memoize`
+    :param jobs: count of worker processes to evaluate series in parallel, see :func:`evaluate_results_parallel`
+    :param compact: whether to use memory-compact dtypes, see :func:`compact_frame`
+    :param columns: compute only these columns by running only the hooks they depend on,
+        see :func:`pyskat.plugins.dependencies.declare_columns`, or compute all if ``None``
+    :param threads: count of threads to run the hook implementations within a stage concurrently
+    :param engine: the engine to evaluate with, the ``"sql"`` engine ignores ``jobs``, ``threads``
+        and stored evaluations, and raises a :class:`ValueError` if other plugins implement evaluation hooks
+    :return: the evaluated results indexed first on ``series_id`` and then on ``player_id``,
+        only holding the input columns and the requested ones if ``columns`` is given
+    """
+    columns = None if columns is None else list(columns)
+
+    def compute():
+        if engine == "sql":
+            return _evaluate_results_sql(backend, session, series_id, compact, columns)
+        return _evaluate_results(backend, session, series_id, context, use_cache, jobs, compact, columns, threads)
+
+    if not use_cache:
+        return compute()
+    return memoize(backend, results_memo_key(series_id, compact, columns, engine), compute).copy()
 
-def evaluate_results(backend: Backend, session: Session, series_id: int | None) -> pd.DataFrame:
-    if series_id:
-        results = backend.results(session).all_for_series(series_id)
-    else:
-        results = backend.results(session).all()
 
-    if not results:
+def _evaluate_results_sql(
+    backend: Backend, session: Session, series_id: SeriesFilter, compact: bool, columns: list[str] | None
+) -> pd.DataFrame:
+    from .sql_engine import evaluate_results_sql
+
+    df = evaluate_results_sql(backend, session, series_id)
+
+    if columns is not None:
+        df = df.loc[:, df.columns.isin(["points", "won", "lost", "remarks", "table_id"] + columns)]
+
+    return compact_frame(df) if compact else df
+
+
+def _evaluate_results(
+    backend: Backend,
+    session: Session,
+    series_id: SeriesFilter,
+    context: EvaluationContext | None,
+    use_cache: bool,
+    jobs: int,
+    compact: bool,
+    columns: list[str] | None,
+    threads: int,
+) -> pd.DataFrame:
+    df = backend.results(session).all_with_table_ids(series_id)
+
+    if df.empty:
         raise ValueError(f"No results for series {series_id} in database.")
 
-    df = pd.DataFrame([r.model_dump() for r in results])
-    df.set_index(["series_id", "player_id"], inplace=True)
     df.sort_index(inplace=True)
 
-    def _remove_input_cols(orig: pd.DataFrame, hook_results: list[pd.DataFrame]):
-        return [r.drop(orig.columns, axis=1) for r in hook_results]
+    if compact:
+        df = compact_frame(df)
 
-    df = df.join(
-        _remove_input_cols(
-            df, plugin_manager.hook.evaluate_results_prepare(backend=backend, session=session, results=df)
-        )
-    )
-    df = df.join(
-        _remove_input_cols(df, plugin_manager.hook.evaluate_results_main(backend=backend, session=session, results=df))
-    )
-    df = df.join(
-        _remove_input_cols(
-            df, plugin_manager.hook.evaluate_results_revise(backend=backend, session=session, results=df)
+    key = evaluation_cache_key(compact)
+    evaluations = backend.evaluations(session)
+    cached = evaluations.get_many(df.index.unique("series_id"), key) if use_cache else {}
+    dirty = df.drop(list(cached), level="series_id")
+
+    input_columns = list(df.columns)
+    options = dict(compact=compact, columns=columns, threads=threads)
+
+    frames = list(cached.values())
+    if not dirty.empty:
+        if jobs > 1 and dirty.index.unique("series_id").size > 1:
+            evaluated = evaluate_results_parallel(backend, dirty, jobs, **options)
+        else:
+            evaluated = _evaluate_stages(
+                backend, session, context or EvaluationContext.load(backend, session, series_id), dirty, **options
+            )
+
+        if use_cache and columns is None:
+            evaluations.store_many(evaluated, key)
+        frames.append(evaluated)
+
+    if columns is not None:
+        frames = [f.loc[:, f.columns.isin(input_columns + columns)] for f in frames]
+
+    df = pd.concat(frames).sort_index()
+    return compact_frame(df) if compact else df
+
+
+def evaluate_results_parallel(
+    backend: Backend,
+    results: pd.DataFrame,
+    jobs: int,
+    compact: bool = False,
+    columns: list[str] | None = None,
+    threads: int = 1,
+) -> pd.DataFrame:
+    """
+    Evaluate results in chunks of series in a pool of worker processes, each with its own database connection.
+    Only plugins registered on import of their modules are available in the workers,
+    unless the platform forks the worker processes.
+    The database must be accessible from other processes, so in-memory databases are not supported.
+
+    :param backend: the backend whose database is to be connected by the workers
+    :param results: the results to evaluate indexed first on ``series_id`` and then on ``player_id``
+    :param jobs: count of worker processes
+    :param compact: whether to use memory-compact dtypes, see :func:`compact_frame`
+    :param columns: compute only these columns, or all if ``None``
+    :param threads: count of threads per worker to run the hook implementations within a stage concurrently
+    :return: the evaluated results
+    :raises ValueError: if the backend's database is an in-memory database
+    """
+    if is_memory_database(backend.engine.url):
+        raise ValueError("In-memory databases can not be evaluated with multiple jobs, as workers can not connect.")
+
+    connection_string = backend.engine.url.render_as_string(hide_password=False)
+    series_ids = results.index.unique("series_id")
+
+    # each task holds the results of several series to load their tables and seating with one context
+    chunks = [series_ids[i :: 4 * jobs] for i in range(min(len(series_ids), 4 * jobs))]
+    partitions = [results.loc[results.index.get_level_values("series_id").isin(chunk)] for chunk in chunks]
+
+    with ProcessPoolExecutor(
+        jobs, initializer=_init_worker, initargs=(connection_string, backend.sqlite_profile, backend.pool)
+    ) as executor:
+        frames = list(
+            executor.map(
+                partial(_evaluate_partition, compact=compact, columns=columns, threads=threads),
+                partitions,
+            )
         )
-    )
+
+    return pd.concat(frames).sort_index()
+
+
+_worker_backend: Backend | None = None
+_worker_context: EvaluationContext | None = None
+
+
+def _init_worker(connection_string: str, sqlite_profile: SQLiteProfile | None, pool: PoolSettings):
+    global _worker_backend, _worker_context
+    _worker_backend = Backend(connection_string, sqlite_profile=sqlite_profile, pool=pool)
+
+    # players and series are shared by all series, so they are loaded once per worker
+    with _worker_backend.get_session() as session:
+        _worker_context = EvaluationContext.load(_worker_backend, session, [])
+
+
+def _evaluate_partition(results: pd.DataFrame, **options) -> pd.DataFrame:
+    series_ids = results.index.unique("series_id").tolist()
+
+    with _worker_backend.get_session() as session:
+        context = _worker_context.for_series(_worker_backend, session, series_ids)
+        return _evaluate_stages(_worker_backend, session, context, results, **options)
+
+
+def evaluation_cache_key(compact: bool = False) -> str:
+    """Key identifying the current evaluation pipeline, stored evaluations made with another are outdated."""
+    plugin_names = sorted(name for name, _ in plugin_manager.list_name_plugin())
+    return ";".join([VERSION, *plugin_names, "compact" if compact else "full"])
+
+
+COMPACT_CATEGORICAL_COLUMNS = ["player_name", "remarks"]
+"""Columns with many repeated strings to store as categoricals in compact frames."""
+
+COMPACT_DTYPES = {"int64": "int32", "Int64": "Int32"}
+"""Mapping of dtypes to their replacement in compact frames."""
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast 64-bit integer columns to 32-bit and store repetitive string columns as categoricals."""
+    dtypes = {c: COMPACT_DTYPES[str(t)] for c, t in df.dtypes.items() if str(t) in COMPACT_DTYPES}
+    dtypes |= {c: "category" for c in COMPACT_CATEGORICAL_COLUMNS if c in df.columns and df[c].dtype == object}
+    return df.astype(dtypes) if dtypes else df
+
+
+def _evaluate_stages(
+    backend: Backend,
+    session: Session,
+    context: EvaluationContext,
+    df: pd.DataFrame,
+    compact: bool = False,
+    columns: list[str] | None = None,
+    threads: int = 1,
+) -> pd.DataFrame:
+    stages: list[HookCaller] = [
+        plugin_manager.hook.evaluate_results_prepare,
+        plugin_manager.hook.evaluate_results_main,
+        plugin_manager.hook.evaluate_results_revise,
+    ]
+    stage_impls = [stage.get_hookimpls() for stage in stages]
+
+    if columns is not None:
+        stage_impls = select_hookimpls(stage_impls, columns)
+
+    with pd.option_context("mode.copy_on_write", True):
+        for stage, impls in zip(stages, stage_impls):
+            if not impls:
+                continue
+
+            kwargs = dict(backend=backend, session=session, context=context, results=df.copy(deep=False))
+            hook_results = call_hookimpls(stage, impls, kwargs, threads)
+            df = _join_new_columns(df, hook_results)
+
+            if compact:
+                df = compact_frame(df)
 
     return df
 
 
-def evaluate_results_total(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame:
-    df = pd.DataFrame(index=results.index.levels[1])
-    return df.join(plugin_manager.hook.evaluate_results_total(backend=backend, session=session, results=results))
+def _join_new_columns(df: pd.DataFrame, hook_results: list[pd.DataFrame | pd.Series]) -> pd.DataFrame:
+    known = set(df.columns)
+    new_columns = []
 
+    for r in hook_results:
+        r = r.to_frame() if isinstance(r, pd.Series) else r
+        r = r.loc[:, [c not in known for c in r.columns]]
+        known.update(r.columns)
+        new_columns.append(r)
 
-@hookimpl(specname="evaluate_results_prepare")
-def determine_table_size(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame:
-    results["table_size"] = results.apply(
-        lambda row: backend.tables(session).get_table_with_player(*row.name).size, axis=1
+    return df.join(new_columns)
+
+
+def evaluate_results_total(
+    backend: Backend,
+    session: Session,
+    results: pd.DataFrame,
+    context: EvaluationContext | None = None,
+    memo_key: Hashable | None = None,
+) -> pd.DataFrame:
+    """
+    Evaluate the total results over multiple series by running the total hook.
+
+    :param backend: the backend to load data from
+    :param session: the database session to use
+    :param results: evaluated results as returned by :func:`evaluate_results`
+    :param context: a preloaded evaluation context, loaded on demand if ``None``
+    :param memo_key: key identifying unmodified ``results`` to hold the totals in the backend's result cache,
+        usually :func:`results_memo_key` of the arguments ``results`` were evaluated with, or ``None`` to not cache
+    :return: the total results indexed on ``player_id``
+    """
+
+    def compute():
+        total_context = context or EvaluationContext.load(backend, session)
+        df = pd.DataFrame(index=results.index.levels[1])
+        hook = plugin_manager.hook.evaluate_results_total
+        kwargs = dict(backend=backend, session=session, context=total_context, results=results)
+        return df.join(call_hookimpls(hook, hook.get_hookimpls(), kwargs))
+
+    if memo_key is None:
+        return compute()
+    return memoize(backend, ("evaluate_results_total", memo_key), compute).copy()
+
+
+def results_memo_key(
+    series_id: SeriesFilter,
+    compact: bool = False,
+    columns: Iterable[str] | None = None,
+    engine: EvaluationEngine = "pandas",
+) -> tuple[Hashable, ...]:
+    """Key of the results of :func:`evaluate_results` with the given arguments in the backend's result cache."""
+    return (
+        "evaluate_results",
+        series_filter_key(series_id),
+        compact,
+        None if columns is None else tuple(columns),
+        engine,
     )
-    return results
+
+
+def memoize(backend: Backend, key: tuple[Hashable, ...], compute: Callable[[], object]):
+    """
+    Get a value from the backend's in-process result cache or compute and store it if absent.
+    The current data version of the backend is prepended to the key,
+    so values computed before any commit of modified data, by any process, are never returned afterwards.
+    Cached values are shared, callers must copy mutable values before returning them.
+
+    :param backend: the backend holding the result cache
+    :param key: hashable key identifying the value besides the data version
+    :param compute: function computing the value on a cache miss
+    """
+    return backend.result_cache.get_or_compute((backend.data_version, *key), compute)
+
+
+def iter_evaluated_chunks(
+    backend: Backend, session: Session, chunk_size: int = 10, use_cache: bool = True, compact: bool = False
+) -> Iterator[tuple[EvaluationContext, pd.DataFrame]]:
+    """
+    Evaluate the results of all series chunk by chunk, so only one chunk is held in memory at a time.
+    Chunks are not held in the backend's result cache.
+
+    :param backend: the backend to load data from
+    :param session: the database session to use
+    :param chunk_size: count of series to evaluate at once
+    :param use_cache: whether to reuse stored evaluations of series that were not modified since
+    :param compact: whether to use memory-compact dtypes, see :func:`compact_frame`
+    :return: an iterator of the context and the evaluated results of each chunk
+    """
+    series_ids = backend.results(session).series_ids()
+
+    for i in range(0, len(series_ids), chunk_size):
+        chunk = series_ids[i : i + chunk_size]
+        context = EvaluationContext.load(backend, session, chunk)
+        yield context, _evaluate_results(backend, session, chunk, context, use_cache, 1, compact, None, 1)
+
+
+def evaluate_results_total_streaming(
+    backend: Backend, session: Session, chunk_size: int = 10, use_cache: bool = True, compact: bool = False
+) -> pd.DataFrame:
+    """
+    Aggregate the result evaluation over all series with memory proportional to one chunk of series.
+    The totals of each chunk are folded into running totals, numeric columns are summed up,
+    other columns take the value of the latest chunk.
+    Therefore, only correct for ``evaluate_results_total`` hooks aggregating numbers by sum.
+
+    :param backend: the backend to load data from
+    :param session: the database session to use
+    :param chunk_size: count of series to evaluate at once
+    :param use_cache: whether to reuse stored evaluations of series that were not modified since
+    :param compact: whether to use memory-compact dtypes, see :func:`compact_frame`
+    :return: the totals indexed on ``player_id``
+    """
+
+    def compute():
+        total = None
+
+        for context, results in iter_evaluated_chunks(backend, session, chunk_size, use_cache, compact):
+            chunk_total = evaluate_results_total(backend, session, results, context)
+            total = chunk_total if total is None else _fold_totals(total, chunk_total)
+
+        if total is None:
+            raise ValueError("No results in database.")
+
+        # folding merges the categories of the chunks into plain strings
+        return compact_frame(total) if compact else total
+
+    if not use_cache:
+        return compute()
+    return memoize(backend, ("evaluate_results_total", results_memo_key(None, compact)), compute).copy()
+
+
+class Standings:
+    """
+    Running totals of the results of all series, persisted in the backend's evaluation store
+    and updated incrementally between rounds, also across processes.
+    Each update only evaluates the series that are new or were modified since they were included.
+    New series are folded into the running totals like :func:`evaluate_results_total_streaming`,
+    while the totals are refolded from the stored totals per series if included series were modified or removed.
+    Therefore, only correct for ``evaluate_results_total`` hooks aggregating numbers by sum.
+    """
+
+    def __init__(self, backend: Backend):
+        self.backend = backend
+        self.series_ids: set[int] = set()
+        """IDs of the series included in the totals."""
+        self.totals = _empty_totals()
+        """The running totals indexed on ``player_id``."""
+
+    def update(self, session: Session, use_cache: bool = True) -> pd.DataFrame:
+        """
+        Evaluate the series not included yet or modified since and fold them into the stored totals.
+
+        :param session: the database session to use
+        :param use_cache: whether to reuse stored evaluations, see :func:`evaluate_results`
+        :return: the updated totals
+        """
+        evaluations = self.backend.evaluations(session)
+        key = evaluation_cache_key()
+        totals, included = evaluations.get_standings(key)
+        series_ids = set(self.backend.results(session).series_ids())
+
+        removed = included.keys() - series_ids
+        changed = sorted(i for i in series_ids if included.get(i, True))
+
+        if totals is None or changed or removed:
+            series_totals = self._evaluate_series_totals(session, changed, use_cache)
+
+            if totals is None or totals.empty or removed or not series_totals.keys().isdisjoint(included):
+                kept = evaluations.get_standings_series(included.keys() - removed - series_totals.keys(), key)
+                totals = _fold_all_totals(kept | series_totals)
+            else:
+                totals = reduce(_fold_totals, series_totals.values(), totals)
+
+            evaluations.store_standings(totals, series_totals, key, removed)
+
+        self.series_ids = series_ids
+        self.totals = totals
+        return totals
+
+    def _evaluate_series_totals(
+        self, session: Session, series_ids: list[int], use_cache: bool
+    ) -> dict[int, pd.DataFrame]:
+        if not series_ids:
+            return {}
+
+        context = EvaluationContext.load(self.backend, session, series_ids)
+        results = evaluate_results(self.backend, session, series_ids, context, use_cache=use_cache)
+        series_totals = {}
+
+        for series_id in series_ids:
+            series_results = results.loc[[series_id]]
+            series_results.index = series_results.index.remove_unused_levels()
+            series_totals[series_id] = evaluate_results_total(self.backend, session, series_results, context)
+
+        return series_totals
+
+
+def _empty_totals() -> pd.DataFrame:
+    return pd.DataFrame(index=pd.Index([], dtype="int64", name="player_id"))
+
+
+def _fold_all_totals(series_totals: dict[int, pd.DataFrame]) -> pd.DataFrame:
+    if not series_totals:
+        return _empty_totals()
+    return reduce(_fold_totals, (series_totals[i] for i in sorted(series_totals)))
+
+
+def _fold_totals(total: pd.DataFrame, chunk_total: pd.DataFrame) -> pd.DataFrame:
+    numeric = total.select_dtypes("number").columns.intersection(chunk_total.columns)
+    summed = total[numeric].add(chunk_total[numeric], fill_value=0).astype(total[numeric].dtypes.to_dict())
+    others = chunk_total.drop(columns=numeric).combine_first(total.drop(columns=numeric))
+    columns = total.columns.union(chunk_total.columns, sort=False)
+    return summed.join(others)[columns]
+
+
+GAME_POINTS = 50
+"""Points per won game, subtracted per lost game."""
+
+OPPONENTS_LOST_FACTORS = {4: 30, 3: 40}
+"""Points per lost game of an opponent by table size."""
+
+
+@hookimpl(specname="evaluate_results_prepare")
+@declare_columns(requires=["table_id"], provides=["table_size"])
+def determine_table_size(context: EvaluationContext, results: pd.DataFrame) -> pd.Series:
+    return results["table_id"].map(context.tables["size"]).fillna(0).astype("int64").rename("table_size")
 
 
 @hookimpl(specname="evaluate_results_main")
-def evaluate_points(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame:
-    results["won_points"] = results["won"] * 50
-    results["lost_points"] = -results["lost"] * 50
+@declare_columns(
+    requires=["won", "lost", "table_id", "table_size"],
+    provides=["won_points", "lost_points", "opponents_lost", "opponents_lost_points"],
+)
+def evaluate_points(results: pd.DataFrame) -> pd.DataFrame:
+    invalid_sizes = results.loc[~results["table_size"].isin(OPPONENTS_LOST_FACTORS), "table_size"]
+    if not invalid_sizes.empty:
+        raise ValueError(f"Table size can only be 3 or 4, but was {invalid_sizes.iloc[0]}.")
 
-    results["opponents_lost"] = results.apply(
-        lambda row: backend.results(session).get_opponents_lost(*row.name), axis=1
-    )
+    at_table = results.groupby(["series_id", "table_id"])["lost"]
+    results_at_table = at_table.transform("size")
+    incomplete = results[results_at_table != results["table_size"]]
+    if not incomplete.empty:
+        first = incomplete.iloc[0]
+        raise ValueError(
+            f"Table {first['table_id']} of series {incomplete.index[0][0]} has {first['table_size']} players, "
+            f"but only {results_at_table[incomplete.index[0]]} results."
+        )
 
-    def calc_opponents_lost_points(row):
-        if row["table_size"] == 4:
-            return row["opponents_lost"] * 30
-        if row["table_size"] == 3:
-            return row["opponents_lost"] * 40
-        raise ValueError(f"Table size can only be 3 or 4, but was {row['table_size']}.")
+    opponents_lost = at_table.transform("sum") - results["lost"]
 
-    results["opponents_lost_points"] = results.apply(calc_opponents_lost_points, axis=1)
-    return results
+    return pd.DataFrame(
+        {
+            "won_points": results["won"] * GAME_POINTS,
+            "lost_points": -results["lost"] * GAME_POINTS,
+            "opponents_lost": opponents_lost,
+            "opponents_lost_points": opponents_lost * results["table_size"].map(OPPONENTS_LOST_FACTORS),
+        }
+    )
 
 
 @hookimpl(specname="evaluate_results_revise")
-def sum_score(backend: Backend, results: pd.DataFrame) -> pd.DataFrame:
-    results["score"] = (
-        results["points"] + results["won_points"] + results["lost_points"] + results["opponents_lost_points"]
-    )
-    return results
+@declare_columns(requires=["points", "won_points", "lost_points", "opponents_lost_points"], provides=["score"])
+def sum_score(results: pd.DataFrame) -> pd.Series:
+    score = results["points"] + results["won_points"] + results["lost_points"] + results["opponents_lost_points"]
+    return score.rename("score")
 
 
 @hookimpl(specname="evaluate_results_revise")
-def add_player_names(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame:
-    results["player_name"] = results.apply(lambda row: backend.players(session).get(row.name[1]).name, axis=1)
-    return results
+@declare_columns(provides=["player_name"])
+def add_player_names(context: EvaluationContext, results: pd.DataFrame) -> pd.Series:
+    names = context.player_names(results.index.get_level_values("player_id"))
+    return pd.Series(names.to_numpy(), index=results.index, name="player_name")
 
 
 @hookimpl(specname="evaluate_results_total")
@@ -100,9 +539,10 @@ def total_points_and_score(backend: Backend, results: pd.DataFrame) -> pd.DataFr
 
 
 @hookimpl(specname="evaluate_results_total")
-def total_player_names(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame | pd.Series:
-    return pd.Series(
-        [backend.players(session).get(p).name for p in results.index.levels[1]],
-        index=results.index.levels[1],
-        name="player_name",
-    )
+def total_player_names(context: EvaluationContext, results: pd.DataFrame) -> pd.DataFrame | pd.Series:
+    names = context.player_names(results.index.levels[1]).rename("player_name")
+
+    # compact results hold the names as categoricals, the totals keep their dtype
+    if "player_name" in results and isinstance(results["player_name"].dtype, pd.CategoricalDtype):
+        return names.astype("category")
+    return names
@@ -1,4 +1,7 @@
-from pluggy import PluginManager, HookspecMarker, HookimplMarker
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from pluggy import HookCaller, HookImpl, PluginManager, HookspecMarker, HookimplMarker, Result
 
 NAME = "pyskat"
 
@@ -10,3 +13,110 @@ hookspec = HookspecMarker(NAME)
 
 hookimpl = HookimplMarker(NAME)
 """Decorator to declare a hook implementation."""
+
+_hookcall_monitors: list[tuple[Callable, Callable]] = []
+_hookimpl_monitors: list[tuple[Callable, Callable]] = []
+
+
+def add_selected_hookcall_monitoring(
+    before: Callable[[str, list[HookImpl], Mapping[str, object]], None],
+    after: Callable[[Result, str, list[HookImpl], Mapping[str, object]], None],
+) -> Callable[[], None]:
+    """
+    Add before/after tracing functions for the hook calls :func:`call_hookimpls` makes with a selection of
+    implementations, with the same signatures as :meth:`PluginManager.add_hookcall_monitoring`.
+    Each call is traced once with all selected implementations, regular hook calls are not traced,
+    use :meth:`PluginManager.add_hookcall_monitoring` for them.
+
+    :return: a function removing the added tracers
+    """
+    return _add_monitor(_hookcall_monitors, (before, after))
+
+
+def add_hookimpl_monitoring(
+    before: Callable[[str, list[HookImpl], Mapping[str, object]], None],
+    after: Callable[[Result, str, list[HookImpl], Mapping[str, object]], None],
+) -> Callable[[], None]:
+    """
+    Add before/after tracing functions for the single implementation calls made by :func:`call_hookimpls`,
+    with the same signatures as :meth:`PluginManager.add_hookcall_monitoring`, receiving one implementation each.
+    Regular hook calls are not traced, use :meth:`PluginManager.add_hookcall_monitoring` for them.
+
+    :return: a function removing the added tracers
+    """
+    return _add_monitor(_hookimpl_monitors, (before, after))
+
+
+def _add_monitor(monitors: list[tuple[Callable, Callable]], monitor: tuple[Callable, Callable]) -> Callable[[], None]:
+    monitors.append(monitor)
+
+    def undo() -> None:
+        monitors.remove(monitor)
+
+    return undo
+
+
+def call_hookimpls(hook: HookCaller, impls: Sequence[HookImpl], kwargs: Mapping[str, object], threads: int = 1) -> list:
+    """
+    Call a selection of the implementations of a hook, optionally running them in a thread pool.
+    Implementations taking a ``session`` argument are always run on the calling thread,
+    as database sessions must not be shared between threads.
+    If the hook has wrappers or its specification requests the first result only,
+    the hook is called regularly with all implementations to keep their semantics.
+
+    :param hook: the hook to call
+    :param impls: the implementations to call as returned by :meth:`HookCaller.get_hookimpls`
+    :param kwargs: the arguments of the hook call
+    :param threads: count of threads to run the implementations concurrently
+    :return: the non-``None`` results of the implementations in the order pluggy would call them
+    """
+    registered = hook.get_hookimpls()
+    firstresult = hook.spec is not None and hook.spec.opts.get("firstresult", False)
+
+    if firstresult or any(i.wrapper or i.hookwrapper for i in registered):
+        return hook(**kwargs)
+
+    # pluggy calls implementations in reverse order of registration
+    impls = list(reversed(impls))
+
+    def call() -> list:
+        if threads <= 1 or len(impls) <= 1:
+            results = [_call_hookimpl(hook.name, impl, kwargs) for impl in impls]
+        else:
+            with ThreadPoolExecutor(threads) as executor:
+                threaded = {
+                    i: executor.submit(_call_hookimpl, hook.name, i, kwargs)
+                    for i in impls
+                    if "session" not in i.argnames
+                }
+                results = [
+                    threaded[i].result() if i in threaded else _call_hookimpl(hook.name, i, kwargs) for i in impls
+                ]
+
+        return [r for r in results if r is not None]
+
+    return _traced(_hookcall_monitors, hook.name, impls, kwargs, call)
+
+
+def _call_hookimpl(hook_name: str, impl: HookImpl, kwargs: Mapping[str, object]) -> object:
+    return _traced(
+        _hookimpl_monitors, hook_name, [impl], kwargs, lambda: impl.function(*[kwargs[n] for n in impl.argnames])
+    )
+
+
+def _traced(
+    monitors: list[tuple[Callable, Callable]],
+    hook_name: str,
+    impls: list[HookImpl],
+    kwargs: Mapping[str, object],
+    call: Callable[[], object],
+) -> object:
+    monitors = list(monitors)
+    for before, _ in monitors:
+        before(hook_name, impls, kwargs)
+
+    outcome = Result.from_call(call)
+
+    for _, after in monitors:
+        after(outcome, hook_name, impls, kwargs)
+    return outcome.get_result()
@@ -1,14 +1,18 @@
 from ..backend import Backend
-from .manager import plugin_manager, hookimpl
+from .context import EvaluationContext
+from .manager import call_hookimpls, plugin_manager, hookimpl
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
 from sqlmodel import Session
 
 
-def create_result_plots(backend: Backend, session: Session, results: pd.DataFrame) -> list[go.Figure]:
-    plots = plugin_manager.hook.plot_results(backend=backend, session=session, results=results)
-    return plots
+def create_result_plots(
+    backend: Backend, session: Session, context: EvaluationContext, results: pd.DataFrame
+) -> list[go.Figure]:
+    hook = plugin_manager.hook.plot_results
+    kwargs = dict(backend=backend, session=session, context=context, results=results)
+    return call_hookimpls(hook, hook.get_hookimpls(), kwargs)
 
 
 @hookimpl(specname="plot_results")
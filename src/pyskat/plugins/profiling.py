@@ -0,0 +1,118 @@
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, asdict
+
+import numpy as np
+import pandas as pd
+from pluggy import HookImpl, PluginManager, Result
+
+from .manager import add_hookimpl_monitoring, add_selected_hookcall_monitoring, plugin_manager as default_plugin_manager
+
+
+@dataclass
+class HookImplStats:
+    """Accumulated statistics of the calls to a hook implementation."""
+
+    hook: str
+    plugin: str
+    function: str
+    calls: int = 0
+    wall_time: float = 0.0
+    rows: int = 0
+    memory: int = 0
+
+    def record(self, wall_time: float, result: object):
+        self.calls += 1
+        self.wall_time += wall_time
+
+        if isinstance(result, (pd.DataFrame, pd.Series)):
+            self.rows += len(result)
+            self.memory += int(np.sum(result.memory_usage(deep=False)))
+
+
+class HookProfiler:
+    """
+    Opt-in instrumentation of hook calls on a plugin manager.
+    Uses pluggy's hook call monitoring, :func:`add_selected_hookcall_monitoring` and :func:`add_hookimpl_monitoring`
+    to time the calls, recording wall time, call count and the size of returned data-frames
+    per hook and per hook implementation, each hook call is counted once for all its implementations.
+    Implementations of hooks called regularly, as hooks with wrappers are, are only recorded per hook.
+
+    Use as context manager::
+
+        with HookProfiler() as profiler:
+            report_content(backend, session)
+        print(profiler.to_frame())
+    """
+
+    def __init__(self, plugin_manager: PluginManager = default_plugin_manager):
+        self._plugin_manager = plugin_manager
+        self._undo: list[Callable[[], None]] = []
+        self._call_starts = threading.local()
+        self._lock = threading.Lock()
+        self.impl_stats: dict[tuple[str, str, str], HookImplStats] = {}
+        self.hook_stats: dict[str, HookImplStats] = {}
+
+    def start(self):
+        if not self._undo:
+            self._undo = [
+                self._plugin_manager.add_hookcall_monitoring(self._before, self._after_hookcall),
+                add_selected_hookcall_monitoring(self._before, self._after_hookcall),
+                add_hookimpl_monitoring(self._before, self._after_hookimpl),
+            ]
+
+    def stop(self):
+        for undo in self._undo:
+            undo()
+        self._undo = []
+
+    def __enter__(self) -> "HookProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _before(self, hook_name: str, hook_impls: list[HookImpl], kwargs: dict):
+        self._call_starts.__dict__.setdefault("stack", []).append(time.perf_counter())
+
+    def _after_hookcall(self, outcome: Result, hook_name: str, hook_impls: list[HookImpl], kwargs: dict):
+        wall_time = time.perf_counter() - self._call_starts.stack.pop()
+
+        with self._lock:
+            self.hook_stats.setdefault(hook_name, HookImplStats(hook_name, "*", "*")).record(wall_time, None)
+
+    def _after_hookimpl(self, outcome: Result, hook_name: str, hook_impls: list[HookImpl], kwargs: dict):
+        wall_time = time.perf_counter() - self._call_starts.stack.pop()
+        result = None if outcome.exception is not None else outcome.get_result()
+        impl = hook_impls[0]
+        function_name = getattr(impl.function, "__qualname__", repr(impl.function))
+
+        with self._lock:
+            self.impl_stats.setdefault(
+                (hook_name, impl.plugin_name, function_name),
+                HookImplStats(hook_name, impl.plugin_name, function_name),
+            ).record(wall_time, result)
+
+    def to_frame(self, sort_by: str = "wall_time") -> pd.DataFrame:
+        """
+        Get the recorded statistics per hook implementation.
+
+        :param sort_by: column to sort descending by
+        :return: a data-frame indexed on ``hook``, ``plugin`` and ``function``
+        """
+        df = pd.DataFrame(
+            [asdict(s) for s in self.impl_stats.values()],
+            columns=["hook", "plugin", "function", "calls", "wall_time", "rows", "memory"],
+        )
+        df.sort_values(sort_by, ascending=False, inplace=True)
+        df.set_index(["hook", "plugin", "function"], inplace=True)
+        return df
+
+    def to_dict(self) -> dict:
+        """Get the recorded statistics per hook and per hook implementation for JSON serialization."""
+        return {
+            "hooks": [asdict(s) for s in self.hook_stats.values()],
+            "hookimpls": [asdict(s) for s in self.impl_stats.values()],
+        }
@@ -1,21 +1,44 @@
 from sqlmodel import Session
 
-from ..manager import plugin_manager
+from ..context import EvaluationContext
+from ..manager import call_hookimpls, plugin_manager
 from . import hookimpls
 from ...backend import Backend
-from ..evaluation import evaluate_results, evaluate_results_total
+from ..evaluation import EvaluationEngine, evaluate_results, evaluate_results_total, memoize, results_memo_key
+from ..sql_engine import evaluate_results_total_sql
 import pandas as pd
 from .jinja_config import ENV
 
 plugin_manager.register(hookimpls)
 
 
-def report_standalone(backend: Backend, session: Session):
-    return ENV.get_template("main.html").render(report_content=report_content(backend, session))
+def report_standalone(
+    backend: Backend, session: Session, use_cache: bool = True, jobs: int = 1, engine: EvaluationEngine = "pandas"
+):
+    return ENV.get_template("main.html").render(
+        report_content=report_content(backend, session, use_cache, jobs, engine)
+    )
 
 
-def report_content(backend: Backend, session: Session):
-    series_evaluation = evaluate_results(backend, session,None)
-    total_evaluation = evaluate_results_total(backend, session, series_evaluation)
-    concatenated = pd.concat([series_evaluation, pd.concat([total_evaluation], keys=["total"])])
-    return "\n".join(plugin_manager.hook.report_results_display(backend=backend, results=concatenated))
+def report_content(
+    backend: Backend, session: Session, use_cache: bool = True, jobs: int = 1, engine: EvaluationEngine = "pandas"
+):
+    def compute():
+        context = EvaluationContext.load(backend, session)
+        series_evaluation = evaluate_results(backend, session, None, context, use_cache, jobs, engine=engine)
+
+        if engine == "sql":
+            total_evaluation = evaluate_results_total_sql(backend, session)
+        else:
+            total_evaluation = evaluate_results_total(
+                backend, session, series_evaluation, context, results_memo_key(None) if use_cache else None
+            )
+
+        concatenated = pd.concat([series_evaluation, pd.concat([total_evaluation], keys=["total"])])
+        hook = plugin_manager.hook.report_results_display
+        kwargs = dict(backend=backend, session=session, context=context, results=concatenated)
+        return "\n".join(call_hookimpls(hook, hook.get_hookimpls(), kwargs))
+
+    if not use_cache:
+        return compute()
+    return memoize(backend, ("report_content", engine), compute)
@@ -3,61 +3,76 @@ import plotly.graph_objects as go
 
 from .manager import hookspec
 from ..backend import Backend
+from .context import EvaluationContext
 from sqlmodel import Session
 
 
 @hookspec
-def evaluate_results_prepare(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame | pd.Series:
+def evaluate_results_prepare(
+    backend: Backend, session: Session, context: EvaluationContext, results: pd.DataFrame
+) -> pd.DataFrame | pd.Series:
     """
-    Evaluates results by adding new columns to the given frame.
-    The given data-frame can be directly updated, as each hook implementation receives its own copy.
-    The result data-frames will be merged afterwards.
+    Evaluates results by computing new columns from the given frame.
+    Implementations should return only their new columns, returned input columns are ignored.
+    The given data-frame is a shallow copy, so adding columns to it does not affect the evaluation frame.
+    The returned columns of all implementations will be merged afterwards.
     Given and returned data are/must be indexed first on ``series_id`` and then on ``player_id``.
 
     :param backend: the current backend for acquisition of additional data
     :param session: the current database session for acquisition of additional data
+    :param context: preloaded players, series, tables and seating to use instead of per-row queries
     :param results: a data-frame or series with the respective results
-    :return: the given data-frame updated with evaluation data
+    :return: a data-frame or series with the new evaluation columns
     """
     raise NotImplementedError("This is just a hook specification")
 
 
 @hookspec
-def evaluate_results_main(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame | pd.Series:
+def evaluate_results_main(
+    backend: Backend, session: Session, context: EvaluationContext, results: pd.DataFrame
+) -> pd.DataFrame | pd.Series:
     """
-    Evaluates results by adding new columns to the given frame.
-    The given data-frame can be directly updated, as each hook implementation receives its own copy.
-    The result data-frames will be merged afterwards.
+    Evaluates results by computing new columns from the given frame.
+    Implementations should return only their new columns, returned input columns are ignored.
+    The given data-frame is a shallow copy, so adding columns to it does not affect the evaluation frame.
+    The returned columns of all implementations will be merged afterwards.
     The given data-frame will include the modifications of ``evaluate_results_prepare`` calls.
     Given and returned data are/must be indexed first on ``series_id`` and then on ``player_id``.
 
     :param backend: the current backend for acquisition of additional data
     :param session: the current database session for acquisition of additional data
+    :param context: preloaded players, series, tables and seating to use instead of per-row queries
     :param results: a data-frame with the respective results
-    :return: the given data-frame updated with evaluation data
+    :return: a data-frame or series with the new evaluation columns
     """
     raise NotImplementedError("This is just a hook specification")
 
 
 @hookspec
-def evaluate_results_revise(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame | pd.Series:
+def evaluate_results_revise(
+    backend: Backend, session: Session, context: EvaluationContext, results: pd.DataFrame
+) -> pd.DataFrame | pd.Series:
     """
-    Evaluates results by adding new columns to the given frame.
-    The given data-frame can be directly updated, as each hook implementation receives its own copy.
-    The result data-frames will be merged afterwards.
+    Evaluates results by computing new columns from the given frame.
+    Implementations should return only their new columns, returned input columns are ignored.
+    The given data-frame is a shallow copy, so adding columns to it does not affect the evaluation frame.
+    The returned columns of all implementations will be merged afterwards.
     The given data-frame will include the modifications of ``evaluate_results_main`` calls.
     Given and returned data are/must be indexed first on ``series_id`` and then on ``player_id``.
 
     :param backend: the current backend for acquisition of additional data
     :param session: the current database session for acquisition of additional data
+    :param context: preloaded players, series, tables and seating to use instead of per-row queries
     :param results: a data-frame with the respective results
-    :return: the given data-frame updated with evaluation data
+    :return: a data-frame or series with the new evaluation columns
     """
     raise NotImplementedError("This is just a hook specification")
 
 
 @hookspec
-def evaluate_results_total(backend: Backend, session: Session, results: pd.DataFrame) -> pd.DataFrame | pd.Series:
+def evaluate_results_total(
+    backend: Backend, session: Session, context: EvaluationContext, results: pd.DataFrame
+) -> pd.DataFrame | pd.Series:
     """
     Aggregate the result evaluation over all series.
     Given data are indexed first on ``series_id`` and then on ``player_id``.
@@ -66,19 +81,21 @@ def evaluate_results_total(backend: Backend, session: Session, results: pd.DataF
 
     :param backend: the current backend for acquisition of additional data
     :param session: the current database session for acquisition of additional data
+    :param context: preloaded players, series, tables and seating to use instead of per-row queries
     :param results: a data-frame with the respective results
-    :return: the given data-frame updated with evaluation data
+    :return: a data-frame or series with the new evaluation columns
     """
     raise NotImplementedError("This is just a hook specification")
 
 
 @hookspec
-def plot_results(backend: Backend, session: Session, results: pd.DataFrame) -> go.Figure:
+def plot_results(backend: Backend, session: Session, context: EvaluationContext, results: pd.DataFrame) -> go.Figure:
     """
     Create a plot visualizing parts of the results.
 
     :param backend: the current backend for acquisition of additional data
     :param session: the current database session for acquisition of additional data
+    :param context: preloaded players, series, tables and seating to use instead of per-row queries
     :param results: data-frame of evaluated results
     :return: a plotly figure object
     """
@@ -86,12 +103,15 @@ def plot_results(backend: Backend, session: Session, results: pd.DataFrame) -> g
 
 
 @hookspec
-def report_results_display(backend: Backend, session: Session, results: pd.DataFrame) -> str:
+def report_results_display(
+    backend: Backend, session: Session, context: EvaluationContext, results: pd.DataFrame
+) -> str:
     """
     Generate HTML code to display result data in the HTML report.
 
     :param backend: the current backend for acquisition of additional data
     :param session: the current database session for acquisition of additional data
+    :param context: preloaded players, series, tables and seating to use instead of per-row queries
     :param results: data-frame of evaluated results
     :return: a string containing valid HTML code
     """
@@ -0,0 +1,168 @@
+"""
+Evaluation engine compiling the built-in scoring into SQL queries run by the database.
+Only the final per-series and total frames are transferred, instead of the raw rows to evaluate in Python.
+Window functions are required, which are supported by PostgreSQL and SQLite 3.25 or later.
+"""
+
+from sqlalchemy import CTE, and_, case, func, select
+from sqlmodel import Session
+
+import pandas as pd
+
+from ..backend import Backend
+from ..backend.data_model import Player, Result, SeriesFilter, Table, TablePlayerLink, filter_series, read_pandas
+from . import evaluation
+from .manager import plugin_manager
+
+EVALUATION_HOOKS = ["evaluate_results_prepare", "evaluate_results_main", "evaluate_results_revise"]
+
+TOTAL_COLUMNS = [
+    "points",
+    "won",
+    "won_points",
+    "lost",
+    "lost_points",
+    "opponents_lost",
+    "opponents_lost_points",
+    "score",
+]
+
+
+def evaluate_results_sql(backend: Backend, session: Session, series_id: SeriesFilter) -> pd.DataFrame:
+    """
+    Evaluate the results of one or all series with the built-in scoring in one SQL query.
+    Yields the same frame as :func:`pyskat.plugins.evaluation.evaluate_results` without further plugins.
+
+    :param backend: the backend to query
+    :param session: the database session to use
+    :param series_id: the series or multiple series to evaluate, or all series if ``None``
+    :return: the evaluated results indexed first on ``series_id`` and then on ``player_id``
+    """
+    _check_builtin_only(EVALUATION_HOOKS)
+    evaluated = _evaluated(series_id)
+
+    dtypes = {c: "int64" for c in ["points", "won", "lost", "table_size", *TOTAL_COLUMNS]} | {"table_id": "Int64"}
+    df = read_pandas(
+        session,
+        select(evaluated).order_by(evaluated.c.series_id, evaluated.c.player_id),
+        ["series_id", "player_id"],
+        dtypes,
+    )
+
+    if df.empty:
+        raise ValueError(f"No results for series {series_id} in database.")
+
+    _raise_invalid_table_sizes(df["table_size"])
+    _raise_incomplete_tables(df.pop("table_complete"))
+    return df
+
+
+def evaluate_results_total_sql(backend: Backend, session: Session, series_id: SeriesFilter = None) -> pd.DataFrame:
+    """
+    Aggregate the evaluated results over one or multiple series with the built-in scoring in one SQL query.
+    Yields the same frame as :func:`pyskat.plugins.evaluation.evaluate_results_total` without further plugins.
+
+    :param backend: the backend to query
+    :param session: the database session to use
+    :param series_id: the series or multiple series to aggregate, or all series if ``None``
+    :return: the totals indexed on ``player_id``
+    """
+    _check_builtin_only(EVALUATION_HOOKS + ["evaluate_results_total"])
+    evaluated = _evaluated(series_id)
+
+    selector = (
+        select(
+            evaluated.c.player_id,
+            *(func.sum(evaluated.c[c]).label(c) for c in TOTAL_COLUMNS),
+            func.min(evaluated.c.player_name).label("player_name"),
+            func.min(evaluated.c.table_size).label("min_table_size"),
+            func.max(evaluated.c.table_size).label("max_table_size"),
+            func.min(evaluated.c.table_complete).label("table_complete"),
+        )
+        .group_by(evaluated.c.player_id)
+        .order_by(evaluated.c.player_id)
+    )
+    df = read_pandas(session, selector, "player_id", {c: "int64" for c in TOTAL_COLUMNS})
+
+    if df.empty:
+        raise ValueError(f"No results for series {series_id} in database.")
+
+    _raise_invalid_table_sizes(pd.concat([df.pop("min_table_size"), df.pop("max_table_size")]))
+    _raise_incomplete_tables(df.pop("table_complete"))
+    return df
+
+
+def _evaluated(series_id: SeriesFilter) -> CTE:
+    seats = select(
+        Table.series_id,
+        TablePlayerLink.player_id,
+        TablePlayerLink.table_id,
+        func.count().over(partition_by=TablePlayerLink.table_id).label("table_size"),
+    ).join(TablePlayerLink, Table.id == TablePlayerLink.table_id)
+    seats = filter_series(seats, Table.series_id, series_id).cte("seats")
+
+    seated = select(
+        Result.series_id,
+        Result.player_id,
+        Result.points,
+        Result.won,
+        Result.lost,
+        Result.remarks,
+        seats.c.table_id,
+        func.coalesce(seats.c.table_size, 0).label("table_size"),
+        (func.sum(Result.lost).over(partition_by=[Result.series_id, seats.c.table_id]) - Result.lost).label(
+            "opponents_lost"
+        ),
+        func.count().over(partition_by=[Result.series_id, seats.c.table_id]).label("table_results"),
+    ).outerjoin(seats, and_(seats.c.series_id == Result.series_id, seats.c.player_id == Result.player_id))
+    seated = filter_series(seated, Result.series_id, series_id).cte("seated")
+
+    won_points = seated.c.won * evaluation.GAME_POINTS
+    lost_points = -seated.c.lost * evaluation.GAME_POINTS
+    opponents_lost_points = seated.c.opponents_lost * case(
+        evaluation.OPPONENTS_LOST_FACTORS, value=seated.c.table_size, else_=0
+    )
+
+    return (
+        select(
+            seated.c.series_id,
+            seated.c.player_id,
+            seated.c.points,
+            seated.c.won,
+            seated.c.lost,
+            seated.c.remarks,
+            seated.c.table_id,
+            seated.c.table_size,
+            won_points.label("won_points"),
+            lost_points.label("lost_points"),
+            seated.c.opponents_lost,
+            opponents_lost_points.label("opponents_lost_points"),
+            (seated.c.points + won_points + lost_points + opponents_lost_points).label("score"),
+            Player.name.label("player_name"),
+            case((seated.c.table_results == seated.c.table_size, 1), else_=0).label("table_complete"),
+        )
+        .join(Player, Player.id == seated.c.player_id)
+        .cte("evaluated")
+    )
+
+
+def _raise_invalid_table_sizes(table_sizes: pd.Series):
+    invalid_sizes = table_sizes[~table_sizes.isin(evaluation.OPPONENTS_LOST_FACTORS)]
+    if not invalid_sizes.empty:
+        raise ValueError(f"Table size can only be 3 or 4, but was {invalid_sizes.iloc[0]}.")
+
+
+def _raise_incomplete_tables(table_complete: pd.Series):
+    incomplete = table_complete[table_complete == 0]
+    if not incomplete.empty:
+        raise ValueError(f"The table of player {incomplete.index[0]} has more players than results.")
+
+
+def _check_builtin_only(hook_names: list[str]):
+    for name in hook_names:
+        for impl in getattr(plugin_manager.hook, name).get_hookimpls():
+            if impl.plugin is not evaluation:
+                raise ValueError(
+                    f"The SQL engine only supports the built-in evaluation, "
+                    f"but plugin {impl.plugin_name} implements {name}."
+                )
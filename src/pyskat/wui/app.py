@@ -5,6 +5,7 @@ from pathlib import Path
 from flask import Flask, session, render_template, url_for
 
 from pyskat.backend import Backend
+from pyskat.backend.pool_settings import PoolSettings
 from . import default_config
 
 
@@ -17,11 +18,14 @@ def create_app(
     app.config.from_object(default_config)
 
     app.config.from_file("pyskat_config.toml", load=tomllib.load, silent=True)
-    app.config.from_prefixed_env(prefix="PYSKAT_")
+    app.config.from_prefixed_env(prefix="PYSKAT")
 
     if theme:
         app.config["THEME"] = theme
 
+    backend.result_cache.maxsize = int(app.config["EVALUATION_CACHE_SIZE"])
+    backend.configure_pool(backend.pool.merge(PoolSettings.from_config(app.config)))
+
     def provide_backend_and_session():
         from flask import g
 
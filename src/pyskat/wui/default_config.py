@@ -1,3 +1,4 @@
 SECRET_KEY = "abc"
 DEBUG = True
 THEME = "darkly"
+EVALUATION_CACHE_SIZE = 32
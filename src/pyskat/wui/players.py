@@ -8,7 +8,7 @@ bp = Blueprint("players", __name__, url_prefix="/players")
 
 @bp.get("/")
 def index():
-    players_list = g.backend.players(g.session).all()
+    players_list = g.backend.players(g.session).all(loading=None)
 
     return render_template(
         "players.html",
@@ -12,20 +12,29 @@ def index(series_id):
     series_id = series_id or session.get("current_series", None)
 
     if series_id:
-        tables_list = g.backend.tables(g.session).all_for_series(series_id)
+        tables_list = g.backend.tables(g.session).all_for_series(series_id, loading=None)
+        seat_index = g.backend.tables(g.session).seat_index(series_id)
+        seated = seat_index.table_players()
         results = g.backend.results(g.session).all_for_series(series_id)
+
+        player_ids = [r.player_id for r in results]
+        unseated = [p for p, t in zip(player_ids, seat_index.table_of(player_ids).tolist()) if t < 0]
+        if unseated:
+            flash(f"Results of players not seated at any table: {', '.join(map(str, unseated))}.", "warning")
     else:
         flash("Please select a series on the series page to use this page.", "warning")
         tables_list = []
+        seated = {}
         results = []
 
-    players = g.backend.players(g.session).all()
+    players = g.backend.players(g.session).all(loading=None)
     series = g.backend.series(g.session).get(series_id)
 
     return render_template(
         "results.html",
         series=series,
         tables=tables_list,
+        seated=seated,
         players={p.id: p for p in players},
         results={r.player_id: r for r in results},
     )
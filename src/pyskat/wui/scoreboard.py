@@ -0,0 +1,103 @@
+"""
+Read-only scoreboard served as ASGI application on the :class:`AsyncBackend`,
+so many concurrent viewers are served by one event loop instead of blocking a worker thread each.
+The editing WUI stays a synchronous Flask application on the :class:`Backend`, see :mod:`pyskat.wui.app`.
+"""
+
+from collections.abc import Awaitable, Callable, MutableMapping
+from typing import Any
+
+import pandas as pd
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from ..backend import Backend
+from ..backend.async_backend import AsyncBackend
+from ..plugins import evaluate_results, evaluate_results_total, report_standalone
+from ..plugins.evaluation import results_memo_key
+
+Scope = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+Send = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+
+def create_scoreboard_app(backend: AsyncBackend) -> ASGIApp:
+    """
+    Create the ASGI application serving the scoreboard, to be run by any ASGI server.
+    The schema is created on startup and the connections are closed on shutdown, if the server sends lifespan events.
+
+    Routes:
+
+    - ``/``: the standalone evaluation report as HTML
+    - ``/totals.json``: the total results per player as JSON records in descending order of score
+
+    :param backend: the backend to read from
+    """
+
+    async def app(scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "lifespan":
+            await _lifespan(backend, receive, send)
+        elif scope["type"] == "http":
+            await _respond(backend, scope, send)
+
+    return app
+
+
+async def _lifespan(backend: AsyncBackend, receive: Receive, send: Send):
+    while True:
+        message = await receive()
+
+        if message["type"] == "lifespan.startup":
+            await backend.initialize()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await backend.dispose()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def _respond(backend: AsyncBackend, scope: Scope, send: Send):
+    route = ROUTES.get(scope["path"])
+
+    if route is None:
+        return await _send(send, 404, "text/plain; charset=utf-8", b"Not Found")
+    if scope["method"] not in ("GET", "HEAD"):
+        return await _send(send, 405, "text/plain; charset=utf-8", b"Method Not Allowed")
+
+    async with backend.get_session() as session:
+        try:
+            content_type, body = await route(backend, session)
+        except ValueError as e:
+            return await _send(send, 404, "text/plain; charset=utf-8", str(e).encode())
+
+    await _send(send, 200, content_type, b"" if scope["method"] == "HEAD" else body)
+
+
+async def _send(send: Send, status: int, content_type: str, body: bytes):
+    headers = [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _report(backend: AsyncBackend, session: AsyncSession) -> tuple[str, bytes]:
+    content = await backend.run_sync(session, report_standalone)
+    return "text/html; charset=utf-8", content.encode()
+
+
+async def _totals(backend: AsyncBackend, session: AsyncSession) -> tuple[str, bytes]:
+    totals = await backend.run_sync(session, _evaluate_totals)
+    return "application/json", totals.to_json(orient="records").encode()
+
+
+def _evaluate_totals(backend: Backend, session: Session) -> pd.DataFrame:
+    results = evaluate_results(backend, session, None)
+    totals = evaluate_results_total(backend, session, results, memo_key=results_memo_key(None))
+    return totals.sort_values("score", ascending=False).reset_index()
+
+
+ROUTES: dict[str, Callable[[AsyncBackend, AsyncSession], Awaitable[tuple[str, bytes]]]] = {
+    "/": _report,
+    "/totals.json": _totals,
+}
+"""Handlers of the scoreboard's paths, returning the content type and body of the response."""
@@ -10,7 +10,7 @@ bp = Blueprint("series", __name__, url_prefix="/series")
 
 @bp.get("/")
 def index():
-    series_list = g.backend.series(g.session).all()
+    series_list = g.backend.series(g.session).all(loading=None)
 
     return render_template(
         "series.html", series=series_list, now=datetime.today().isoformat(sep=" ", timespec="minutes")
@@ -13,20 +13,23 @@ def index(series_id):
 
     if series_id:
         series = g.backend.series(g.session).get(series_id)
-        tables_list = g.backend.tables(g.session).all_for_series(series_id)
+        tables_list = g.backend.tables(g.session).all_for_series(series_id, loading=None)
+        seated = g.backend.tables(g.session).seat_index(series_id).table_players()
         results = g.backend.results(g.session).all_for_series(series_id)
     else:
         flash("Please select a series on the series page to use this page.", "warning")
         tables_list = []
+        seated = {}
         results = []
         series = None
 
-    players = g.backend.players(g.session).all()
+    players = g.backend.players(g.session).all(loading=None)
 
     return render_template(
         "tables.html",
         series=series,
         tables=tables_list,
+        seated=seated,
         players={p.id: p for p in players},
         results={r.player_id: r for r in results},
     )
@@ -115,34 +118,21 @@ def redirect_to_index(series_id):
 @bp.get("/check/<int:series_id>")
 def check(series_id):
     series_id = series_id or session.get("current_series", None)
-    tables = g.backend.tables(g.session).all_for_series(series_id)
-
-    is_valid = True
-    series_players = []
-
-    for t in tables:
-        table_players = []
-
-        for p in t.player_ids:
-            if p in table_players:
-                flash_player_multiply_present_in_table(t.table_id, p)
-                is_valid = False
-            else:
-                table_players.append(p)
-            if p in series_players:
-                flash_player_multiply_present_in_series(t.table_id, p)
-                is_valid = False
-            else:
-                series_players.append(p)
-
-    if is_valid:
-        flash("Current table distribution is valid.", "success")
-    return redirect_to_index(series_id)
+    seat_index = g.backend.tables(g.session).seat_index(series_id)
+    duplicates = seat_index.duplicates().tolist()
 
+    # the links of a table can not hold a player twice, so only duplicates at different tables are possible
+    for p in duplicates:
+        table_ids = seat_index.table_ids[seat_index.player_ids == p]
+        flash_player_multiply_present_in_series(int(table_ids[-1]), p)
 
-def flash_player_multiply_present_in_table(table_id: int, player_id: int):
-    player = g.backend.players(g.session).get(player_id)
-    flash(f"Player {player.name} ({player.id}) is defined multiple times at table {table_id}.", "warning")
+    unseated = g.backend.results(g.session).unseated_player_ids(series_id)
+    for p in unseated:
+        flash_player_not_seated(p)
+
+    if not duplicates and not unseated:
+        flash("Current table distribution is valid.", "success")
+    return redirect_to_index(series_id)
 
 
 def flash_player_multiply_present_in_series(table_id: int, player_id: int):
@@ -153,6 +143,11 @@ def flash_player_multiply_present_in_series(table_id: int, player_id: int):
     )
 
 
+def flash_player_not_seated(player_id: int):
+    player = g.backend.players(g.session).get(player_id)
+    flash(f"Player {player.name} ({player.id}) has a result, but is not seated at any table.", "warning")
+
+
 @bp.post("/shuffle", defaults=dict(series_id=None))
 @bp.post("/shuffle/<int:series_id>")
 def shuffle(series_id):
@@ -163,17 +158,20 @@ def shuffle(series_id):
         exclude = [int(e) for e in request.form.getlist("exclude")]
         include_only = [int(e) for e in request.form.getlist("include_only")]
         active_only = request.form.get("active_only", False, bool)
+        strategy = request.form.get("strategy", "random")
     except KeyError:
         abort(400, description="Invalid form data submitted.")
 
     try:
-        g.backend.tables(g.session).shuffle_players_for_series(
+        score = g.backend.tables(g.session).shuffle_players_for_series(
             series_id=series_id,
             active_only=active_only,
             include=include,
             exclude=exclude,
             include_only=include_only,
+            strategy=strategy,
         )
+        flash(f"Shuffled players to tables with {score.repeats} repeated pairings.", "success")
     except ValueError as e:
         flash(str(e), "danger")
 
@@ -0,0 +1,45 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from pyskat.backend.async_backend import AsyncBackend, async_url
+from pyskat.plugins import evaluate_results
+
+
+def test_async_url():
+    assert async_url("sqlite:///db.sqlite").drivername == "sqlite+aiosqlite"
+    assert async_url("postgresql://host/db").drivername == "postgresql+asyncpg"
+    assert async_url("postgresql+psycopg://host/db").drivername == "postgresql+psycopg"
+
+
+def test_async_backend(tmp_path):
+    async def run():
+        backend = AsyncBackend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+        await backend.initialize()
+
+        async with backend.get_session() as session:
+            await backend.players(session).add_many([dict(name=f"P{i}") for i in range(4)])
+            series = await backend.series(session).add("S1", datetime(2024, 1, 1))
+            await backend.tables(session).add(series.id, 1, 2, 3, 4)
+            await backend.results(session).add_many(
+                [dict(series_id=series.id, player_id=i, points=10 * i, won=1, lost=i) for i in range(1, 5)]
+            )
+
+            assert (await backend.players(session).get(2)).name == "P1"
+            assert [p.id for p in (await backend.tables(session).all_for_series(series.id))[0].players] == [1, 2, 3, 4]
+            with pytest.raises(KeyError):
+                await backend.players(session).get(99)
+
+            version = await backend.get_data_version()
+            evaluated = await backend.run_sync(session, evaluate_results, series.id)
+            assert evaluated["opponents_lost"].tolist() == [9, 8, 7, 6]
+
+            await backend.results(session).update(series.id, 1, points=0)
+            assert await backend.get_data_version() > version
+
+        await backend.dispose()
+
+    asyncio.run(run())
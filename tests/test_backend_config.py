@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import make_url, text
+
+from pyskat.backend import Backend
+from pyskat.backend.pool_settings import PoolSettings
+from pyskat.backend.sqlite_profile import SQLiteProfile
+
+
+def test_sqlite_profile(tmp_path):
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}", sqlite_profile="performance")
+
+    with backend.engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert connection.execute(text("PRAGMA cache_size")).scalar() == SQLiteProfile.cache_size
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == SQLiteProfile.busy_timeout
+
+
+def test_sqlite_profile_default(tmp_path):
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    with backend.engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+
+
+def test_pool_settings():
+    pool = PoolSettings(size=2).merge(PoolSettings.from_config({"POOL_RECYCLE": 60, "POOL_PRE_PING": False}))
+    assert pool == PoolSettings(size=2, recycle=60, pre_ping=False)
+
+    assert pool.engine_options(make_url("sqlite:///db.sqlite")) == dict(
+        pool_size=2, pool_recycle=60, pool_pre_ping=False
+    )
+    assert PoolSettings().engine_options(make_url("postgresql://localhost/pyskat")) == dict(
+        pool_size=5, max_overflow=10, pool_recycle=1800, pool_pre_ping=True, pool_timeout=30
+    )
+
+
+def test_configure_pool(tmp_path):
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}", sqlite_profile="performance")
+    backend.configure_pool(PoolSettings(size=2, pre_ping=True))
+
+    assert backend.engine.pool.size() == 2
+
+    with backend.engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+
+
+def test_configure_pool_memory():
+    backend = Backend("sqlite://")
+
+    with backend.get_session() as session:
+        backend.players(session).add("P1")
+
+    backend.configure_pool(PoolSettings())
+    with pytest.raises(ValueError):
+        backend.configure_pool(PoolSettings(pre_ping=True))
+
+    with backend.get_session() as session:
+        assert backend.players(session).get(1).name == "P1"
@@ -0,0 +1,149 @@
+from datetime import datetime
+from itertools import groupby
+
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import event
+
+from pyskat.backend import Backend
+from pyskat.plugins import evaluate_results
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+
+def test_add_many(backend: Backend):
+    with backend.get_session() as session:
+        player_ids = backend.players(session).add_many(pd.DataFrame({"name": [f"P{i}" for i in range(7)]}))
+        assert player_ids == list(range(1, 8))
+
+        series_ids = backend.series(session).add_many([dict(name="S1", date=datetime(2024, 1, 1))])
+        assert series_ids == [1]
+
+        table_ids = backend.tables(session).add_many(
+            [
+                dict(series_id=1, player1_id=1, player2_id=2, player3_id=3, player4_id=4),
+                dict(series_id=1, player_ids=[5, 6, 7], remarks="three"),
+            ]
+        )
+        assert table_ids == [1, 2]
+        assert backend.tables(session).get(2).player_ids == [5, 6, 7]
+        assert backend.tables(session).get(2).remarks == "three"
+
+        results = pd.DataFrame(
+            dict(points=[100, 200], won=[1, 2], lost=[0, 1]),
+            index=pd.MultiIndex.from_tuples([(1, 1), (1, 2)], names=["series_id", "player_id"]),
+        )
+        assert backend.results(session).add_many(results) == [(1, 1), (1, 2)]
+        assert backend.results(session).get(1, 2).points == 200
+
+
+def test_add_many_single_transaction(backend: Backend):
+    statements = []
+    commits = []
+    event.listen(backend.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    event.listen(backend.engine, "commit", commits.append)
+
+    with backend.get_session() as session:
+        player_ids = backend.players(session).add_many([dict(name=f"P{i}") for i in range(60)])
+
+    assert player_ids == list(range(1, 61))
+    assert len(commits) == 1
+    assert not [s for s in statements if s.startswith("SELECT")]
+
+
+def test_add_many_validates_all(backend: Backend):
+    with backend.get_session() as session:
+        backend.players(session).add_many([dict(name="P1")])
+        backend.series(session).add("S1", datetime(2024, 1, 1))
+
+        with pytest.raises(ValidationError):
+            backend.results(session).add_many(
+                [dict(series_id=1, player_id=1, points=1, won=1, lost=1), dict(series_id=1, player_id=1, won=-1)]
+            )
+
+        assert backend.results(session).all() == []
+
+        with pytest.raises(KeyError):
+            backend.tables(session).add_many([dict(series_id=1, player_ids=[1, 2, 3])])
+
+
+def test_replace_tables_for_series(backend: Backend):
+    with backend.get_session() as session:
+        backend.players(session).add_many([dict(name=f"P{i}") for i in range(8)])
+        backend.series(session).add_many([dict(name=f"S{i}", date=datetime(2024, 1, i)) for i in range(1, 3)])
+        backend.tables(session).add_many([dict(series_id=s, player_ids=[1, 2, 3, 4]) for s in [1, 2]])
+
+        statements = []
+        event.listen(backend.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        table_ids = backend.tables(session).replace_for_series(1, [[1, 2, 3, 4], [5, 6, 7, 8]])
+
+        bookkeeping = ("seriesevaluation", "standingsseries", "dataversion")
+        writes = [
+            s.split()[:3] for s in statements if not s.startswith("SELECT") and not any(t in s for t in bookkeeping)
+        ]
+        # generated keys of tables are returned in order by one INSERT per table on SQLite
+        assert [w for w, _ in groupby(w[0] + " " + w[2].strip('"') for w in writes)] == [
+            "DELETE tableplayerlink",
+            "DELETE table",
+            "INSERT table",
+            "INSERT tableplayerlink",
+        ]
+        assert table_ids == [3, 4]
+        assert backend.tables(session).get(4).player_ids == [5, 6, 7, 8]
+        assert backend.tables(session).seating(1)["table_id"].tolist() == [3, 3, 3, 3, 4, 4, 4, 4]
+
+        backend.tables(session).clear_for_series(1)
+        assert backend.tables(session).to_pandas().index.tolist() == [2]
+        assert backend.tables(session).get(2).player_ids == [1, 2, 3, 4]
+
+
+def test_update_and_upsert_many(backend: Backend):
+    with backend.get_session() as session:
+        backend.players(session).add_many([dict(name=f"P{i}") for i in range(1, 5)])
+
+        assert backend.players(session).update_many([dict(id=2, name="new"), dict(id=3, active=False)]) == [2, 3]
+        assert backend.players(session).get(2).name == "new"
+        assert not backend.players(session).get(3).active
+        assert backend.players(session).get(3).name == "P3"
+
+        with pytest.raises(KeyError):
+            backend.players(session).update_many([dict(id=10, name="missing")])
+
+        assert backend.players(session).upsert_many([dict(id=1, name="up"), dict(name="P5")]) == [1, 5]
+        assert [p.name for p in backend.players(session).all()] == ["up", "new", "P3", "P4", "P5"]
+
+        backend.series(session).add("S1", datetime(2024, 1, 1))
+        backend.series(session).add("S2", datetime(2024, 1, 2))
+        backend.tables(session).add_many([dict(series_id=1, player_ids=[1, 2, 3])])
+        backend.tables(session).update_many([dict(id=1, series_id=2, player_ids=[2, 3, 4, 5])])
+        assert backend.tables(session).get(1).series_id == 2
+        assert sorted(backend.tables(session).get(1).player_ids) == [2, 3, 4, 5]
+
+
+def test_fake_data_fast(tmp_path):
+    frames = []
+
+    for name in ["a", "b"]:
+        backend = Backend(f"sqlite:///{tmp_path / name}.sqlite")
+        with backend.get_session() as session:
+            backend.players(session).add("Existing")
+
+        backend.fake_data(13, 3, fast=True, seed=42)
+
+        with backend.get_session() as session:
+            results = backend.results(session).to_pandas()
+            assert len(results) == 39
+            assert 1 not in results.index.get_level_values("player_id")
+
+            table_sizes = [len(t.players) for t in backend.tables(session).all()]
+            assert sorted(table_sizes) == [3] * 9 + [4] * 3
+
+            evaluated = evaluate_results(backend, session, None, use_cache=False)
+            assert len(evaluated) == 39
+            frames.append(results)
+
+    pd.testing.assert_frame_equal(frames[0], frames[1])
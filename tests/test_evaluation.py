@@ -0,0 +1,415 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from pyskat.backend import Backend
+from pyskat.plugins import (
+    EvaluationContext,
+    evaluate_results,
+    evaluate_results_total,
+    evaluate_results_total_streaming,
+    report_content,
+    Standings,
+    evaluate_results_sql,
+    evaluate_results_total_sql,
+)
+from pyskat.plugins.evaluation import evaluation_cache_key
+from pyskat.plugins.manager import plugin_manager
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    with backend.get_session() as session:
+        backend.series(session).add("Nr1", datetime(2024, 2, 4))
+        backend.series(session).add("Nr2", datetime(2024, 2, 5))
+
+        players = backend.players(session)
+        players.add("P1")
+        players.add("P2")
+        players.add("P3")
+        players.add("P4")
+        players.add("P5", remarks="rem")
+        players.add("P6")
+        players.add("P7", active=False)
+
+        tables = backend.tables(session)
+        tables.add(1, 2, 4, 6, 7)
+        tables.add(1, 1, 3, 5)
+        tables.add(2, 1, 3, 4, 7)
+        tables.add(2, 2, 5, 6)
+
+        results = backend.results(session)
+        results.add(1, 6, 50, 7, 3)
+        results.add(1, 3, 450, 5, 1)
+        results.add(1, 4, 250, 2, 2)
+        results.add(1, 1, 100, 3, 2)
+        results.add(1, 5, 700, 3, 1)
+        results.add(2, 1, 500, 1, 2)
+        results.add(1, 2, 200, 3, 4)
+        results.add(1, 7, 350, 2, 1)
+        results.add(2, 7, 200, 4, 2)
+        results.add(2, 2, 300, 4, 5)
+        results.add(2, 3, 730, 9, 4)
+        results.add(2, 5, 440, 5, 1)
+        results.add(2, 6, 240, 2, 0)
+        results.add(2, 4, 100, 2, 0)
+
+    return backend
+
+
+def test_evaluate_results(backend: Backend):
+    with backend.get_session() as session:
+        result = evaluate_results(backend, session, None)
+
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 14
+    assert np.all(result["won_points"] >= 0)
+    assert np.all(np.remainder(result["won_points"], 50) == 0)
+    assert np.all(result["lost_points"] <= 0)
+    assert np.all(np.remainder(result["lost_points"], 50) == 0)
+
+
+def test_evaluate_results_opponents_lost(backend: Backend):
+    with backend.get_session() as session:
+        result = evaluate_results(backend, session, 1)
+
+    assert result.loc[(1, 2), "table_size"] == 4
+    assert result.loc[(1, 2), "opponents_lost"] == 6
+    assert result.loc[(1, 2), "opponents_lost_points"] == 6 * 30
+
+    assert result.loc[(1, 1), "table_size"] == 3
+    assert result.loc[(1, 1), "opponents_lost"] == 2
+    assert result.loc[(1, 1), "opponents_lost_points"] == 2 * 40
+    assert result.loc[(1, 1), "score"] == 100 + 3 * 50 - 2 * 50 + 2 * 40
+
+
+def test_evaluate_results_unseated_player(backend: Backend):
+    with backend.get_session() as session:
+        backend.players(session).add("P8")
+        backend.results(session).add(1, 8, 100, 1, 1)
+
+        with pytest.raises(ValueError):
+            evaluate_results(backend, session, 1)
+
+
+def test_evaluate_results_total(backend: Backend):
+    with backend.get_session() as session:
+        series_evaluation = evaluate_results(backend, session, None)
+        result = evaluate_results_total(backend, session, series_evaluation)
+
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 7
+    assert np.all(result["won_points"] >= 0)
+    assert np.all(result["lost_points"] <= 0)
+    assert result.loc[5, "player_name"] == "P5"
+    assert result.loc[1, "score"] == series_evaluation.xs(1, level="player_id")["score"].sum()
+
+
+def test_evaluate_results_query_count(backend: Backend):
+    statements = []
+    event.listen(backend.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    with backend.get_session() as session:
+        context = EvaluationContext.load(backend, session)
+        series_evaluation = evaluate_results(backend, session, None, context, use_cache=False)
+        evaluate_results_total(backend, session, series_evaluation, context)
+
+    # each lookup of the seat indexes validates them against the data version
+    assert len([s for s in statements if "dataversion" not in s]) == 5
+    assert len(statements) == 8
+
+
+def test_evaluate_results_cache(backend: Backend):
+    with backend.get_session() as session:
+        first = evaluate_results(backend, session, None)
+        assert set(backend.evaluations(session).get_many([1, 2], evaluation_cache_key())) == {1, 2}
+
+        pd.testing.assert_frame_equal(evaluate_results(backend, session, None), first)
+
+        backend.results(session).update(2, 4, points=1000)
+        assert set(backend.evaluations(session).get_many([1, 2], evaluation_cache_key())) == {1}
+
+        second = evaluate_results(backend, session, None)
+        assert second.loc[(2, 4), "score"] == first.loc[(2, 4), "score"] + 900
+        pd.testing.assert_frame_equal(second.loc[[1]], first.loc[[1]])
+
+        backend.players(session).update(5, name="new")
+        assert not backend.evaluations(session).get_many([1, 2], evaluation_cache_key())
+        assert evaluate_results(backend, session, 1).loc[(1, 5), "player_name"] == "new"
+
+
+def test_evaluate_results_result_cache(backend: Backend):
+    with backend.get_session() as session:
+        first = evaluate_results(backend, session, None)
+        version = backend.data_version
+        assert len(backend.result_cache) == 1
+
+        first.loc[(1, 1), "score"] = -1
+        cached = evaluate_results(backend, session, None)
+        assert backend.result_cache.hits == 1
+        assert cached.loc[(1, 1), "score"] != -1
+
+        backend.results(session).update(2, 4, points=1000)
+        assert backend.data_version == version + 1
+        assert len(backend.result_cache) == 0
+
+        second = evaluate_results(backend, session, None)
+        assert second.loc[(2, 4), "score"] == cached.loc[(2, 4), "score"] + 900
+
+        report_content(backend, session)
+        report_content(backend, session)
+        assert backend.data_version == version + 1
+        assert backend.result_cache.hits == 3
+
+        backend.series(session).update(1, name="Renamed")
+        assert backend.data_version == version + 2
+        assert "Renamed" in report_content(backend, session)
+
+
+def test_evaluate_results_result_cache_other_backend(backend: Backend):
+    other = Backend(backend.engine.url.render_as_string(hide_password=False))
+
+    with backend.get_session() as session:
+        first = evaluate_results(backend, session, None)
+
+    with other.get_session() as session:
+        other.results(session).update(2, 4, points=1000)
+
+    with backend.get_session() as session:
+        second = evaluate_results(backend, session, None)
+
+    assert backend.data_version == other.data_version
+    assert second.loc[(2, 4), "score"] == first.loc[(2, 4), "score"] + 900
+
+
+def test_evaluate_results_parallel(backend: Backend):
+    with backend.get_session() as session:
+        sequential = evaluate_results(backend, session, None, use_cache=False)
+        parallel = evaluate_results(backend, session, None, use_cache=False, jobs=2)
+
+    pd.testing.assert_frame_equal(parallel, sequential)
+
+
+def test_evaluate_results_parallel_memory_database():
+    backend = Backend("sqlite://")
+
+    with backend.get_session() as session:
+        backend.players(session).add_many([dict(name=f"P{i}") for i in range(1, 5)])
+        backend.series(session).add_many([dict(name=f"S{i}", date=datetime(2024, 1, i)) for i in range(1, 3)])
+        backend.tables(session).add_many([dict(series_id=i, player_ids=[1, 2, 3, 4]) for i in range(1, 3)])
+        backend.results(session).add_many(
+            [dict(series_id=s, player_id=p, points=p, won=1, lost=1) for s in range(1, 3) for p in range(1, 5)]
+        )
+
+        with pytest.raises(ValueError, match="In-memory databases"):
+            evaluate_results(backend, session, None, use_cache=False, jobs=2)
+
+
+def test_hook_profiler(backend: Backend):
+    from pyskat.plugins import evaluation
+    from pyskat.plugins.profiling import HookProfiler
+
+    with backend.get_session() as session:
+        with HookProfiler() as profiler:
+            evaluate_results(backend, session, None, use_cache=False)
+
+    df = profiler.to_frame()
+    stats = df.loc[("evaluate_results_main", "pyskat.plugins.evaluation", "evaluate_points")]
+    assert stats["calls"] == 1
+    assert stats["rows"] == 14
+    assert stats["wall_time"] > 0
+
+    impls = plugin_manager.hook.evaluate_results_main.get_hookimpls()
+    assert [i.function for i in impls] == [evaluation.evaluate_points]
+
+    with backend.get_session() as session:
+        with HookProfiler() as profiler:
+            report_content(backend, session, use_cache=False)
+
+    df = profiler.to_frame()
+    assert df.loc[("plot_results", "pyskat.plugins.plots", "plot_points_sources"), "calls"] == 1
+    assert df.loc[("evaluate_results_total", "pyskat.plugins.evaluation", "total_player_names"), "rows"] == 7
+    assert profiler.to_dict()["hooks"]
+
+    with backend.get_session() as session:
+        results = evaluate_results(backend, session, None, use_cache=False)
+        with HookProfiler() as profiler:
+            evaluate_results_total(backend, session, results)
+
+    impl_calls = profiler.to_frame().loc["evaluate_results_total", "calls"]
+    assert impl_calls.tolist() == [1] * len(plugin_manager.hook.evaluate_results_total.get_hookimpls())
+    assert len(impl_calls) > 1
+    assert profiler.hook_stats["evaluate_results_total"].calls == 1
+
+
+def test_evaluate_results_compact(backend: Backend):
+    with backend.get_session() as session:
+        full = evaluate_results(backend, session, None, use_cache=False)
+        compact = evaluate_results(backend, session, None, use_cache=False, compact=True)
+
+    assert compact["score"].dtype == "int32"
+    assert compact["table_id"].dtype == "Int32"
+    assert isinstance(compact["player_name"].dtype, pd.CategoricalDtype)
+    assert compact.memory_usage(deep=True).sum() < full.memory_usage(deep=True).sum()
+    pd.testing.assert_frame_equal(compact.astype(full.dtypes.to_dict()), full)
+
+
+def test_evaluate_results_compact_cache(backend: Backend):
+    with backend.get_session() as session:
+        first = evaluate_results(backend, session, None, compact=True)
+        stored = backend.evaluations(session).get_many([1, 2], evaluation_cache_key(compact=True))
+        assert set(stored) == {1, 2}
+        assert backend.evaluations(session).get_many([1, 2], evaluation_cache_key()) == {}
+
+        backend.result_cache.clear()
+        second = evaluate_results(backend, session, None, compact=True)
+
+    pd.testing.assert_frame_equal(second, first)
+    pd.testing.assert_frame_equal(stored[1], first.loc[[1]], check_categorical=False)
+
+
+def test_evaluate_results_total_compact(backend: Backend):
+    with backend.get_session() as session:
+        full = evaluate_results_total(backend, session, evaluate_results(backend, session, None))
+        compact = evaluate_results_total(backend, session, evaluate_results(backend, session, None, compact=True))
+        streaming = evaluate_results_total_streaming(backend, session, chunk_size=1, compact=True)
+
+    assert isinstance(compact["player_name"].dtype, pd.CategoricalDtype)
+    assert isinstance(streaming["player_name"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(compact.astype(full.dtypes.to_dict()), full)
+    pd.testing.assert_frame_equal(streaming.astype(full.dtypes.to_dict()), full)
+
+
+def test_evaluate_results_total_streaming(backend: Backend):
+    with backend.get_session() as session:
+        expected = evaluate_results_total(backend, session, evaluate_results(backend, session, None))
+        result = evaluate_results_total_streaming(backend, session, chunk_size=1)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_standings_persisted(backend: Backend, monkeypatch):
+    def expected_totals(session):
+        return evaluate_results_total(backend, session, evaluate_results(backend, session, None, use_cache=False))
+
+    with backend.get_session() as session:
+        pd.testing.assert_frame_equal(Standings(backend).update(session), expected_totals(session))
+
+        with monkeypatch.context() as m:
+            m.setattr("pyskat.plugins.evaluation.evaluate_results", None)
+            standings = Standings(backend)
+            pd.testing.assert_frame_equal(standings.update(session), expected_totals(session))
+            assert standings.series_ids == {1, 2}
+
+        backend.results(session).update(1, 2, points=500)
+        totals = Standings(backend).update(session)
+        assert totals.loc[2, "points"] == expected_totals(session).loc[2, "points"]
+        pd.testing.assert_frame_equal(totals, expected_totals(session))
+
+        backend.results(session).clear_for_series(2)
+        standings = Standings(backend)
+        pd.testing.assert_frame_equal(standings.update(session), expected_totals(session), check_like=True)
+        assert standings.series_ids == {1}
+
+
+def test_evaluate_results_columns(backend: Backend):
+    from pyskat.plugins.profiling import HookProfiler
+
+    with backend.get_session() as session:
+        full = evaluate_results(backend, session, None, use_cache=False)
+
+        result = evaluate_results(backend, session, None, use_cache=False, columns=["score"])
+        assert "score" in result.columns
+        assert "player_name" not in result.columns
+        pd.testing.assert_series_equal(result["score"], full["score"])
+
+        with HookProfiler() as profiler:
+            result = evaluate_results(backend, session, None, use_cache=False, columns=["player_name"])
+        assert list(profiler.to_frame().index.get_level_values("function")) == ["add_player_names"]
+        pd.testing.assert_series_equal(result["player_name"], full["player_name"])
+
+
+def test_evaluate_results_threads(backend: Backend):
+    with backend.get_session() as session:
+        sequential = evaluate_results(backend, session, None, use_cache=False)
+        threaded = evaluate_results(backend, session, None, use_cache=False, threads=2)
+
+    pd.testing.assert_frame_equal(threaded, sequential)
+
+
+def test_evaluate_results_threads_keep_session_on_calling_thread(backend: Backend):
+    import threading
+    from types import SimpleNamespace
+    from pyskat.plugins.manager import hookimpl
+
+    threads = {}
+
+    @hookimpl(specname="evaluate_results_revise")
+    def with_session(session, results):
+        threads["session"] = threading.get_ident()
+
+    @hookimpl(specname="evaluate_results_revise")
+    def without_session(results):
+        threads["results"] = threading.get_ident()
+
+    plugin = SimpleNamespace(with_session=with_session, without_session=without_session)
+    plugin_manager.register(plugin)
+    try:
+        with backend.get_session() as session:
+            evaluate_results(backend, session, None, use_cache=False, threads=2)
+    finally:
+        plugin_manager.unregister(plugin)
+
+    assert threads["session"] == threading.get_ident()
+    assert threads["results"] != threading.get_ident()
+
+
+def test_evaluate_results_wrapper(backend: Backend):
+    from types import SimpleNamespace
+    from pyskat.plugins.manager import hookimpl
+
+    @hookimpl(specname="evaluate_results_main", wrapper=True)
+    def add_bonus(results):
+        hook_results = yield
+        return [*hook_results, pd.Series(1, index=results.index, name="bonus")]
+
+    plugin = SimpleNamespace(add_bonus=add_bonus)
+    plugin_manager.register(plugin)
+    try:
+        with backend.get_session() as session:
+            result = evaluate_results(backend, session, None, use_cache=False, threads=2)
+    finally:
+        plugin_manager.unregister(plugin)
+
+    assert (result["bonus"] == 1).all()
+    assert "score" in result.columns
+
+
+def test_evaluate_results_sql_engine(backend: Backend):
+    with backend.get_session() as session:
+        expected = evaluate_results(backend, session, None, use_cache=False)
+        pd.testing.assert_frame_equal(evaluate_results(backend, session, None, engine="sql"), expected)
+        pd.testing.assert_frame_equal(evaluate_results_sql(backend, session, [2]), expected.loc[[2]])
+
+        expected_total = evaluate_results_total(backend, session, expected)
+        pd.testing.assert_frame_equal(evaluate_results_total_sql(backend, session), expected_total)
+
+        backend.tables(session).remove(1)
+        with pytest.raises(ValueError):
+            evaluate_results_sql(backend, session, 1)
+        with pytest.raises(ValueError):
+            evaluate_results_total_sql(backend, session)
+
+
+@pytest.mark.parametrize("evaluate", [evaluate_results, evaluate_results_sql])
+def test_evaluate_results_missing_opponent_result(backend: Backend, evaluate):
+    with backend.get_session() as session:
+        backend.results(session).remove(1, 6)
+
+        with pytest.raises(ValueError, match="results"):
+            evaluate(backend, session, 1)
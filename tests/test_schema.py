@@ -0,0 +1,24 @@
+import sqlite3
+
+from sqlalchemy import inspect
+
+from pyskat.backend import Backend
+
+
+def test_indexes_created_on_existing_database(tmp_path):
+    path = tmp_path / "db.sqlite"
+    Backend(f"sqlite:///{path}").engine.dispose()
+
+    with sqlite3.connect(path) as connection:
+        indexes = connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_%'"
+        ).fetchall()
+        for (name,) in indexes:
+            connection.execute(f"DROP INDEX {name}")
+
+    backend = Backend(f"sqlite:///{path}")
+    inspector = inspect(backend.engine)
+
+    assert {i["name"] for i in inspector.get_indexes("result")} == {"ix_result_player_id_series_id"}
+    assert {i["name"] for i in inspector.get_indexes("table")} == {"ix_table_series_id"}
+    assert {i["name"] for i in inspector.get_indexes("tableplayerlink")} == {"ix_tableplayerlink_player_id_table_id"}
@@ -0,0 +1,53 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from pyskat.backend import Backend
+from pyskat.backend.async_backend import AsyncBackend
+from pyskat.wui.scoreboard import create_scoreboard_app
+
+
+def request(app, path: str, method: str = "GET") -> tuple[int, bytes]:
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    async def run():
+        await app({"type": "http", "method": method, "path": path}, receive, send)
+
+    asyncio.run(run())
+    return messages[0]["status"], b"".join(m.get("body", b"") for m in messages[1:])
+
+
+def test_scoreboard(tmp_path):
+    url = f"sqlite:///{tmp_path / 'db.sqlite'}"
+    backend = Backend(url)
+
+    with backend.get_session() as session:
+        backend.players(session).add_many([dict(name=f"P{i}") for i in range(1, 5)])
+        backend.series(session).add("S1", datetime(2024, 1, 1))
+        backend.tables(session).add(1, 1, 2, 3, 4)
+        backend.results(session).add_many(
+            [dict(series_id=1, player_id=i, points=10 * i, won=1, lost=0) for i in range(1, 5)]
+        )
+
+    app = create_scoreboard_app(AsyncBackend(url))
+
+    status, body = request(app, "/totals.json")
+    assert status == 200
+    assert [r["player_id"] for r in json.loads(body)] == [4, 3, 2, 1]
+
+    status, body = request(app, "/")
+    assert status == 200
+    assert b"P4" in body
+
+    assert request(app, "/missing")[0] == 404
+    assert request(app, "/", "POST")[0] == 405
@@ -0,0 +1,112 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from pyskat.backend import Backend
+from pyskat.backend.seat_index import SeatIndex
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    with backend.get_session() as session:
+        backend.players(session).add_many([dict(name=f"P{i}") for i in range(1, 9)])
+        backend.series(session).add_many([dict(name=f"S{i}", date=datetime(2024, 1, i)) for i in range(1, 4)])
+        backend.tables(session).add_many(
+            [
+                dict(series_id=1, player_ids=[1, 2, 3, 4]),
+                dict(series_id=1, player_ids=[5, 6, 7]),
+                dict(series_id=2, player_ids=[8, 7, 6, 5]),
+            ]
+        )
+        backend.results(session).add_many(
+            [dict(series_id=1, player_id=i, points=i, won=1, lost=1) for i in range(1, 9)]
+        )
+
+    return backend
+
+
+def test_seat_index_lookups():
+    index = SeatIndex.from_links(1, [10, 11, 12], [11, 10, 10, 11, 10, 11], [4, 1, 2, 3, 3, 5])
+
+    assert index.table_of([1, 3, 5, 9]).tolist() == [10, 10, 11, -1]
+    assert index.size_of([10, 11, 12, 13]).tolist() == [3, 3, 0, 0]
+    assert index.players_at(11) == [3, 4, 5]
+    assert index.table_players() == {10: [1, 2, 3], 11: [3, 4, 5], 12: []}
+    assert index.duplicates().tolist() == [3]
+
+    empty = SeatIndex.from_links(2, [], [], [])
+    assert empty.table_of([1]).tolist() == [-1]
+
+
+def test_seat_index_cache(backend: Backend):
+    statements = []
+    event.listen(
+        backend.engine,
+        "before_cursor_execute",
+        lambda *args: "dataversion" not in args[2] and statements.append(args[2]),
+    )
+
+    with backend.get_session() as session:
+        tables = backend.tables(session)
+        indexes = tables.seat_indexes([1, 2, 3])
+        assert indexes[1].table_players() == {1: [1, 2, 3, 4], 2: [5, 6, 7]}
+        assert indexes[2].table_of([5, 1]).tolist() == [3, -1]
+        assert indexes[3].table_players() == {}
+        assert len(statements) == 1
+
+        assert tables.seat_index(2) is indexes[2]
+        assert tables.get_table_with_player(1, 6).id == 2
+        assert tables.sizes([1, 2]).to_dict() == {1: 4, 2: 3, 3: 4}
+        assert len(statements) == 2
+
+        with pytest.raises(KeyError):
+            tables.table_id_of(1, 8)
+
+        tables.replace_for_series(1, [[1, 2, 3], [4, 5, 6, 7]])
+        assert 1 not in backend.seat_indexes and 2 in backend.seat_indexes
+        assert tables.seat_index(1).table_of([4, 8]).tolist() == [5, -1]
+        assert tables.seat_index(2) is indexes[2]
+
+        assert backend.results(session).unseated_player_ids(1) == [8]
+        assert backend.results(session).get_opponents_lost(1, 4) == 3
+
+
+def test_seat_index_not_invalidated_on_rollback(backend: Backend):
+    with backend.get_session() as session:
+        backend.tables(session).seat_indexes([1, 2])
+        backend.tables(session)._delete_for_series(1)
+        session.rollback()
+
+        assert 1 in backend.seat_indexes
+        assert backend.tables(session).seat_index(1).size_of([1, 2]).tolist() == [4, 3]
+
+
+def test_seat_index_modified_by_other_backend(backend: Backend, tmp_path):
+    from pyskat.plugins import evaluate_results
+
+    url = f"sqlite:///{tmp_path / 'db.sqlite'}"
+    other = Backend(url)
+
+    with backend.get_session() as session:
+        backend.results(session).remove(1, 8)
+        before = evaluate_results(backend, session, 1)
+        assert backend.tables(session).seat_index(1).table_of([4]).tolist() == [1]
+
+    with other.get_session() as session:
+        other.tables(session).replace_for_series(1, [[1, 2, 3], [4, 5, 6, 7]])
+
+    with backend.get_session() as session:
+        assert backend.tables(session).seat_index(1).table_of([4]).tolist() == [5]
+        uncached = evaluate_results(backend, session, 1, use_cache=False)
+        cached = evaluate_results(backend, session, 1)
+
+    fresh = Backend(url)
+    with fresh.get_session() as session:
+        expected = evaluate_results(fresh, session, 1, use_cache=False)
+
+    assert uncached["opponents_lost"].tolist() != before["opponents_lost"].tolist()
+    assert uncached["opponents_lost"].tolist() == expected["opponents_lost"].tolist()
+    assert cached["opponents_lost"].tolist() == expected["opponents_lost"].tolist()
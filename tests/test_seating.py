@@ -0,0 +1,190 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyskat.backend import Backend
+from pyskat.backend.seating import (
+    SeatingObjectives,
+    apart_matrix,
+    co_seating_counts,
+    min_repeats_seating,
+    repeat_pairings,
+    score_seatings,
+    seat_players,
+    seat_rounds,
+    swiss_seating,
+    table_sizes,
+)
+
+
+def test_table_sizes():
+    assert table_sizes(12).tolist() == [4, 4, 4]
+    assert table_sizes(13).tolist() == [4, 3, 3, 3]
+    assert table_sizes(7).tolist() == [4, 3]
+
+    with pytest.raises(ValueError):
+        table_sizes(5)
+
+
+def test_co_seating_counts():
+    seating = pd.DataFrame(dict(table_id=[1, 1, 1, 2, 2, 2], player_id=[1, 2, 3, 1, 2, 4]))
+    counts = co_seating_counts(seating, np.array([1, 2, 3]))
+
+    assert counts.tolist() == [[0, 2, 1], [2, 0, 1], [1, 1, 0]]
+
+
+def test_min_repeats_seating():
+    # all players of each group of four sat together before
+    seating = pd.DataFrame(dict(table_id=np.repeat(np.arange(25), 4), player_id=np.arange(100)))
+    counts = co_seating_counts(seating, np.arange(100))
+    sizes = table_sizes(100)
+
+    order = min_repeats_seating(counts, sizes, np.random.default_rng(0))
+
+    assert sorted(order.tolist()) == list(range(100))
+    assert repeat_pairings(np.arange(100), sizes, counts) == 150
+    assert repeat_pairings(order, sizes, counts) == 0
+
+
+def test_shuffle_min_repeats(tmp_path):
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    backend.fake_data(16, 2, fast=True, seed=0)
+
+    with backend.get_session() as session:
+        backend.tables(session).shuffle_players_for_series(2, strategy="min-repeats")
+        seating = backend.tables(session).seating()
+
+    assert seating.loc[2].groupby("table_id").size().tolist() == [4, 4, 4, 4]
+
+    previous = seating.loc[1].groupby("table_id").groups.values()
+    new = seating.loc[2].groupby("table_id").groups.values()
+    assert all(len(set(p) & set(n)) <= 1 for p in previous for n in new)
+
+
+def test_score_seatings():
+    player_ids = np.arange(1, 8)
+    seating = pd.DataFrame(dict(table_id=[1, 1, 1, 1, 2, 2, 2], player_id=player_ids))
+    counts = co_seating_counts(seating, player_ids)
+    apart = apart_matrix(player_ids, [(1, 5), (6, 7), (1, 99)])
+    strengths = np.array([1.0, 1, 1, 1, 3, 3, 3])
+    sizes = table_sizes(7)
+
+    orders = np.array([np.arange(7), [4, 0, 2, 3, 1, 5, 6]])
+    scores = score_seatings(orders, sizes, SeatingObjectives(balance=2.0), counts, strengths, apart)
+
+    assert scores["repeats"].tolist() == [repeat_pairings(o, sizes, counts) for o in orders] == [9, 4]
+    assert scores["apart"].tolist() == [1, 2]
+    assert scores["balance"].tolist() == pytest.approx([1.0, 5 / 12])
+    assert scores["total"].tolist() == pytest.approx([9 + 2.0 + 100, 4 + 10 / 12 + 200])
+
+
+def test_seat_players_candidates():
+    player_ids = np.arange(1, 41)
+    seating = pd.DataFrame(dict(table_id=np.repeat(np.arange(10), 4), player_id=player_ids))
+    apart = [(1, 5), (2, 6)]
+
+    tables, score = seat_players(
+        player_ids, "candidates", seating, np.random.default_rng(1), apart=apart, candidates=2000
+    )
+    _, random_score = seat_players(player_ids, "random", seating, np.random.default_rng(1), apart=apart)
+    same_tables, same_score = seat_players(
+        player_ids, "candidates", seating, np.random.default_rng(1), apart=apart, candidates=2000
+    )
+
+    assert score.total <= random_score.total
+    assert score.apart == 0
+    assert same_score == score
+    assert all((t == s).all() for t, s in zip(tables, same_tables))
+
+
+def test_swiss_seating():
+    strengths = np.array([5.0, 1, 7, 3, 8, 2, 6, 4])
+    sizes = table_sizes(8)
+
+    order = swiss_seating(strengths, np.zeros((8, 8)), sizes, np.random.default_rng(0))
+    assert set(order[:4].tolist()) == {0, 2, 4, 6}
+
+    # the four strongest sat together before, so two of them swap to the other table
+    counts = np.zeros((8, 8), dtype=int)
+    counts[np.ix_([0, 2, 4, 6], [0, 2, 4, 6])] = 1
+    np.fill_diagonal(counts, 0)
+
+    order = swiss_seating(strengths, counts, sizes, np.random.default_rng(0))
+    assert repeat_pairings(order, sizes, counts) == 2
+
+
+def test_seat_rounds():
+    player_ids = np.arange(1, 17)
+    rounds = seat_rounds(player_ids, 2, "min-repeats", None, np.random.default_rng(0))
+
+    first, second = ([set(t.tolist()) for t in tables] for tables, _ in rounds)
+    assert all(len(a & b) <= 1 for a in first for b in second)
+    assert [score.repeats for _, score in rounds] == [0, 0]
+
+
+def test_seat_rounds_swiss_avoids_rematches():
+    player_ids = np.arange(1, 41)
+    strengths = pd.Series(np.random.default_rng(5).normal(size=40), index=player_ids)
+
+    def repeats(strategy: str) -> list[int]:
+        rounds = seat_rounds(player_ids, 4, strategy, None, np.random.default_rng(0), strengths=strengths)
+        return [score.repeats for _, score in rounds]
+
+    swiss = repeats("swiss")
+    assert all(s <= r for s, r in zip(swiss, repeats("random")))
+
+
+def test_schedule_rounds(tmp_path):
+    from pyskat.plugins import Standings
+
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    backend.fake_data(12, 2, fast=True, seed=0)
+
+    with backend.get_session() as session:
+        standings = Standings(backend)
+        totals = standings.update(session)
+        assert standings.series_ids == {1, 2}
+
+        scores = backend.tables(session).schedule_rounds(
+            [dict(name="Round 3", date=datetime(2024, 1, 3)), dict(name="Round 4", date=datetime(2024, 1, 4))],
+            strengths=totals["score"],
+            seed=0,
+        )
+        assert list(scores) == [3, 4]
+
+        seating = backend.tables(session).seating()
+        ranked = totals["score"].sort_values(ascending=False).index
+        first_table = seating.loc[3].groupby("table_id").groups
+        top = set(first_table[min(first_table)])
+        assert len(top & set(ranked[:8])) == 4
+
+        backend.results(session).add_many(
+            [dict(series_id=3, player_id=p, points=10, won=1, lost=0) for p in range(1, 13)]
+        )
+        totals = standings.update(session)
+        assert standings.series_ids == {1, 2, 3}
+        assert (totals["points"] == backend.results(session).to_pandas().groupby("player_id")["points"].sum()).all()
+
+
+def test_schedule_command(tmp_path):
+    from click.testing import CliRunner
+    from pyskat.cli import main
+
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    backend.fake_data(12, 2, fast=True, seed=0)
+    args = ["-d", str(tmp_path / "db.sqlite"), "series", "--current-series-file", str(tmp_path / "current")]
+
+    result = CliRunner().invoke(main, [*args, "schedule", "--seed", "0"])
+    assert result.exit_code == 0, result.output
+
+    with backend.get_session() as session:
+        assert backend.series(session).count() == 3
+        assert backend.series(session).get(3).name == "Round 3"
+        backend.results(session).remove(1, 1)
+
+    result = CliRunner().invoke(main, [*args, "schedule"])
+    assert result.exit_code == 1
+    assert "Can not rank the players by their standings" in result.output
+    assert "of series 1" in result.output
@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from pyskat.backend import Backend
+from pyskat.backend.snapshot import SnapshotBackend, export_snapshot, import_snapshot
+from pyskat.plugins import evaluate_results, evaluate_results_total
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    backend.fake_data(13, 3, fast=True, seed=1)
+    return backend
+
+
+@pytest.mark.parametrize("format", ["parquet", "feather"])
+def test_snapshot_round_trip(backend: Backend, tmp_path, format):
+    with backend.get_session() as session:
+        counts = export_snapshot(session, tmp_path / "snapshot", format)
+        assert counts == dict(players=13, series=3, tables=12, links=39, results=39)
+        expected = evaluate_results(backend, session, None, use_cache=False)
+        expected_players = backend.players(session).to_pandas()
+
+    imported = Backend(f"sqlite:///{tmp_path / 'imported.sqlite'}")
+    with imported.get_session() as session:
+        import_snapshot(session, tmp_path / "snapshot")
+        session.commit()
+
+        pd.testing.assert_frame_equal(evaluate_results(imported, session, None, use_cache=False), expected)
+
+        with pytest.raises(ValueError):
+            import_snapshot(session, tmp_path / "snapshot")
+
+        import_snapshot(session, tmp_path / "snapshot", replace=True)
+        pd.testing.assert_frame_equal(imported.players(session).to_pandas(), expected_players)
+
+
+def test_snapshot_backend(backend: Backend, tmp_path):
+    with backend.get_session() as session:
+        export_snapshot(session, tmp_path / "snapshot")
+        expected = evaluate_results(backend, session, [1, 3], use_cache=False)
+        expected_total = evaluate_results_total(backend, session, expected)
+
+    snapshot = SnapshotBackend(tmp_path / "snapshot")
+    with snapshot.get_session() as session:
+        evaluated = evaluate_results(snapshot, session, [1, 3])
+        pd.testing.assert_frame_equal(evaluated, expected)
+        pd.testing.assert_frame_equal(evaluate_results_total(snapshot, session, evaluated), expected_total)
+
+        with backend.get_session() as backend_session:
+            assert snapshot.players(session).get(2).name == backend.players(backend_session).get(2).name
+        with pytest.raises(KeyError):
+            snapshot.series(session).get(99)
+
+
+@pytest.mark.parametrize("options", [["-j", "2"], ["-e", "sql"]])
+def test_snapshot_cli_rejects_database_options(backend: Backend, tmp_path, options):
+    from click.testing import CliRunner
+    from pyskat.cli import main
+
+    with backend.get_session() as session:
+        export_snapshot(session, tmp_path / "snapshot")
+
+    result = CliRunner().invoke(main, ["--snapshot", str(tmp_path / "snapshot"), "evaluate", "show", *options])
+    assert result.exit_code == 2
+    assert "Snapshots can" in result.output
+
+
+@pytest.mark.parametrize("command", [["series", "schedule"], ["wui", "scoreboard"], ["player", "list"]])
+def test_snapshot_cli_rejects_database_commands(backend: Backend, tmp_path, command):
+    from click.testing import CliRunner
+    from pyskat.cli import main
+
+    with backend.get_session() as session:
+        export_snapshot(session, tmp_path / "snapshot")
+
+    result = CliRunner().invoke(main, ["--snapshot", str(tmp_path / "snapshot"), *command])
+    assert result.exit_code == 2
+    assert f"The '{command[0]}' command needs a database" in result.output
+
+    result = CliRunner().invoke(main, ["--snapshot", str(tmp_path / "snapshot"), "evaluate", "total"])
+    assert result.exit_code == 0, result.output
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from pyskat.backend import Backend
+from pyskat.wui.app import create_app
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = Backend(f"sqlite:///{tmp_path / 'db.sqlite'}")
+
+    with backend.get_session() as session:
+        backend.players(session).add_many([dict(name=f"P{i}") for i in range(1, 201)])
+        backend.series(session).add("S1", datetime(2024, 1, 1))
+        backend.tables(session).add_many(
+            [dict(series_id=1, player_ids=list(range(i, i + 4))) for i in range(1, 201, 4)]
+        )
+        backend.results(session).add_many(
+            [dict(series_id=1, player_id=i, points=i, won=1, lost=1) for i in range(1, 201)]
+        )
+
+    return backend
+
+
+@pytest.fixture
+def client(backend: Backend, tmp_path):
+    app = create_app(backend, tmp_path)
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+@pytest.mark.parametrize("page", ["/tables/1", "/results/1"])
+def test_series_page_query_count(backend: Backend, client, page: str):
+    statements = []
+    event.listen(backend.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    response = client.get(page)
+
+    assert response.status_code == 200
+    assert b"P200" in response.data
+    assert len([s for s in statements if s.lstrip().startswith("SELECT") and "dataversion" not in s]) == 5
+
+
+def test_check_tables(backend: Backend, client):
+    with backend.get_session() as session:
+        backend.tables(session).remove(50)
+
+    response = client.get("/tables/check/1", follow_redirects=True)
+
+    assert response.status_code == 200
+    assert b"P200 (200) has a result, but is not seated at any table." in response.data
+
+
+def test_config_from_env(backend: Backend, tmp_path, monkeypatch):
+    monkeypatch.setenv("PYSKAT_EVALUATION_CACHE_SIZE", "7")
+    monkeypatch.setenv("PYSKAT_POOL_TIMEOUT", "5")
+    monkeypatch.setenv("PYSKAT__THEME", "ignored")
+
+    app = create_app(backend, tmp_path)
+
+    assert app.config["EVALUATION_CACHE_SIZE"] == 7
+    assert app.config["THEME"] == "darkly"
+    assert backend.result_cache.maxsize == 7
+    assert backend.pool.timeout == 5